@@ -1,18 +1,36 @@
 """Mobile Alerts integration."""
 
+import asyncio
 import json
 import logging
 from datetime import datetime
+from ipaddress import ip_address
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DEVICE_ID, Platform
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_HOST,
+    CONF_ID,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
+from .const import (
+    CONF_GATEWAY,
+    CONF_GATEWAY_FORWARD,
+    CONF_GATEWAY_FORWARD_URL,
+    CONF_GATEWAYS,
+    DOMAIN,
+    GATEWAY_CLOUD_URL,
+)
+from .executor import FetchExecutor
+from .rate_limit import RateLimiter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +40,97 @@ PLATFORMS = [Platform.SENSOR]
 DUMP_RAW_RESPONSE_SCHEMA = vol.Schema({})
 
 
+def _ip_address(value: Any) -> str:
+    """Validate an IP address and return it in normalized form."""
+    try:
+        return str(ip_address(str(value)))
+    except ValueError as err:
+        raise vol.Invalid(f"Invalid IP address: {value}") from err
+
+
+# YAML schemas. The gateway endpoint has no authentication, so the receiver is
+# only set up with at least one allowed gateway (ID and IP address).
+GATEWAY_ENTRY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ID): vol.All(
+            cv.string,
+            vol.Upper,
+            vol.Match(r"^[0-9A-F]{12}$", msg="Gateway ID must be 12 hex digits"),
+        ),
+        vol.Required(CONF_HOST): _ip_address,
+    }
+)
+
+GATEWAY_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_GATEWAYS): vol.All(
+            cv.ensure_list,
+            [GATEWAY_ENTRY_SCHEMA],
+            vol.Length(min=1, msg="At least one gateway is required"),
+        ),
+        vol.Optional(CONF_GATEWAY_FORWARD, default=False): cv.boolean,
+        vol.Optional(CONF_GATEWAY_FORWARD_URL, default=GATEWAY_CLOUD_URL): cv.url,
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Any(
+            None,
+            vol.Schema(
+                {vol.Optional(CONF_GATEWAY): GATEWAY_SCHEMA}, extra=vol.ALLOW_EXTRA
+            ),
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def async_get_fetch_executor(hass: HomeAssistant) -> FetchExecutor:
+    """Return the fetch executor shared by all Mobile Alerts coordinators.
+
+    The executor owns the pooled HTTP session and the API quota tracker, caps
+    the number of concurrent fetches and staggers their start times.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    executor: FetchExecutor | None = domain_data.get("executor")
+    if executor is None:
+        executor = FetchExecutor()
+        domain_data["executor"] = executor
+
+        async def _async_close_session(event: Event) -> None:
+            """Close the shared session on Home Assistant shutdown."""
+            await _async_close_api_session(hass)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    return executor
+
+
+def async_get_api_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the pooled HTTP session shared by all Mobile Alerts API clients.
+
+    The session is created on first use and closed when the last config entry
+    is unloaded (or when Home Assistant shuts down).
+    """
+    return async_get_fetch_executor(hass).session
+
+
+def async_get_rate_limiter(hass: HomeAssistant) -> RateLimiter:
+    """Return the API quota tracker shared by all Mobile Alerts API clients.
+
+    The API limits calls per sensor and invalid calls per IP address, so the
+    quota must be tracked across all phone_ids and the config flow.
+    """
+    return async_get_fetch_executor(hass).rate_limiter
+
+
+async def _async_close_api_session(hass: HomeAssistant) -> None:
+    """Close the shared HTTP session if it is open."""
+    executor: FetchExecutor | None = hass.data.get(DOMAIN, {}).get("executor")
+    if executor is not None:
+        await executor.async_close()
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Mobile Alerts component from YAML configuration."""
     _LOGGER.debug("Mobile Alerts: async_setup called")
@@ -37,6 +146,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             "Mobile Alerts: YAML configuration found. "
             "Please use the UI to configure devices manually or wait for migration feature."
         )
+        if yaml_config and CONF_GATEWAY in yaml_config:
+            # Imported here: the gateway module uses the session helpers above
+            from .gateway import async_setup_gateway
+
+            async_setup_gateway(hass, yaml_config[CONF_GATEWAY])
     else:
         _LOGGER.debug("Mobile Alerts: No YAML configuration found")
 
@@ -76,7 +190,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN]["entries"].pop(entry.entry_id, None)
+        domain_data = hass.data[DOMAIN]
+        domain_data["entries"].pop(entry.entry_id, None)
+
+        # Drop the coordinator of this entry once no other entry uses it
+        coordinators_by_entry = domain_data.get("coordinators_by_entry", {})
+        coordinator = coordinators_by_entry.pop(entry.entry_id, None)
+        if (
+            coordinator is not None
+            and coordinator not in coordinators_by_entry.values()
+        ):
+            coordinators = domain_data.get("coordinators", {})
+            for phone_id, phone_coordinator in list(coordinators.items()):
+                if phone_coordinator is coordinator:
+                    coordinators.pop(phone_id)
+
+        # Close the shared session with the last entry, unless YAML-configured
+        # coordinators are still using it
+        if not domain_data["entries"] and not domain_data.get("coordinators"):
+            await _async_close_api_session(hass)
 
     return unload_ok
 
@@ -104,6 +236,9 @@ async def _register_services(hass: HomeAssistant) -> None:
         """Service: Trigger coordinator refresh and return raw API response from all entries.
 
         Returns data from all Mobile Alerts entries in a single response.
+        Entries of the same phone_id share one coordinator, so every distinct
+        coordinator is refreshed once (concurrently) and its data is reported
+        for each of its entries.
         """
         coordinators_by_entry = hass.data[DOMAIN].get("coordinators_by_entry", {})
 
@@ -113,17 +248,30 @@ async def _register_services(hass: HomeAssistant) -> None:
                 "error": "No Mobile Alerts entries found",
             }
 
-        # Trigger refresh and collect data from all entries
-        results = {}
-        for entry_id, coordinator in coordinators_by_entry.items():
-            await coordinator.async_request_refresh()
-            results[entry_id] = coordinator.data
+        # Refresh each distinct coordinator once
+        coordinators = {
+            id(coordinator): coordinator
+            for coordinator in coordinators_by_entry.values()
+        }
+        await asyncio.gather(
+            *(
+                coordinator.async_request_refresh()
+                for coordinator in coordinators.values()
+            )
+        )
+
+        # Collect data for all entries
+        results = {
+            entry_id: coordinator.data
+            for entry_id, coordinator in coordinators_by_entry.items()
+        }
 
         return {
             "success": True,
             "timestamp": datetime.now().isoformat(),
             "entries_count": len(results),
             "data": results,
+            "executor": async_get_fetch_executor(hass).as_dict(),
         }
 
     hass.services.async_register(
@@ -1,5 +1,6 @@
 """Mobile Alerts API communication module."""
 
+import asyncio
 from asyncio import timeout
 import json
 import logging
@@ -8,13 +9,89 @@ from typing import Any, Final
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a Home Assistant requirement
+    orjson = None
+
+from .column_store import NUMPY_AVAILABLE, ColumnMeasurement, ColumnStore
+from .const import (
+    API_IP_BLOCK_SECONDS,
+    API_KEEPALIVE_SECONDS,
+    API_POOL_SIZE,
+    API_RATE_LIMIT_BLOCK_SECONDS,
+    API_RATE_LIMIT_WINDOW_SECONDS,
+    API_TIMEOUT_SECONDS,
+    BATCH_CHUNK_SIZE,
+    COLUMN_STORE_MIN_DEVICES,
+    REGISTER_COALESCE_SECONDS,
+)
+from .measurement import Measurement
+from .rate_limit import RateLimiter
+
 _LOGGER: Final = logging.getLogger(__name__)
 
 
+def decode_json(body: bytes) -> Any:
+    """Decode a JSON response body straight from the raw bytes.
+
+    Uses orjson if it is installed, which parses the bytes directly, so memory
+    per poll is the body plus the parsed structure. The standard library
+    fallback decodes the bytes to a str internally and parses that, so it
+    briefly needs a second copy of the body.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON (orjson's error is
+            a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a pooled HTTP session for the Mobile Alerts API.
+
+    The connection pool is bounded and idle connections are kept alive between
+    polls, so consecutive requests reuse the DNS lookup, TCP and TLS setup.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=API_POOL_SIZE,
+        limit_per_host=API_POOL_SIZE,
+        keepalive_timeout=API_KEEPALIVE_SECONDS,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS),
+    )
+
+
 class ApiError(Exception):
     """Mobile Alerts API Error."""
 
 
+class ApiBlockedError(ApiError):
+    """The API refuses calls for a while."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            retry_after: Seconds until calls are accepted again
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ApiRateLimitedError(ApiBlockedError):
+    """Sensors are blocked for exceeding the rate limit (HTTP 429)."""
+
+
+class ApiIpBlockedError(ApiBlockedError):
+    """This IP address is blocked after too many invalid calls (HTTP 403)."""
+
+
 class MobileAlertsApi:
     """Interact with Mobile Alerts API."""
 
@@ -24,11 +101,91 @@ class MobileAlertsApi:
         "https://www.data199.com/api/pv1/device/lastmeasurement",
     )
 
-    def __init__(self, phone_id: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self,
+        phone_id: str,
+        session: aiohttp.ClientSession | None = None,
+        rate_limiter: RateLimiter | None = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        column_store_min_devices: int = COLUMN_STORE_MIN_DEVICES,
+    ) -> None:
+        """Initialize the API client.
+
+        Args:
+            phone_id: The phone ID of the Mobile Alerts app
+            session: Shared HTTP session. If omitted, the client creates and
+                owns its own session (see async_close()).
+            rate_limiter: Shared API quota tracker. Quotas apply per sensor and
+                per IP address, so all clients should share one instance.
+            chunk_size: Max. number of device IDs per batch request
+            column_store_min_devices: Min. number of devices of a batch to
+                decode it as column arrays (requires NumPy)
+        """
         self._phone_id = phone_id
         self._device_ids: list[str] = []
-        self._data: list[dict[str, Any]] | None = None
+        self._devices: list[dict[str, Any]] | None = None
+        self._index: dict[str, dict[str, Any]] = {}
+        self._measurements: dict[str, tuple[dict[str, Any], Measurement | None]] = {}
+        self._columns: ColumnStore | None = None
+        self._column_store_min_devices = column_store_min_devices
+        self._session = session
+        self._owns_session = session is None
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self._chunk_size = max(chunk_size, 1)
+        self._in_flight: dict[str, asyncio.Task[dict[str, Any] | None]] = {}
+        self._pending_registrations: dict[str, asyncio.Future[None]] = {}
+        self._registration_task: asyncio.Task[None] | None = None
+
+    @property
+    def phone_id(self) -> str:
+        """Return the phone ID of the Mobile Alerts app."""
+        return self._phone_id
+
+    @property
+    def device_ids(self) -> tuple[str, ...]:
+        """Return the IDs of the registered devices."""
+        return tuple(self._device_ids)
+
+    @property
+    def devices(self) -> list[dict[str, Any]] | None:
+        """Return the device records of the last response, None before any data.
+
+        The list is a copy: the records are shared, but changing the list does
+        not affect the deviceid index.
+        """
+        return list(self._devices) if self._devices is not None else None
+
+    @property
+    def _data(self) -> list[dict[str, Any]] | None:
+        """Return the device records of the last response."""
+        return self._devices
+
+    @_data.setter
+    def _data(self, devices: list[dict[str, Any]] | None) -> None:
+        """Store the device records and rebuild the deviceid index.
+
+        The index is rebuilt once per fetch so that get_reading() is a dict
+        lookup instead of a scan over all devices for every entity.
+        """
+        self._devices = devices
+        self._columns = None
+        self._index = {
+            device["deviceid"]: device
+            for device in devices or []
+            if device.get("deviceid")
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating an owned one if needed."""
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+            self._owns_session = True
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the HTTP session if it is owned by this client."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
 
     async def register_device(self, device_id: str) -> None:
         """Register a device and fetch its data immediately.
@@ -37,6 +194,14 @@ class MobileAlertsApi:
         its data right away. This ensures data is available as soon as the device
         is registered.
 
+        Registrations arriving within REGISTER_COALESCE_SECONDS of each other
+        (e.g. one per config entry during startup) are fetched together in a
+        single request, and every caller waits for that shared result.
+
+        A device that already has data (e.g. restored from a snapshot or
+        seeded by the config flow) is not fetched again, it is refreshed
+        with the next regular update.
+
         Args:
             device_id: The device ID to register and fetch
 
@@ -47,8 +212,44 @@ class MobileAlertsApi:
             self._device_ids.append(device_id)
             _LOGGER.debug("Device %s registered", device_id)
 
-        # Fetch this device's data immediately
-        await self._fetch_device(device_id)
+        if device_id in self._index:
+            _LOGGER.debug("Device %s already has data, skipping fetch", device_id)
+            return
+
+        future = self._pending_registrations.get(device_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_registrations[device_id] = future
+
+        if self._registration_task is None or self._registration_task.done():
+            self._registration_task = asyncio.create_task(
+                self._flush_registrations()
+            )
+
+        # Shield the shared future, so a cancelled caller does not cancel
+        # the fetch for all other waiting callers
+        await asyncio.shield(future)
+
+    async def _flush_registrations(self) -> None:
+        """Fetch all pending registrations in one request after a short delay."""
+        await asyncio.sleep(REGISTER_COALESCE_SECONDS)
+
+        pending = self._pending_registrations
+        self._pending_registrations = {}
+        self._registration_task = None
+
+        _LOGGER.debug("Fetching %d registered device(s) together", len(pending))
+        try:
+            await self._fetch_devices(list(pending))
+        except Exception as err:  # pylint: disable=broad-except
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for future in pending.values():
+            if not future.done():
+                future.set_result(None)
 
     def get_reading(self, device_id: str) -> dict[str, Any] | None:
         """Get sensor reading for a specific device.
@@ -63,18 +264,130 @@ class MobileAlertsApi:
             _LOGGER.info("No sensor data available yet")
             return None
 
-        for sensor_data in self._data:
-            if device_id == sensor_data.get("deviceid"):
-                return sensor_data
+        sensor_data = self._index.get(device_id)
+        if sensor_data is None:
+            _LOGGER.error("Device %s not found in API response", device_id)
+        return sensor_data
 
-        _LOGGER.error("Device %s not found in API response", device_id)
-        return None
+    def get_device(self, device_id: str) -> dict[str, Any] | None:
+        """Return the last device record of a device, None if there is none.
+
+        Unlike get_reading(), a missing device is not logged, e.g. for records
+        of devices that another component reports.
+        """
+        return self._index.get(device_id)
+
+    def get_measurement(
+        self, device_id: str
+    ) -> Measurement | ColumnMeasurement | None:
+        """Get the decoded measurement of a device.
+
+        Large batches are decoded as a whole into column arrays right after the
+        fetch. Otherwise the record is decoded on first access after each
+        fetch and shared by all entities of the device.
+
+        Args:
+            device_id: The device ID
+
+        Returns:
+            The decoded measurement, or None if there is no measurement data
+        """
+        record = self._index.get(device_id)
+        if record is None:
+            self._measurements.pop(device_id, None)
+            return None
+        columns = self._columns
+        if columns is not None:
+            row = columns.rows.get(device_id)
+            if row is not None and columns.records[row] is record:
+                return columns.measurement(device_id)
+        cached = self._measurements.get(device_id)
+        if cached is not None and cached[0] is record:
+            return cached[1]
+        measurement = Measurement.from_record(record)
+        self._measurements[device_id] = (record, measurement)
+        return measurement
+
+    def measurement_stamps(self) -> dict[str, tuple[Any, Any] | None]:
+        """Return the (idx, ts) of the last measurement of each registered device.
+
+        A sensor only sends a new measurement about every 7 minutes, so most
+        refreshes return the same idx and ts as before.
+
+        Returns:
+            dict mapping device ID to (idx, ts), or None if there is no data
+        """
+        stamps: dict[str, tuple[Any, Any] | None] = {}
+        for device_id in self._device_ids:
+            device = self._index.get(device_id)
+            measurement = device.get("measurement") if device else None
+            stamps[device_id] = (
+                (measurement.get("idx"), measurement.get("ts")) if measurement else None
+            )
+        return stamps
+
+    def update_device(self, device_data: dict[str, Any]) -> None:
+        """Insert or replace the record of a single device.
+
+        Used to seed data that was already fetched elsewhere (e.g. by the
+        config flow) without another API call.
+
+        Args:
+            device_data: Device record as returned by the API
+        """
+        device_id = device_data.get("deviceid")
+        devices = [d for d in self._data or [] if d.get("deviceid") != device_id]
+        devices.append(device_data)
+        self._data = devices
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return the device records of the registered devices.
+
+        Returns:
+            list of device records, e.g. to persist them across restarts
+        """
+        return [
+            self._index[device_id]
+            for device_id in self._device_ids
+            if device_id in self._index
+        ]
+
+    def restore(self, devices: list[dict[str, Any]]) -> None:
+        """Restore device records from a snapshot without an API call.
+
+        Records that are already present (fetched or seeded) are kept.
+
+        Args:
+            devices: Device records as returned by snapshot()
+        """
+        restored = {
+            device["deviceid"]: device for device in devices if device.get("deviceid")
+        }
+        # The API returned data for these devices before
+        self._rate_limiter.mark_verified(restored)
+        restored.update(self._index)
+        self._data = list(restored.values())
+
+    def _request_payload(self, device_ids: list[str]) -> dict[str, Any]:
+        """Build the request payload for the given device IDs."""
+        request_payload = {"deviceids": ",".join(device_ids)}
+        if self._phone_id and self._phone_id != "ui_devices":
+            request_payload["phoneid"] = self._phone_id
+        return request_payload
+
+    def quota(self) -> dict[str, Any]:
+        """Return the API quota left for the registered devices.
+
+        Returns:
+            dict with the invalid call budget and the calls left per device
+        """
+        return self._rate_limiter.as_dict(self._device_ids)
 
     async def fetch_data(self, is_initial: bool = False) -> dict[str, Any] | None:
         """Fetch latest measurement data from Mobile Alerts API.
 
         For regular 10-minute updates, always uses batch mode to fetch all devices
-        in a single request.
+        in as few requests as possible (see _fetch_batch).
 
         Individual device fetches happen in register_device() during setup.
 
@@ -94,41 +407,49 @@ class MobileAlertsApi:
             return {"devices": self._data}
         return None
 
-    async def _fetch_device(self, device_id: str) -> None:
-        """Fetch data for a single device during setup.
+    async def _fetch_devices(self, device_ids: list[str]) -> None:
+        """Fetch data for newly registered devices during setup.
 
-        Called from register_device() to fetch the newly registered device's data
+        Called from register_device() to fetch the newly registered devices' data
         without re-fetching all previously registered devices.
 
         Args:
-            device_id: The device ID to fetch
+            device_ids: The device IDs to fetch
 
         Raises:
             ApiError: If API communication fails
         """
-        _LOGGER.debug("Fetching initial data for device %s", device_id)
-        request_payload = {"deviceids": device_id}
-        if self._phone_id and self._phone_id != "ui_devices":
-            request_payload["phoneid"] = self._phone_id
+        _LOGGER.debug("Fetching initial data for devices %s", device_ids)
+        request_payload = self._request_payload(device_ids)
 
         response_data = await self._post_api_request(request_payload)
         if response_data:
             devices = response_data.get("devices", [])
             if devices:
-                if not self._data:
-                    self._data = []
-                # Remove old data for this device if it exists
-                self._data = [d for d in self._data if d.get("deviceid") != device_id]
-                # Add new data
-                self._data.extend(devices)
-                _LOGGER.debug("Got initial data for device %s", device_id)
-            else:
-                _LOGGER.warning("No data returned for device %s", device_id)
+                # Replace old data for these devices if it exists
+                fetched_ids = {d.get("deviceid") for d in devices}
+                self._data = [
+                    d for d in self._data or [] if d.get("deviceid") not in fetched_ids
+                ] + devices
+                _LOGGER.debug("Got initial data for devices %s", fetched_ids)
+            for device_id in device_ids:
+                if device_id not in self._index:
+                    _LOGGER.warning("No data returned for device %s", device_id)
 
     async def _fetch_batch(self) -> None:
-        """Fetch all registered devices in a single batch request.
+        """Fetch all registered devices in batch requests.
 
         This is used for regular 10-minute updates to minimize API calls.
+
+        The device IDs are split into chunks of at most chunk_size IDs, which are
+        fetched concurrently. Each chunk is merged into the device index as soon
+        as it arrives. A failed chunk only fails its own devices: they are dropped
+        from the data (entities become unavailable), except when the API blocks
+        them, in which case their last good records are kept. Only if every chunk
+        fails is the error raised.
+
+        Raises:
+            ApiError: If all chunks fail
         """
         _LOGGER.debug("Fetching data from Mobile Alerts API (batch mode)")
 
@@ -136,34 +457,76 @@ class MobileAlertsApi:
             _LOGGER.debug("No devices registered for data fetching")
             return
 
-        request_payload = {"deviceids": ",".join(self._device_ids)}
-        if self._phone_id and self._phone_id != "ui_devices":
-            request_payload["phoneid"] = self._phone_id
+        chunks = [
+            self._device_ids[i : i + self._chunk_size]
+            for i in range(0, len(self._device_ids), self._chunk_size)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        failed = [
+            (chunk, result)
+            for chunk, result in zip(chunks, results)
+            if isinstance(result, BaseException)
+        ]
+        for _, result in failed:
+            if not isinstance(result, Exception):
+                raise result
+        if failed and len(failed) == len(chunks):
+            raise failed[0][1]
+
+        for chunk, result in failed:
+            _LOGGER.warning(
+                "Fetching %d of %d devices failed: %s",
+                len(chunk),
+                len(self._device_ids),
+                result,
+            )
+            if not isinstance(result, ApiBlockedError):
+                for device_id in chunk:
+                    self._index.pop(device_id, None)
 
-        response_data = await self._post_api_request(request_payload)
-        if response_data:
-            self._data = response_data.get("devices", [])
-            if self._data:
+        self._devices = list(self._index.values()) or None
+        self._columns = None
+        if self._devices:
+            _LOGGER.debug(
+                "Successfully fetched data for %d devices",
+                len(self._devices),
+            )
+            if NUMPY_AVAILABLE and len(self._devices) >= self._column_store_min_devices:
+                self._columns = ColumnStore(self._devices)
+
+    async def _fetch_chunk(self, device_ids: list[str]) -> None:
+        """Fetch one chunk of a batch and merge it into the device index.
+
+        Devices that are not part of the response are dropped from the index.
+
+        Raises:
+            ApiError: If API communication fails
+        """
+        response_data = await self._post_api_request(self._request_payload(device_ids))
+        devices = response_data.get("devices", []) if response_data else []
+
+        for device in devices:
+            device_id = device.get("deviceid")
+            if not device_id:
+                continue
+            self._index[device_id] = device
+            # Log device details for debugging
+            measurement = device.get("measurement", {})
+            if measurement:
                 _LOGGER.debug(
-                    "Successfully fetched data for %d devices",
-                    len(self._data),
+                    "Device %s: measurement_keys=%s, data=%s",
+                    device_id,
+                    list(measurement.keys()),
+                    measurement,
                 )
-                # Log device details for debugging
-                for device in self._data:
-                    device_id = device.get("deviceid")
-                    measurement = device.get("measurement", {})
-                    if measurement:
-                        meas_keys = list(measurement.keys())
-                        _LOGGER.debug(
-                            "Device %s: measurement_keys=%s, data=%s",
-                            device_id,
-                            meas_keys,
-                            measurement,
-                        )
-            else:
-                self._data = None
-        else:
-            self._data = None
+
+        returned_ids = {device.get("deviceid") for device in devices}
+        for device_id in device_ids:
+            if device_id not in returned_ids:
+                self._index.pop(device_id, None)
 
     async def _post_api_request(
         self, request_payload: dict[str, Any]
@@ -173,6 +536,10 @@ class MobileAlertsApi:
         This is a private helper method to avoid code duplication between
         single device and batch fetches.
 
+        An identical request that is already in flight (e.g. a service-triggered
+        refresh during the regular poll) is merged into it instead of being sent
+        twice.
+
         Args:
             request_payload: The request payload (deviceids and optional phoneid)
 
@@ -182,38 +549,144 @@ class MobileAlertsApi:
         Raises:
             ApiError: If API communication fails
         """
+        request_key = json.dumps(request_payload, sort_keys=True)
+        request = self._in_flight.get(request_key)
+        if request is None:
+            request = asyncio.create_task(self._send_api_request(request_payload))
+            self._in_flight[request_key] = request
+            request.add_done_callback(
+                lambda _: self._in_flight.pop(request_key, None)
+            )
+        else:
+            _LOGGER.debug("Merging API request into identical in-flight request")
+
+        return await asyncio.shield(request)
+
+    async def _wait_for_quota(
+        self, device_ids: list[str], probe: bool = False
+    ) -> None:
+        """Wait until a request for the devices fits into the API quota.
+
+        The invalid call budget only holds back calls that can be invalid:
+        probes (device discovery) and calls with device IDs that the API has
+        not returned data for yet. Polls of verified devices go through.
+
+        Args:
+            device_ids: The device IDs of the request
+            probe: True for a call that checks user input, e.g. a phone ID
+
+        Raises:
+            ApiBlockedError: If the invalid call budget of this IP address is
+                used up and the call can be invalid
+            ApiIpBlockedError: If this IP address is blocked
+            ApiRateLimitedError: If a device is blocked for longer than one
+                rate limit window
+        """
+        if (ip_blocked_for := self._rate_limiter.ip_blocked_for()) > 0:
+            raise ApiIpBlockedError(
+                "IP address blocked by the API, request not sent", ip_blocked_for
+            )
+        if (
+            probe or self._rate_limiter.needs_invalid_call_budget(device_ids)
+        ) and (resets_in := self._rate_limiter.invalid_budget_resets_in()) > 0:
+            raise ApiBlockedError(
+                "Invalid call budget used up, request not sent", resets_in
+            )
+
+        while (delay := self._rate_limiter.delay_for(device_ids)) > 0:
+            if delay > API_RATE_LIMIT_WINDOW_SECONDS:
+                raise ApiRateLimitedError(
+                    "Devices blocked by the API, request not sent", delay
+                )
+            _LOGGER.info(
+                "Delaying API request by %.0f s to stay within the rate limit",
+                delay,
+            )
+            await asyncio.sleep(delay)
+        self._rate_limiter.acquire(device_ids)
+
+    def _raise_for_status(self, status: int, device_ids: list[str]) -> None:
+        """Raise the matching error for a non-200 response.
+
+        Blocks are also recorded in the rate limiter, so no further calls are
+        sent until the documented block window has passed.
+
+        Raises:
+            ApiRateLimitedError: On HTTP 429
+            ApiIpBlockedError: On HTTP 403
+            ApiError: On any other status
+        """
+        if status == 429:
+            self._rate_limiter.block_devices(device_ids, API_RATE_LIMIT_BLOCK_SECONDS)
+            raise ApiRateLimitedError(
+                "HTTP 429: Devices blocked by the API rate limit",
+                API_RATE_LIMIT_BLOCK_SECONDS,
+            )
+        if status == 403:
+            self._rate_limiter.block_ip(API_IP_BLOCK_SECONDS)
+            raise ApiIpBlockedError(
+                "HTTP 403: IP address blocked after invalid calls",
+                API_IP_BLOCK_SECONDS,
+            )
+        raise ApiError(f"HTTP {status}")
+
+    async def _send_api_request(
+        self, request_payload: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Send a request once the API quota allows it.
+
+        Args:
+            request_payload: The request payload (deviceids and optional phoneid)
+
+        Returns:
+            The parsed JSON response, or None if there was an error
+
+        Raises:
+            ApiError: If API communication fails
+        """
+        device_ids = [
+            device_id
+            for device_id in request_payload.get("deviceids", "").split(",")
+            if device_id
+        ]
+        await self._wait_for_quota(device_ids)
+
         headers = {"Content-Type": "application/json"}
         json_data = json.dumps(request_payload)
 
         _LOGGER.debug("API Request: %s", json_data)
 
         try:
-            async with timeout(30):
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as session:
-                    async with session.post(
-                        self.API_URL, data=json_data, headers=headers
-                    ) as response:
-                        if response.status != 200:
-                            _LOGGER.error(
-                                "API error: HTTP %s, URL: %s",
-                                response.status,
-                                self.API_URL,
-                            )
-                            raise ApiError(f"HTTP {response.status}")
-
-                        response_text = await response.text()
-                        sensor_response = json.loads(response_text)
-
-                        if not sensor_response.get("success", False):
-                            error_code = sensor_response.get("errorcode")
-                            error_msg = sensor_response.get("errormessage")
-                            _LOGGER.error("API error: %s - %s", error_code, error_msg)
-                            return None
-
-                        return sensor_response
-
+            async with timeout(API_TIMEOUT_SECONDS):
+                async with self._get_session().post(
+                    self.API_URL, data=json_data, headers=headers
+                ) as response:
+                    if response.status != 200:
+                        _LOGGER.error(
+                            "API error: HTTP %s, URL: %s",
+                            response.status,
+                            self.API_URL,
+                        )
+                        self._raise_for_status(response.status, device_ids)
+
+                    sensor_response = decode_json(await response.read())
+
+                    if not sensor_response.get("success", False):
+                        error_code = sensor_response.get("errorcode")
+                        error_msg = sensor_response.get("errormessage")
+                        _LOGGER.error("API error: %s - %s", error_code, error_msg)
+                        self._rate_limiter.record_invalid_call()
+                        return None
+
+                    self._rate_limiter.mark_verified(
+                        device["deviceid"]
+                        for device in sensor_response.get("devices") or []
+                        if device.get("deviceid")
+                    )
+                    return sensor_response
+
+        except ApiError:
+            raise
         except TimeoutError as err:
             _LOGGER.warning("Timeout connecting to Mobile Alerts API")
             raise ApiError("Connection timeout") from err
@@ -257,51 +730,58 @@ class MobileAlertsApi:
 
             _LOGGER.debug("Discovery Request payload: %s", json_data)
 
-            async with timeout(30):
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as session:
-                    async with session.post(
-                        self.API_URL, data=json_data, headers=headers
-                    ) as response:
-                        response_text = await response.text()
-                        _LOGGER.debug(
-                            "Discovery API Response: status=%s, body=%s",
+            await self._wait_for_quota([], probe=True)
+
+            async with timeout(API_TIMEOUT_SECONDS):
+                async with self._get_session().post(
+                    self.API_URL, data=json_data, headers=headers
+                ) as response:
+                    body = await response.read()
+                    _LOGGER.debug(
+                        "Discovery API Response: status=%s, body=%s",
+                        response.status,
+                        body[:200].decode(errors="replace") if body else "empty",
+                    )
+
+                    if response.status != 200:
+                        _LOGGER.error(
+                            "API error: HTTP %s, URL: %s, body: %s",
                             response.status,
-                            response_text[:200] if response_text else "empty",
+                            self.API_URL,
+                            body[:200].decode(errors="replace"),
+                        )
+                        self._raise_for_status(response.status, [])
+
+                    sensor_response = decode_json(body)
+
+                    if not sensor_response.get("success", False):
+                        error_code = sensor_response.get("errorcode")
+                        error_msg = sensor_response.get("errormessage")
+                        _LOGGER.error("API error: %s - %s", error_code, error_msg)
+                        self._rate_limiter.record_invalid_call()
+                        return []
+
+                    devices = sensor_response.get("devices", [])
+                    self._rate_limiter.mark_verified(
+                        device["deviceid"]
+                        for device in devices
+                        if device.get("deviceid")
+                    )
+                    if devices:
+                        _LOGGER.debug(
+                            "Successfully discovered %d devices",
+                            len(devices),
+                        )
+                    else:
+                        _LOGGER.warning(
+                            "No devices found for phone_id %s",
+                            self._phone_id,
                         )
 
-                        if response.status != 200:
-                            _LOGGER.error(
-                                "API error: HTTP %s, URL: %s, body: %s",
-                                response.status,
-                                self.API_URL,
-                                response_text[:200],
-                            )
-                            raise ApiError(f"HTTP {response.status}")
-
-                        sensor_response = json.loads(response_text)
-
-                        if not sensor_response.get("success", False):
-                            error_code = sensor_response.get("errorcode")
-                            error_msg = sensor_response.get("errormessage")
-                            _LOGGER.error("API error: %s - %s", error_code, error_msg)
-                            return []
-
-                        devices = sensor_response.get("devices", [])
-                        if devices:
-                            _LOGGER.debug(
-                                "Successfully discovered %d devices",
-                                len(devices),
-                            )
-                        else:
-                            _LOGGER.warning(
-                                "No devices found for phone_id %s",
-                                self._phone_id,
-                            )
-
-                        return devices
+                    return devices
 
+        except ApiError:
+            raise
         except TimeoutError as err:
             _LOGGER.warning("Timeout during device discovery")
             raise ApiError("Connection timeout") from err
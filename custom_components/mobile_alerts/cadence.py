@@ -0,0 +1,128 @@
+"""Upload cadence tracking for adaptive polling of the Mobile Alerts API."""
+
+from collections.abc import Iterable
+import logging
+import math
+from typing import Any, Final
+
+from .const import (
+    CADENCE_GRACE_SECONDS,
+    CADENCE_MAX_INTERVAL_SECONDS,
+    CADENCE_MIN_INTERVAL_SECONDS,
+    CADENCE_MIN_POLL_SECONDS,
+    CADENCE_SMOOTHING,
+)
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class CadenceTracker:
+    """Learn each sensor's upload interval and plan the next poll.
+
+    Sensors upload on their own schedule (about every 7 minutes). The "c" field
+    of a measurement is the time the server received it and "idx" counts the
+    measurements, so (c delta) / (idx delta) is the upload interval even if
+    polls missed some uploads. The interval is smoothed with an exponential
+    moving average.
+
+    The next poll is planned just after the next expected upload of any
+    device, so a new measurement is picked up shortly after it arrives
+    instead of up to a full scan interval later. With many devices whose
+    uploads are staggered, waiting for the last of them would always wait
+    about a full interval.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cadence tracker."""
+        self._last_uploads: dict[str, tuple[float, int]] = {}
+        self._intervals: dict[str, float] = {}
+
+    def observe(self, device_id: str, upload: float, idx: int) -> None:
+        """Record the last upload of a device.
+
+        Args:
+            device_id: The device ID
+            upload: Time the server received the measurement ("c", epoch seconds)
+            idx: Measurement index ("idx")
+        """
+        last = self._last_uploads.get(device_id)
+        if last is not None and (upload <= last[0] or idx <= last[1]):
+            return
+        self._last_uploads[device_id] = (upload, idx)
+        if last is None:
+            return
+
+        interval = (upload - last[0]) / (idx - last[1])
+        if not (
+            CADENCE_MIN_INTERVAL_SECONDS <= interval <= CADENCE_MAX_INTERVAL_SECONDS
+        ):
+            # Event-driven uploads (contacts, rain) or a long outage
+            _LOGGER.debug(
+                "Ignoring upload interval of %.0f s for device %s", interval, device_id
+            )
+            return
+        previous = self._intervals.get(device_id)
+        self._intervals[device_id] = (
+            interval
+            if previous is None
+            else previous + CADENCE_SMOOTHING * (interval - previous)
+        )
+
+    def observe_devices(self, devices: Iterable[dict[str, Any]]) -> None:
+        """Record the last upload of each device record of an API response."""
+        for device in devices:
+            measurement = device.get("measurement") or {}
+            upload = measurement.get("c")
+            idx = measurement.get("idx")
+            if not device.get("deviceid") or upload is None or idx is None:
+                continue
+            try:
+                self.observe(device["deviceid"], float(upload), int(idx))
+            except (TypeError, ValueError):
+                _LOGGER.debug(
+                    "Invalid c/idx %s/%s for device %s",
+                    upload,
+                    idx,
+                    device["deviceid"],
+                )
+
+    def interval_for(self, device_id: str) -> float | None:
+        """Return the learned upload interval of a device in seconds."""
+        return self._intervals.get(device_id)
+
+    def next_upload(self, device_id: str, now: float) -> float | None:
+        """Return the expected time of the next upload of a device after now."""
+        interval = self._intervals.get(device_id)
+        if interval is None:
+            return None
+        last_upload = self._last_uploads[device_id][0]
+        uploads = max(math.floor((now - last_upload) / interval) + 1, 1)
+        return last_upload + uploads * interval
+
+    def poll_delay(self, now: float, max_delay: float) -> float:
+        """Return the seconds until the next poll.
+
+        Args:
+            now: Current time in epoch seconds
+            max_delay: The regular scan interval in seconds
+
+        Returns:
+            Delay until the next expected upload plus a grace period, clamped
+            to [CADENCE_MIN_POLL_SECONDS, max_delay]. max_delay if no device
+            has a learned interval yet.
+        """
+        uploads = [
+            upload - now
+            for device_id in self._intervals
+            if (upload := self.next_upload(device_id, now)) is not None
+        ]
+        if not uploads:
+            return max_delay
+        delay = min(uploads) + CADENCE_GRACE_SECONDS
+        return min(max(delay, CADENCE_MIN_POLL_SECONDS), max_delay)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned intervals, e.g. for diagnostics."""
+        return {
+            device_id: round(interval) for device_id, interval in self._intervals.items()
+        }
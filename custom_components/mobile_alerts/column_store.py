@@ -0,0 +1,252 @@
+"""Vectorised decoding of a batch of Mobile Alerts device records (NumPy)."""
+
+from collections.abc import Sequence
+from datetime import datetime, timezone
+import logging
+from typing import Any, Final
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional, per-record decoding is used
+    np = None
+
+from .measurement import (
+    BOOL_FIELDS,
+    FLOAT_FIELDS,
+    INT_FIELDS,
+    NOT_CONNECTED,
+    NOT_CONNECTED_VALUE,
+    OUT_OF_RANGE,
+    OUT_OF_RANGE_VALUE,
+    SPECIAL_VALUE_FIELDS,
+    WIND_DIRECTION_DEGREES,
+    decode_bool,
+    decode_timestamp,
+)
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+NUMPY_AVAILABLE: Final = np is not None
+
+# Column layout: measured values, then the stamps
+_MEASURED_KEYS: Final = FLOAT_FIELDS + INT_FIELDS
+_STAMP_KEYS: Final = ("idx", "ts", "c")
+_NUMERIC_KEYS: Final = _MEASURED_KEYS + _STAMP_KEYS
+_FLAG_KEYS: Final = BOOL_FIELDS + ("lowbattery",)
+_COLUMNS: Final = {key: column for column, key in enumerate(_NUMERIC_KEYS)}
+# Columns of the measured values the special values apply to
+_SPECIAL_COLUMNS: Final = [
+    _COLUMNS[key] for key in _MEASURED_KEYS if key in SPECIAL_VALUE_FIELDS
+]
+_FLAG_COLUMNS: Final = {key: column for column, key in enumerate(_FLAG_KEYS)}
+_INT_KEYS: Final = frozenset(INT_FIELDS + _STAMP_KEYS)
+
+# Status codes of the measured values
+_STATUS_OK: Final = 0
+_STATUS_NOT_CONNECTED: Final = 1
+_STATUS_OUT_OF_RANGE: Final = 2
+
+
+class ColumnStore:
+    """Measurements of all devices of a batch response as column arrays.
+
+    Decoding each device record on its own dominates the CPU time of a poll
+    for accounts with hundreds of sensors. The store collects the raw values of
+    all records in one pass and decodes them as arrays (device row x
+    measurement key): numeric conversion, masking of the special values
+    43530 / 65295 of the sensor values, integer truncation and the wind
+    direction conversion are vector operations.
+
+    Entities read the values through ColumnMeasurement views, which are array
+    index lookups with the same interface as Measurement.
+    """
+
+    def __init__(self, records: Sequence[dict[str, Any]]) -> None:
+        """Decode a batch of device records.
+
+        Args:
+            records: Device records as returned by the API
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+        """
+        if np is None:
+            raise RuntimeError("NumPy is required for the column store")
+        self.records = list(records)
+        self.rows = {
+            record["deviceid"]: row
+            for row, record in enumerate(self.records)
+            if record.get("deviceid")
+        }
+        shape = (len(self.records), len(_NUMERIC_KEYS))
+        self.values = np.full(shape, np.nan)
+        self.flags = np.full((len(self.records), len(_FLAG_KEYS)), -1, dtype=np.int8)
+
+        rows: list[int] = []
+        columns: list[int] = []
+        raw_values: list[Any] = []
+        for row, record in enumerate(self.records):
+            for key, value in (record.get("measurement") or {}).items():
+                if value is None:
+                    continue
+                if (column := _COLUMNS.get(key)) is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    raw_values.append(value)
+                elif (column := _FLAG_COLUMNS.get(key)) is not None:
+                    self.flags[row, column] = decode_bool(value)
+
+        if raw_values:
+            self.values[rows, columns] = self._to_float(rows, columns, raw_values)
+
+        # Truncate like int(float(value)) of the per-record decoding
+        int_columns = [_COLUMNS[key] for key in _NUMERIC_KEYS if key in _INT_KEYS]
+        self.values[:, int_columns] = np.trunc(self.values[:, int_columns])
+
+        measured = self.values[:, : len(_MEASURED_KEYS)]
+        self.status = np.zeros(measured.shape, dtype=np.int8)
+        special = measured[:, _SPECIAL_COLUMNS]
+        status = np.zeros(special.shape, dtype=np.int8)
+        status[special == NOT_CONNECTED_VALUE] = _STATUS_NOT_CONNECTED
+        status[special == OUT_OF_RANGE_VALUE] = _STATUS_OUT_OF_RANGE
+        self.status[:, _SPECIAL_COLUMNS] = status
+        measured[self.status != _STATUS_OK] = np.nan
+
+        wd = self.values[:, _COLUMNS["wd"]]
+        wd_status = self.status[:, _COLUMNS["wd"]]
+        valid_wd = (wd >= 0) & (wd <= 15)
+        self.wd_degrees = np.where(
+            valid_wd, np.round(wd * WIND_DIRECTION_DEGREES, 1), np.nan
+        )
+        self.wd_degrees_status = wd_status
+
+    def _to_float(
+        self, rows: list[int], columns: list[int], raw_values: list[Any]
+    ) -> Any:
+        """Convert the raw values to a float array.
+
+        Numbers and numeric strings are converted in one step. If the batch
+        has an invalid value, the values are converted one by one and invalid
+        ones become NaN. ISO timestamps in "c" are parsed to epoch seconds.
+        """
+        try:
+            return np.asarray(raw_values, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+        converted = np.empty(len(raw_values))
+        c_column = _COLUMNS["c"]
+        for i, value in enumerate(raw_values):
+            try:
+                converted[i] = float(value)
+            except (TypeError, ValueError, OverflowError):
+                key = _NUMERIC_KEYS[columns[i]]
+                device_id = self.records[rows[i]].get("deviceid", "")
+                timestamp = (
+                    decode_timestamp(device_id, value)
+                    if columns[i] == c_column
+                    else None
+                )
+                if timestamp is None:
+                    if columns[i] != c_column:
+                        _LOGGER.warning(
+                            "Invalid value for %s of device %s: %s",
+                            key,
+                            device_id,
+                            value,
+                        )
+                    converted[i] = np.nan
+                else:
+                    converted[i] = timestamp.timestamp()
+        return converted
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self.records)
+
+    def measurement(self, device_id: str) -> "ColumnMeasurement | None":
+        """Return the measurement view of a device.
+
+        Returns:
+            The view, or None if the device is unknown or has no measurement
+        """
+        row = self.rows.get(device_id)
+        if row is None or "measurement" not in self.records[row]:
+            return None
+        return ColumnMeasurement(self, row)
+
+    def value(self, row: int, key: str) -> Any:
+        """Return the decoded value of a measurement key of a device row.
+
+        Returns:
+            float or int, NOT_CONNECTED / OUT_OF_RANGE, a bool for flags, or
+            None if the device did not report the key
+        """
+        if (column := _COLUMNS.get(key)) is not None:
+            if column < len(_MEASURED_KEYS):
+                status = self.status[row, column]
+                if status == _STATUS_NOT_CONNECTED:
+                    return NOT_CONNECTED
+                if status == _STATUS_OUT_OF_RANGE:
+                    return OUT_OF_RANGE
+            value = self.values[row, column]
+            if np.isnan(value):
+                return None
+            return int(value) if key in _INT_KEYS else float(value)
+        if key == "wd_degrees":
+            status = self.wd_degrees_status[row]
+            if status == _STATUS_NOT_CONNECTED:
+                return NOT_CONNECTED
+            if status == _STATUS_OUT_OF_RANGE:
+                return OUT_OF_RANGE
+            value = self.wd_degrees[row]
+            return None if np.isnan(value) else float(value)
+        if (column := _FLAG_COLUMNS.get(key)) is not None:
+            flag = self.flags[row, column]
+            return None if flag < 0 else bool(flag)
+        return None
+
+
+class ColumnMeasurement:
+    """Measurement of one device backed by the arrays of a ColumnStore.
+
+    Has the same interface as Measurement: the typed fields, idx / ts / c,
+    last_seen, low_battery and get().
+    """
+
+    __slots__ = ("_row", "_store", "device_id")
+
+    def __init__(self, store: ColumnStore, row: int) -> None:
+        """Initialize the view.
+
+        Args:
+            store: The column store of the batch
+            row: Row of the device in the store
+        """
+        self._store = store
+        self._row = row
+        self.device_id = store.records[row].get("deviceid", "")
+
+    @property
+    def last_seen(self) -> datetime | None:
+        """Return the time the server received the measurement."""
+        c = self._store.value(self._row, "c")
+        return None if c is None else datetime.fromtimestamp(c, tz=timezone.utc)
+
+    @property
+    def low_battery(self) -> bool | None:
+        """Return the low battery flag, None if not reported."""
+        return self._store.value(self._row, "lowbattery")
+
+    def get(self, key: str) -> Any:
+        """Return the value of a measurement key, None if it is not decoded."""
+        if key in ("idx", "ts", "c", "lowbattery"):
+            return None
+        return self._store.value(self._row, key)
+
+    def __getattr__(self, key: str) -> Any:
+        """Return a typed field (t1, h, idx, ...) of the measurement."""
+        if key.startswith("_"):
+            raise AttributeError(key)
+        if key in _COLUMNS or key in BOOL_FIELDS or key == "wd_degrees":
+            return self._store.value(self._row, key)
+        raise AttributeError(key)
@@ -1,17 +1,32 @@
 """Config flow for Mobile Alerts integration."""
 
+from collections.abc import Iterable
 import logging
 from typing import Any, Optional
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_DEVICE_ID, CONF_NAME
+from homeassistant.data_entry_flow import AbortFlow
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 from homeassistant.config_entries import ConfigFlowResult
 
+from . import async_get_api_session, async_get_rate_limiter
 from .api import ApiError, MobileAlertsApi
-from .const import CONF_PHONE_ID, CONF_MODEL_ID, DOMAIN
-from .device import find_all_matching_models
+from .const import (
+    ATTRIBUTE_POLICIES,
+    CONF_ATTRIBUTES,
+    CONF_MODEL_ID,
+    CONF_PHONE_ID,
+    DEFAULT_ATTRIBUTES,
+    DOMAIN,
+)
+from .device import find_device_models, find_models_by_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,8 +53,17 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             device_id = user_input.get(CONF_DEVICE_ID, "").strip().upper()
             device_name = user_input.get(CONF_NAME, "").strip()
+            phone_id = user_input.get(CONF_PHONE_ID, "").strip()
 
-            if not device_id:
+            if not device_id and phone_id:
+                # No device ID but a phone ID: import all devices of the phone ID
+                return await self.async_step_import_phone_id(
+                    {CONF_PHONE_ID: phone_id}
+                )
+            if device_id and phone_id:
+                # Either one device or all devices of a phone ID
+                errors["base"] = "phone_id_with_device_id"
+            elif not device_id:
                 errors["base"] = "invalid_device_id"
             elif len(device_id) != 12:
                 errors["base"] = "invalid_device_id_format"
@@ -48,7 +72,11 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 try:
                     # Test API call with empty phone_id (uses public test data)
                     _LOGGER.debug("Validating device %s via API", device_id)
-                    api = MobileAlertsApi(phone_id="")
+                    api = MobileAlertsApi(
+                        phone_id="",
+                        session=async_get_api_session(self.hass),
+                        rate_limiter=async_get_rate_limiter(self.hass),
+                    )
                     # Register device in API (this also fetches its data)
                     await api.register_device(device_id)
 
@@ -73,7 +101,10 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         )
 
                         # Check if device has no measurement data (offline/never sent data)
-                        if not measurement:
+                        # The model can still be known from the type ID of the device ID
+                        if not measurement and (
+                            len(find_models_by_device_id(device_id)) != 1
+                        ):
                             last_seen = device_data.get("lastseen")
                             _LOGGER.warning(
                                 "Device %s has no measurement data (may be offline). "
@@ -84,8 +115,9 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             )
                             errors["base"] = "device_offline_no_data"
                         else:
-                            # Try to detect the device model from measurement data
-                            all_matches = find_all_matching_models(measurement)
+                            # Detect the device model from the type ID of the device ID,
+                            # and from the measurement keys if the type ID is ambiguous
+                            all_matches = find_device_models(device_id, measurement)
 
                             if not all_matches:
                                 _LOGGER.error(
@@ -146,40 +178,10 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                                     },
                                 )
 
-                                # Update coordinator with the already-fetched device data
-                                # This prevents entities from being "unavailable" and avoids an extra API call
-                                # which helps respect the rate limit (max 3 req/min/device)
-                                try:
-                                    _LOGGER.debug(
-                                        "Seeding coordinator with device data for %s",
-                                        device_id,
-                                    )
-                                    from .const import DOMAIN
-
-                                    hass = self.hass
-                                    if (
-                                        DOMAIN in hass.data
-                                        and "coordinators" in hass.data[DOMAIN]
-                                    ):
-                                        coordinators = hass.data[DOMAIN]["coordinators"]
-                                        phone_id = "ui_devices"
-                                        if phone_id in coordinators:
-                                            coordinator = coordinators[phone_id]
-                                            # Directly seed the coordinator with the data we already fetched
-                                            # This avoids another API call and respects rate limits
-                                            if device_data:
-                                                coordinator._api._data = [device_data]
-                                                _LOGGER.debug(
-                                                    "Coordinator seeded with device data for %s",
-                                                    device_id,
-                                                )
-                                except Exception as err:  # noqa: BLE001
-                                    _LOGGER.warning(
-                                        "Could not seed coordinator with device data for %s: %s. "
-                                        "Data will be available after the next scheduled update.",
-                                        device_id,
-                                        err,
-                                    )
+                                # Hand over the already-fetched device data, so the
+                                # entry setup does not fetch it again (the rate limit
+                                # allows max 3 req/min/device)
+                                self._seed_devices([device_data])
 
                                 return entry
 
@@ -193,8 +195,9 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show form with info message
         form_schema = vol.Schema(
             {
-                vol.Required(CONF_DEVICE_ID): cv.string,
+                vol.Optional(CONF_DEVICE_ID): cv.string,
                 vol.Optional(CONF_NAME): cv.string,
+                vol.Optional(CONF_PHONE_ID): cv.string,
             }
         )
 
@@ -214,6 +217,144 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             },
         )
 
+    async def async_step_import_phone_id(
+        self, user_input: Optional[dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Import all devices of a phone ID with a single API request.
+
+        The devices are discovered once, their models are detected from that
+        response, and one config entry is created per device: this flow
+        creates the first one and starts an import flow for each other device.
+        The discovered data is handed over to the entry setup, so no device is
+        fetched again.
+        """
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            phone_id = user_input.get(CONF_PHONE_ID, "").strip()
+            try:
+                api = MobileAlertsApi(
+                    phone_id=phone_id,
+                    session=async_get_api_session(self.hass),
+                    rate_limiter=async_get_rate_limiter(self.hass),
+                )
+                devices = await api.discover_devices()
+            except ApiError as err:
+                _LOGGER.error("API error discovering devices of %s: %s", phone_id, err)
+                errors["base"] = "api_error"
+            else:
+                entries = self._entries_for_devices(phone_id, devices)
+                if not devices:
+                    errors["base"] = "no_devices_found"
+                elif not entries:
+                    return self.async_abort(reason="already_configured")
+                else:
+                    return await self._async_create_entries(entries, devices)
+
+        return self.async_show_form(
+            step_id="import_phone_id",
+            data_schema=vol.Schema({vol.Required(CONF_PHONE_ID): cv.string}),
+            errors=errors,
+        )
+
+    def _entries_for_devices(
+        self, phone_id: str, devices: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return the config entry data of the discovered devices.
+
+        Devices that are already configured, and devices whose model cannot be
+        detected unambiguously, are skipped (they can be added one by one).
+        """
+        configured = self._async_current_ids()
+        entries: list[dict[str, Any]] = []
+        for device in devices:
+            device_id = str(device.get("deviceid", "")).upper()
+            if not device_id or device_id in configured:
+                continue
+            matches = find_device_models(device_id, device.get("measurement"))
+            if len(matches) != 1:
+                _LOGGER.warning(
+                    "Skipping device %s: model is %s, add it individually",
+                    device_id,
+                    "ambiguous" if matches else "unknown",
+                )
+                continue
+            model_id, model_info = matches[0]
+            entries.append(
+                {
+                    CONF_DEVICE_ID: device_id,
+                    CONF_NAME: f"{model_info['display_name']} {device_id}",
+                    CONF_MODEL_ID: model_id,
+                    CONF_PHONE_ID: phone_id,
+                }
+            )
+        return entries
+
+    async def _async_create_entries(
+        self, entries: list[dict[str, Any]], devices: list[dict[str, Any]]
+    ) -> ConfigFlowResult:
+        """Create the first entry here and the others via import flows."""
+        # Hand over the discovered data, so the entry setup does not fetch it
+        device_ids = {entry_data[CONF_DEVICE_ID] for entry_data in entries}
+        self._seed_devices(
+            device
+            for device in devices
+            if str(device.get("deviceid", "")).upper() in device_ids
+        )
+
+        first, *others = entries
+        for entry_data in others:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": config_entries.SOURCE_IMPORT},
+                    data=entry_data,
+                )
+            )
+        _LOGGER.info(
+            "Importing %d device(s) of phone ID %s",
+            len(entries),
+            first[CONF_PHONE_ID],
+        )
+
+        await self._async_set_seeded_unique_id(first[CONF_DEVICE_ID])
+        return self.async_create_entry(title=first[CONF_NAME], data=first)
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create the entry of a device found by async_step_import_phone_id."""
+        await self._async_set_seeded_unique_id(import_data[CONF_DEVICE_ID])
+        return self.async_create_entry(
+            title=import_data[CONF_NAME], data=import_data
+        )
+
+    def _seed_devices(self, devices: Iterable[dict[str, Any]]) -> None:
+        """Hand over fetched device records to the setup of their entries.
+
+        The entry setup takes the record of its device from
+        hass.data[DOMAIN]["seed_devices"] instead of fetching it again.
+        """
+        seed_devices = self.hass.data.setdefault(DOMAIN, {}).setdefault(
+            "seed_devices", {}
+        )
+        for device in devices:
+            seed_devices[str(device.get("deviceid", "")).upper()] = device
+
+    async def _async_set_seeded_unique_id(self, device_id: str) -> None:
+        """Set the unique ID of a device whose record was handed over.
+
+        Raises:
+            AbortFlow: If the device is already configured or in progress. The
+                handed over record is dropped, as no entry setup will take it.
+        """
+        try:
+            await self.async_set_unique_id(device_id)
+            self._abort_if_unique_id_configured()
+        except AbortFlow:
+            self.hass.data.get(DOMAIN, {}).get("seed_devices", {}).pop(
+                device_id, None
+            )
+            raise
+
     async def async_step_select_model(
         self, user_input: Optional[dict[str, Any]] = None
     ) -> ConfigFlowResult:
@@ -265,31 +406,9 @@ class MobileAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-            # Update coordinator with the already-fetched device data
-            try:
-                _LOGGER.debug(
-                    "Seeding coordinator with device data for %s",
-                    device_id,
-                )
-                from .const import DOMAIN
-
-                hass = self.hass
-                if DOMAIN in hass.data and "coordinators" in hass.data[DOMAIN]:
-                    coordinators = hass.data[DOMAIN]["coordinators"]
-                    phone_id = "ui_devices"
-                    if phone_id in coordinators:
-                        coordinator = coordinators[phone_id]
-                        if self._device_data:
-                            coordinator.data[device_id] = self._device_data
-                            _LOGGER.debug(
-                                "Updated coordinator data for device %s",
-                                device_id,
-                            )
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.warning(
-                    "Failed to seed coordinator: %s (non-critical)",
-                    err,
-                )
+            # Hand over the already-fetched device data to the entry setup
+            if self._device_data:
+                self._seed_devices([self._device_data])
 
             return entry
 
@@ -333,7 +452,30 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(
         self, user_input: Optional[dict[str, Any]] = None
-    ) -> dict[str, Any]:  # type: ignore[override]
-        """Manage the options."""
-        # For now, no options to manage
-        return self.async_abort(reason="not_implemented")
+    ) -> ConfigFlowResult:
+        """Manage the options.
+
+        The entry is reloaded by the update listener when the options change.
+        """
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ATTRIBUTES,
+                        default=self.config_entry.options.get(
+                            CONF_ATTRIBUTES, DEFAULT_ATTRIBUTES
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=ATTRIBUTE_POLICIES,
+                            mode=SelectSelectorMode.LIST,
+                            translation_key=CONF_ATTRIBUTES,
+                        )
+                    ),
+                }
+            ),
+        )
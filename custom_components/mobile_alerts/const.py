@@ -7,8 +7,83 @@ CONF_DEVICES = "devices"
 CONF_PHONE_ID = "phone_id"
 CONF_TYPE = "type"
 CONF_MODEL_ID = "model_id"  # Device model ID (e.g., "MA10300") for config entries
+CONF_ATTRIBUTES = "attributes"  # State attribute policy (option)
+CONF_GATEWAY = "gateway"  # Local gateway receiver (YAML)
+CONF_GATEWAY_FORWARD = "forward"  # Forward gateway uploads to the cloud
+CONF_GATEWAY_FORWARD_URL = "forward_url"  # Cloud endpoint of the uploads
+CONF_GATEWAYS = "gateways"  # Allowed gateways (ID and IP address)
+
+# State attribute policies
+ATTRIBUTES_COMPACT = "compact"  # Device ID, measurement idx/ts and own alert flags
+ATTRIBUTES_NONE = "none"
+ATTRIBUTES_FULL = "full"  # Full raw API record (legacy behaviour)
+ATTRIBUTE_POLICIES = [ATTRIBUTES_COMPACT, ATTRIBUTES_NONE, ATTRIBUTES_FULL]
+DEFAULT_ATTRIBUTES = ATTRIBUTES_COMPACT
 
 ATTRIBUTION = "Data from MobileAlerts"
 
 # Scan interval in minutes
 SCAN_INTERVAL_MINUTES = 10
+
+# Shared HTTP session settings for the Mobile Alerts API
+API_TIMEOUT_SECONDS = 30
+API_POOL_SIZE = 4  # Max. concurrent connections to data199.com
+# Keep idle connections open from one poll to the next
+API_KEEPALIVE_SECONDS = SCAN_INTERVAL_MINUTES * 60 + 60
+
+# Max. number of device IDs per API request. Larger batches are split into
+# chunks that are fetched concurrently over the shared connection pool.
+BATCH_CHUNK_SIZE = 25
+
+# Batches of at least this many devices are decoded as NumPy column arrays
+# (if NumPy is installed), smaller ones record by record
+COLUMN_STORE_MIN_DEVICES = 100
+
+# Fetches of all phone_ids run through one executor: at most
+# FETCH_MAX_CONCURRENT at a time, started at least FETCH_STAGGER_SECONDS apart
+FETCH_MAX_CONCURRENT = API_POOL_SIZE
+FETCH_STAGGER_SECONDS = 2.0
+
+# Adaptive polling: the next poll follows the learned upload cadence of the
+# sensors (about every 7 minutes), within SCAN_INTERVAL_MINUTES
+CADENCE_GRACE_SECONDS = 30  # Delay after an expected upload before polling
+CADENCE_MIN_POLL_SECONDS = 2 * 60
+CADENCE_MIN_INTERVAL_SECONDS = 60  # Shorter intervals are event-driven uploads
+CADENCE_MAX_INTERVAL_SECONDS = 60 * 60
+CADENCE_SMOOTHING = 0.3  # Weight of a new interval in the moving average
+
+# Samples kept per device and measurement key for the rolling statistics
+# (about 17 hours at one measurement every 7 minutes)
+HISTORY_SIZE = 144
+
+# Rain per flip of the rain gauge seesaw ("rf" counter, MA10650)
+RAIN_MM_PER_FLIP = 0.258
+
+# Wind statistics: mean direction and speed over the short window, mean speed
+# and peak gust over the long window. Samples per window are capped.
+WIND_SHORT_WINDOW_SECONDS = 10 * 60
+WIND_SHORT_WINDOW_MIN_SAMPLES = 2  # Sensors upload about every 7 minutes
+WIND_LONG_WINDOW_SECONDS = 60 * 60
+WIND_WINDOW_SIZE = 64
+
+# Local gateway receiver: gateways with Home Assistant as HTTP proxy upload
+# 64 byte sensor packets, which are optionally forwarded to the cloud
+GATEWAY_URL = "/gateway/put"
+GATEWAY_CLOUD_URL = "http://www.data199.com/gateway/put"
+GATEWAY_PACKET_SIZE = 64
+
+# Persisted snapshot of the last API data per phone_id (HA storage helper)
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshot"
+SNAPSHOT_SAVE_DELAY_SECONDS = 60  # Coalesce snapshot writes
+
+# Window in seconds in which concurrent device registrations are fetched together
+REGISTER_COALESCE_SECONDS = 0.5
+
+# Documented API quotas (see docs/api_documentation.md, "API Rate Limits")
+API_RATE_LIMIT_CALLS = 3  # Max. calls per sensor within the window
+API_RATE_LIMIT_WINDOW_SECONDS = 60
+API_INVALID_CALL_LIMIT = 5  # Max. invalid calls per IP within the window
+API_INVALID_CALL_WINDOW_SECONDS = 15 * 60
+API_RATE_LIMIT_BLOCK_SECONDS = 7 * 60  # Sensor block after HTTP 429
+API_IP_BLOCK_SECONDS = 15 * 60  # IP block after HTTP 403
@@ -1,17 +1,27 @@
 """Data update coordinator for Mobile Alerts."""
 
-from datetime import timedelta
+import asyncio
+from datetime import datetime, timedelta
 import logging
 from typing import Any, Final
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+import homeassistant.util.dt as dt_util
 
-from .api import MobileAlertsApi
-from .const import SCAN_INTERVAL_MINUTES
+from .api import ApiBlockedError, MobileAlertsApi
+from .cadence import CadenceTracker
+from .column_store import ColumnMeasurement
+from .const import SCAN_INTERVAL_MINUTES, SNAPSHOT_SAVE_DELAY_SECONDS
+from .executor import FetchExecutor
+from .history import HistoryStore
+from .measurement import Measurement
+from .rain import RainEngine
+from .wind import WindEngine
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -27,12 +37,20 @@ class MobileAlertsCoordinator(DataUpdateCoordinator):
     coordinator, resulting in a single batched API call.
     """
 
-    def __init__(self, hass: HomeAssistant, api: MobileAlertsApi) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: MobileAlertsApi,
+        store: Store | None = None,
+        executor: FetchExecutor | None = None,
+    ) -> None:
         """Initialize the coordinator.
 
         Args:
             hass: Home Assistant instance
             api: Mobile Alerts API instance
+            store: Storage for the snapshot of the last good data (optional)
+            executor: Domain-wide executor that runs the fetches (optional)
         """
         super().__init__(
             hass,
@@ -42,41 +60,355 @@ class MobileAlertsCoordinator(DataUpdateCoordinator):
         )
         self._api = api
         self._is_initial_update = True
+        self._backoff_until: datetime | None = None
+        self._last_success: datetime | None = None
+        self._stamps: dict[str, tuple[Any, Any] | None] = {}
+        self._changed_devices: set[str] | None = None
+        self._store = store
+        self._executor = executor
+        self._restore_task: asyncio.Task[bool] | None = None
+        self._cadence = CadenceTracker()
+        self._history = HistoryStore()
+        self._rain = RainEngine(dt_util.DEFAULT_TIME_ZONE)
+        self._wind = WindEngine()
+        self._pushed: dict[str, datetime] = {}
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True while the last good data is served.
+
+        That is during an API block, and after a restored snapshot until the
+        next successful update. Entities show it as the "stale" attribute.
+        """
+        return bool(self.data and self.data.get("stale"))
+
+    @property
+    def upload_intervals(self) -> dict[str, int]:
+        """Return the learned upload interval of each device in seconds."""
+        return self._cadence.as_dict()
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last persisted data, so entities have values right away.
+
+        The restored data is marked as stale until the next successful update.
+        The snapshot is loaded once, concurrent callers (one per config entry)
+        wait for the same load.
+
+        Returns:
+            True if a snapshot was restored
+        """
+        if self._store is None:
+            return False
+        if self._restore_task is None:
+            self._restore_task = self.hass.async_create_task(
+                self._async_load_snapshot(self._store)
+            )
+        return await asyncio.shield(self._restore_task)
+
+    async def _async_load_snapshot(self, store: Store) -> bool:
+        """Load the snapshot into the API client and the coordinator data."""
+        snapshot = await store.async_load()
+        if not snapshot or not snapshot.get("devices"):
+            return False
+
+        self._api.restore(snapshot["devices"])
+        self._rain.restore(snapshot.get("rain") or {})
+        saved_at = snapshot.get("saved_at")
+        self._last_success = dt_util.parse_datetime(saved_at) if saved_at else None
+        self.data = self._stale_data({"devices": self._api.devices})
+        _LOGGER.debug(
+            "Restored %d device(s) from snapshot of %s",
+            len(snapshot["devices"]),
+            saved_at,
+        )
+        return True
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        """Return the data to persist in the snapshot store."""
+        return {
+            "saved_at": (
+                self._last_success.isoformat() if self._last_success else None
+            ),
+            "devices": self._api.snapshot(),
+            "rain": self._rain.as_dict(),
+        }
+
+    def device_changed(self, device_id: str) -> bool:
+        """Return True if the device has to write its state after this refresh.
+
+        Args:
+            device_id: The device ID to check
+
+        Returns:
+            True if the device has a new measurement (idx/ts), or if all entities
+            have to be written (first refresh, failed refresh or recovery from one)
+        """
+        return self._changed_devices is None or device_id in self._changed_devices
+
+    def _update_changed_devices(self, stale: bool = False) -> None:
+        """Compute the set of devices whose measurement changed since last refresh.
+
+        Args:
+            stale: The refresh serves the last good data. All entities write
+                their state when this changes, to update the stale attribute.
+        """
+        stamps = self._api.measurement_stamps()
+        if self._stamps and self.last_update_success and stale == self.is_stale:
+            self._changed_devices = {
+                device_id
+                for device_id in stamps.keys() | self._stamps.keys()
+                if stamps.get(device_id) != self._stamps.get(device_id)
+            }
+        else:
+            self._changed_devices = None
+        self._stamps = stamps
 
     async def _async_update_data(self) -> dict[str, Any] | None:
         """Fetch data from API endpoint.
 
-        This method is called at regular intervals (SCAN_INTERVAL) to fetch
-        updated data from the Mobile Alerts API. The API batches all registered
-        device IDs in a single request.
+        This method is called at most every SCAN_INTERVAL to fetch updated data
+        from the Mobile Alerts API, earlier when the learned upload cadence of
+        the sensors expects new data. The API batches all registered device IDs
+        in a single request.
 
         On the first update (after setup), devices are fetched individually
         to populate data quickly. On subsequent updates, all devices are
         fetched together in a single batch request.
 
+        If the API blocks the sensors (HTTP 429) or this IP address (HTTP 403),
+        no requests are made for the documented block window. Meanwhile the last
+        good data is served with a "stale" marker, so entities stay available.
+
+        After each refresh only the entities of devices with a new measurement
+        write their state (see device_changed).
+
         Returns:
             dict or None: API response with measurement data for all registered devices
 
         Raises:
             UpdateFailed: If communication with the API fails
         """
+        now = dt_util.utcnow()
+        if self._all_pushed_since(now - SCAN_INTERVAL):
+            _LOGGER.debug("All devices were pushed by a local gateway, skipping poll")
+            self._update_changed_devices()
+            return {"devices": self._api.devices}
+        if self._backoff_until is not None and now < self._backoff_until:
+            _LOGGER.debug(
+                "API blocked until %s, serving last good data",
+                self._backoff_until.isoformat(),
+            )
+            data = self._stale_data()
+            self._update_changed_devices(stale=True)
+            return data
+
         try:
             _LOGGER.debug(
                 "MobileAlertsCoordinator::_async_update_data (is_initial=%s)",
                 self._is_initial_update,
             )
-            result = await self._api.fetch_data(is_initial=self._is_initial_update)
-
-            # After first update, switch to batch mode
-            if self._is_initial_update:
-                self._is_initial_update = False
-            return result
+            result = await self._fetch()
+        except ApiBlockedError as err:
+            self._backoff_until = now + timedelta(seconds=err.retry_after)
+            # Poll again right after the block window instead of extending it
+            self.update_interval = max(
+                SCAN_INTERVAL, timedelta(seconds=err.retry_after + 5)
+            )
+            _LOGGER.warning(
+                "%s. Backing off until %s",
+                err,
+                self._backoff_until.isoformat(),
+            )
+            data = self._stale_data()
+            self._update_changed_devices(stale=True)
+            return data
         except Exception as err:
+            self._changed_devices = None
             raise UpdateFailed("Error communicating with API") from err
 
+        # After first update, switch to batch mode
+        if self._is_initial_update:
+            self._is_initial_update = False
+        self._backoff_until = None
+        self._last_success = now
+        self._schedule_next_poll(now)
+        self._update_changed_devices()
+        self._record_history()
+        if self._store is not None:
+            # Coalesce writes, the store also flushes pending data on shutdown
+            self._store.async_delay_save(
+                self._snapshot_data, SNAPSHOT_SAVE_DELAY_SECONDS
+            )
+        return result
+
+    def _all_pushed_since(self, since: datetime) -> bool:
+        """Return True if a gateway pushed every device since the given time."""
+        if not self._pushed:
+            return False
+        return all(
+            device_id in self._pushed and self._pushed[device_id] >= since
+            for device_id in self._api.device_ids
+        )
+
+    @callback
+    def async_push_records(self, records: list[dict[str, Any]]) -> bool:
+        """Apply device records decoded from a local gateway upload.
+
+        Records of devices of this coordinator replace the measurement values
+        they contain, and the entities of these devices are updated right
+        away. Records carry no cloud "idx", so a record is only applied if
+        its "ts" is newer than the current measurement, and the cloud "idx"
+        is kept. The poll schedule is kept: polling the cloud API is skipped
+        while a gateway pushes all devices (see _async_update_data).
+
+        Args:
+            records: Device records in the API format
+
+        Returns:
+            True if a record of this coordinator was applied
+        """
+        device_ids = set(self._api.device_ids)
+        now = dt_util.utcnow()
+        applied = False
+        for record in records:
+            device_id = record["deviceid"]
+            if device_id not in device_ids:
+                continue
+            previous = self._api.get_device(device_id) or {}
+            previous_measurement = previous.get("measurement") or {}
+            previous_ts = previous_measurement.get("ts")
+            timestamp = record["measurement"]["ts"]
+            if isinstance(previous_ts, int) and timestamp <= previous_ts:
+                continue
+            measurement = {**previous_measurement, **record["measurement"]}
+            self._api.update_device({**previous, **record, "measurement": measurement})
+            self._pushed[device_id] = now
+            applied = True
+        if not applied:
+            return False
+
+        self._last_success = now
+        self._update_changed_devices()
+        self._record_history()
+        if self._store is not None:
+            self._store.async_delay_save(
+                self._snapshot_data, SNAPSHOT_SAVE_DELAY_SECONDS
+            )
+        self.data = {"devices": self._api.devices}
+        self.async_update_listeners()
+        return True
+
+    async def _fetch(self) -> dict[str, Any] | None:
+        """Fetch the data, through the shared executor if there is one."""
+        is_initial = self._is_initial_update
+        if self._executor is None:
+            return await self._api.fetch_data(is_initial=is_initial)
+        return await self._executor.run(
+            self._api.phone_id,
+            lambda: self._api.fetch_data(is_initial=is_initial),
+        )
+
+    def _schedule_next_poll(self, now: datetime) -> None:
+        """Poll again just after the sensors are expected to upload new data.
+
+        Sensors upload about every 7 minutes, so a fixed SCAN_INTERVAL mostly
+        returns unchanged measurements and adds latency. The cadence learned
+        from the "c"/"idx" fields plans the next poll within SCAN_INTERVAL.
+        """
+        self._cadence.observe_devices(self._api.snapshot())
+        delay = self._cadence.poll_delay(
+            now.timestamp(), SCAN_INTERVAL.total_seconds()
+        )
+        self.update_interval = timedelta(seconds=round(delay))
+        _LOGGER.debug("Next poll in %d seconds", round(delay))
+
+    def _record_history(self) -> None:
+        """Add the new measurements of this refresh to the history engines."""
+        device_ids = (
+            self._api.device_ids
+            if self._changed_devices is None
+            else self._changed_devices
+        )
+        for device_id in device_ids:
+            measurement = self._api.get_measurement(device_id)
+            if measurement is not None:
+                self._history.observe(device_id, measurement)
+                self._rain.observe(device_id, measurement.rf, measurement.ts)
+                self._wind.observe(device_id, measurement)
+
+    def get_statistics(self, sensor_id: str, key: str) -> dict[str, Any] | None:
+        """Return the rolling statistics of a measurement key of a device.
+
+        Args:
+            sensor_id: The device ID
+            key: The measurement key, e.g. "t1"
+
+        Returns:
+            dict with mean, min, max and trend (per hour), or None if there
+            is no history yet
+        """
+        return self._history.statistics(sensor_id, key)
+
+    def get_rain(self, sensor_id: str) -> dict[str, float | None] | None:
+        """Return the rain rate and totals derived from the rain flip counter.
+
+        Args:
+            sensor_id: The device ID
+
+        Returns:
+            dict with rate (mm/h), hour and today (mm), or None if the device
+            has not reported a flip counter
+        """
+        return self._rain.values(sensor_id, dt_util.utcnow().timestamp())
+
+    def get_wind(self, sensor_id: str) -> dict[str, Any] | None:
+        """Return the wind statistics of the recent measurements of a device.
+
+        Args:
+            sensor_id: The device ID
+
+        Returns:
+            dict with mean direction and steadiness, mean speeds and the peak
+            gust with its time, or None if the device reported no wind yet
+        """
+        return self._wind.values(sensor_id, dt_util.utcnow().timestamp())
+
+    def _stale_data(self, data: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Return the last good data marked as stale.
+
+        Args:
+            data: The data to mark, the current data if omitted
+
+        Raises:
+            UpdateFailed: If there is no previous data to serve
+        """
+        data = self.data if data is None else data
+        if not data or not data.get("devices"):
+            self._changed_devices = None
+            raise UpdateFailed("API blocked and no previous data available")
+        return {
+            **data,
+            "stale": True,
+            "last_success": (
+                self._last_success.isoformat() if self._last_success else None
+            ),
+        }
+
+    def seed_device(self, device_data: dict[str, Any]) -> None:
+        """Insert a device record that was fetched elsewhere, without an API call.
+
+        Used for the records the config flow hands over to the entry setup.
+
+        Args:
+            device_data: Device record as returned by the API
+        """
+        self._api.update_device(device_data)
+
     def get_reading(self, sensor_id: str) -> dict[str, Any] | None:
         """Extract sensor reading from coordinator data.
 
+        Constant-time lookup in the API client's deviceid index.
+
         Args:
             sensor_id: The device ID to retrieve data for
 
@@ -84,3 +416,16 @@ class MobileAlertsCoordinator(DataUpdateCoordinator):
             dict or None: Measurement data for the sensor, or None if not available
         """
         return self._api.get_reading(sensor_id)
+
+    def get_measurement(
+        self, sensor_id: str
+    ) -> Measurement | ColumnMeasurement | None:
+        """Return the decoded measurement of a device.
+
+        Args:
+            sensor_id: The device ID to retrieve data for
+
+        Returns:
+            Measurement or None: Typed measurement, or None if not available
+        """
+        return self._api.get_measurement(sensor_id)
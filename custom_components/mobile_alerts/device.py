@@ -140,6 +140,132 @@ DEVICE_MODELS: Final = {
     # MA10870 (Voltage Monitor) - measurement keys unknown, excluded from detection
 }
 
+# Suffixes of the alert flag keys that accompany a measurement key
+# (e.g. t1hi, t1lo, t1his for the t1 high/low alerts)
+ALERT_FLAG_SUFFIXES: Final = (
+    "hi",
+    "lo",
+    "hise",
+    "lose",
+    "hiee",
+    "loee",
+    "his",
+    "los",
+    "aactive",
+    "as",
+    "active",
+    "st",
+)
+
+
+# Candidate models per sensor type ID. The first two characters of a device ID
+# are the sensor type ID of the API documentation (ID01 ... ID20). Types that
+# are shared by several models are narrowed down with the measurement keys.
+# Types without a supported model (e.g. ID0A, ID17) fall back to key matching.
+TYPE_ID_MODELS: Final = {
+    "01": ("MA10101", "MA10120"),  # Temperature with cable sensor
+    "02": ("MA10100", "MA10120"),  # Temperature
+    "03": ("MA10200",),  # Temperature, humidity
+    "04": ("MA10350",),  # Temperature, humidity, water detector
+    "05": ("MA10402",),  # Temperature, humidity, CO2
+    "06": ("MA10300", "MA10700"),  # Temperature, humidity, cable/pool sensor
+    "07": ("MA10410",),  # Weather station (indoor/outdoor)
+    "08": ("MA10650",),  # Rain gauge
+    "09": ("MA10300",),  # Pro temperature, humidity, cable sensor (MA 10320)
+    "0B": ("MA10660",),  # Anemometer
+    "0E": ("MA10241",),  # Temperature, humidity
+    "0F": ("MA10101",),  # Temperature with cable sensor
+    "10": ("MA10800",),  # Contact sensor
+    "11": ("MA10450",),  # Temperature station with up to 4 sensors
+    "12": ("MA10230",),  # Room climate station (humidity averages)
+    "15": ("MA10880",),  # Wireless switch
+    "18": ("MA10238",),  # Air pressure
+    "20": ("MA10100", "MA10120"),  # Temperature
+}
+
+# Metadata keys of a measurement that do not identify the model
+METADATA_KEYS: Final = frozenset({"idx", "ts", "c", "lb"})
+
+
+class ModelDetector:
+    """Detect device models from measurement keys with precompiled indexes.
+
+    Built once from the model table, so that detecting a device (e.g. every
+    device of a phone_id during bulk onboarding) does not walk all models:
+
+    - exact matches are a single lookup in a frozenset-keyed table
+    - alert flag keys are filtered with one str.endswith() over a suffix tuple
+    - subset matches count, via a key -> models index, how many keys of each
+      model are present; a model matches if all its keys were counted
+    """
+
+    def __init__(self, models: dict[str, dict[str, Any]]) -> None:
+        """Compile the indexes for the given model table.
+
+        Args:
+            models: Model table like DEVICE_MODELS
+        """
+        self._exact: dict[frozenset[str], list[tuple[str, dict[str, Any]]]] = {}
+        self._by_key: dict[str, list[str]] = {}
+        self._models: dict[str, tuple[int, int, dict[str, Any]]] = {}
+        # Models without keys are a subset of every measurement
+        self._keyless: list[str] = []
+
+        for order, (model_id, model_info) in enumerate(models.items()):
+            model_keys = frozenset(model_info["measurement_keys"])
+            self._exact.setdefault(model_keys, []).append((model_id, model_info))
+            self._models[model_id] = (order, len(model_keys), model_info)
+            if not model_keys:
+                self._keyless.append(model_id)
+            for key in model_keys:
+                self._by_key.setdefault(key, []).append(model_id)
+
+    @staticmethod
+    def measurement_keys(measurement: dict[str, Any]) -> frozenset[str]:
+        """Return the keys of a measurement without metadata and alert flags."""
+        return frozenset(
+            key
+            for key in measurement
+            if key not in METADATA_KEYS and not key.endswith(ALERT_FLAG_SUFFIXES)
+        )
+
+    def match(self, keys: frozenset[str]) -> list[tuple[str, dict[str, Any]]]:
+        """Return the models matching the measurement keys.
+
+        Args:
+            keys: Measurement keys as returned by measurement_keys()
+
+        Returns:
+            All exact matches, or else the subset matches with the most keys,
+            in model table order
+        """
+        exact = self._exact.get(keys)
+        if exact:
+            return list(exact)
+
+        counts: dict[str, int] = dict.fromkeys(self._keyless, 0)
+        for key in keys:
+            for model_id in self._by_key.get(key, ()):
+                counts[model_id] = counts.get(model_id, 0) + 1
+
+        subset = [
+            model_id
+            for model_id, count in counts.items()
+            if count == self._models[model_id][1]
+        ]
+        if not subset:
+            return []
+        best_score = max(self._models[model_id][1] for model_id in subset)
+        best = sorted(
+            (self._models[model_id][0], model_id)
+            for model_id in subset
+            if self._models[model_id][1] == best_score
+        )
+        return [(model_id, self._models[model_id][2]) for _, model_id in best]
+
+
+_MODEL_DETECTOR: Final = ModelDetector(DEVICE_MODELS)
+
 
 def find_all_matching_models(
     measurement: dict[str, Any] | None,
@@ -161,119 +287,79 @@ def find_all_matching_models(
     if not measurement:
         return []
 
-    # Get available measurement keys
-    keys = set(measurement.keys())
-
-    # Remove metadata keys
-    keys.discard("idx")
-    keys.discard("ts")
-    keys.discard("c")
-    keys.discard("lb")
-
-    # Remove alert flag keys
-    alert_suffixes = [
-        "hi",
-        "lo",
-        "hise",
-        "lose",
-        "hiee",
-        "loee",
-        "his",
-        "los",
-        "aactive",
-        "as",
-        "active",
-        "st",
-    ]
-    keys = {k for k in keys if not any(k.endswith(suffix) for suffix in alert_suffixes)}
-
+    keys = ModelDetector.measurement_keys(measurement)
     if not keys:
         return []
 
-    _LOGGER.debug("Detected measurement keys (after cleanup): %s", keys)
-
-    # Try exact match first (most accurate)
-    exact_matches = []
-    for model_id, model_info in DEVICE_MODELS.items():
-        if keys == model_info["measurement_keys"]:
-            exact_matches.append((model_id, model_info))
-            _LOGGER.debug(
-                "Exact match found for model %s with measurement_keys: %s",
-                model_id,
-                keys,
-            )
-
-    # If we have exact matches, return all of them
-    if exact_matches:
+    matches = _MODEL_DETECTOR.match(keys)
+    if matches:
         _LOGGER.debug(
-            "Found %d exact match(es): %s",
-            len(exact_matches),
-            [model_id for model_id, _ in exact_matches],
+            "Measurement keys %s match model(s) %s",
+            sorted(keys),
+            [model_id for model_id, _ in matches],
         )
-        return exact_matches
-
-    # Try subset match (device has at least these keys)
-    # Use scoring to prefer models with more matching keys
-    best_score = 0
-    subset_matches = []
-
-    for model_id, model_info in DEVICE_MODELS.items():
-        if model_info["measurement_keys"].issubset(keys):
-            # Score = number of model keys that match
-            # This prefers models with more required keys
-            score = len(model_info["measurement_keys"])
-
-            if score > best_score:
-                best_score = score
-                subset_matches = [(model_id, model_info)]
-                _LOGGER.debug(
-                    "Better subset match found for model %s (score=%d). "
-                    "Model keys: %s, Actual keys: %s",
-                    model_id,
-                    score,
-                    model_info["measurement_keys"],
-                    keys,
-                )
-            elif score == best_score:
-                # Multiple models with same score - add to list
-                subset_matches.append((model_id, model_info))
-                _LOGGER.debug(
-                    "Equal subset match found for model %s (score=%d). "
-                    "Model keys: %s, Actual keys: %s",
-                    model_id,
-                    score,
-                    model_info["measurement_keys"],
-                    keys,
-                )
-            else:
-                _LOGGER.debug(
-                    "Subset match rejected for model %s (score=%d < current_best=%d). "
-                    "Model keys: %s, Actual keys: %s",
-                    model_id,
-                    score,
-                    best_score,
-                    model_info["measurement_keys"],
-                    keys,
-                )
-
-    if subset_matches:
-        _LOGGER.debug(
-            "Found %d subset match(es) with score %d: %s",
-            len(subset_matches),
-            best_score,
-            [model_id for model_id, _ in subset_matches],
-        )
-        return subset_matches
+        return matches
 
     # Unknown device
     _LOGGER.warning(
         "Could not detect Mobile Alerts device model. Measurement keys: %s. "
         "Please report this with the full log output.",
-        keys,
+        set(keys),
     )
     return []
 
 
+def find_models_by_device_id(device_id: str) -> list[tuple[str, dict[str, Any]]]:
+    """Find the candidate models of a device from the type ID in its device ID.
+
+    Needs no measurement data, so it also works for devices that are offline.
+
+    Args:
+        device_id: The 12 character device ID (e.g. "0B002FA7C3D3")
+
+    Returns:
+        List of (model_id, model_info) tuples, empty if the type ID is unknown
+    """
+    return [
+        (model_id, DEVICE_MODELS[model_id])
+        for model_id in TYPE_ID_MODELS.get(device_id[:2].upper(), ())
+    ]
+
+
+def find_device_models(
+    device_id: str, measurement: dict[str, Any] | None
+) -> list[tuple[str, dict[str, Any]]]:
+    """Find the models of a device, by type ID first and measurement keys second.
+
+    The type ID resolves most devices without looking at the measurement, and
+    tells apart models with the same keys (e.g. MA10300 and MA10350). Only if
+    the type ID has several candidates, they are narrowed down with the
+    measurement keys. Unknown type IDs fall back to key matching.
+
+    Args:
+        device_id: The 12 character device ID
+        measurement: The measurement dict from API response or None
+
+    Returns:
+        List of (model_id, model_info) tuples that match (see
+        find_all_matching_models)
+    """
+    candidates = find_models_by_device_id(device_id)
+    if len(candidates) == 1:
+        _LOGGER.debug(
+            "Device %s identified as %s by its type ID", device_id, candidates[0][0]
+        )
+        return candidates
+
+    matches = find_all_matching_models(measurement)
+    if not candidates:
+        return matches
+
+    candidate_ids = {model_id for model_id, _ in candidates}
+    narrowed = [match for match in matches if match[0] in candidate_ids]
+    return narrowed or candidates
+
+
 def get_sensor_type_override(model_id: str, measurement_key: str) -> str | None:
     """Get sensor type override for model-specific measurement key handling.
 
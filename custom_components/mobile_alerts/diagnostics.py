@@ -0,0 +1,52 @@
+"""Diagnostics support for Mobile Alerts."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PHONE_ID, DOMAIN
+from .coordinator import MobileAlertsCoordinator
+
+TO_REDACT = {CONF_PHONE_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Contains the raw API record of the device, which is not copied into the
+    entity state attributes by default.
+    """
+    coordinator: MobileAlertsCoordinator | None = (
+        hass.data.get(DOMAIN, {}).get("coordinators_by_entry", {}).get(entry.entry_id)
+    )
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+    }
+    if coordinator is None:
+        return diagnostics
+
+    device_id = entry.data.get(CONF_DEVICE_ID)
+    diagnostics["coordinator"] = {
+        "last_update_success": coordinator.last_update_success,
+        "is_stale": coordinator.is_stale,
+        "update_interval": str(coordinator.update_interval),
+        "upload_intervals": coordinator.upload_intervals,
+    }
+    diagnostics["raw_data"] = coordinator.get_reading(device_id) if device_id else None
+    diagnostics["quota"] = coordinator._api.quota()
+    if (executor := hass.data[DOMAIN].get("executor")) is not None:
+        # The per phone_id statistics would reveal the other phone IDs
+        diagnostics["executor"] = {
+            key: value for key, value in executor.as_dict().items() if key != "by_name"
+        }
+    if (gateway := hass.data[DOMAIN].get("gateway")) is not None:
+        diagnostics["gateway"] = gateway.as_dict()
+    return diagnostics
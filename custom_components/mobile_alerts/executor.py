@@ -0,0 +1,153 @@
+"""Domain-wide fetch executor for the Mobile Alerts API."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any, Final, TypeVar
+
+import aiohttp
+
+from .api import create_session
+from .const import FETCH_MAX_CONCURRENT, FETCH_STAGGER_SECONDS
+from .rate_limit import RateLimiter
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class FetchExecutor:
+    """Run the API fetches of all coordinators (one per phone_id).
+
+    Every coordinator has its own timer, so with many phone_ids the fetches
+    either start at the same time or drift apart unevenly. The executor owns
+    the resources shared by all of them:
+
+    - the pooled HTTP session and the API quota tracker,
+    - a cap on the number of fetches that run at the same time,
+    - a minimum spacing between fetch starts, so timers that fire together are
+      staggered instead of opening a burst of connections,
+    - aggregate throughput and latency statistics.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = FETCH_MAX_CONCURRENT,
+        stagger_seconds: float = FETCH_STAGGER_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_concurrent: Max. number of fetches running at the same time
+            stagger_seconds: Min. time between the start of two fetches
+            clock: Monotonic time source in seconds (replaceable for tests)
+        """
+        self.rate_limiter = RateLimiter()
+        self._session: aiohttp.ClientSession | None = None
+        self._max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._stagger = stagger_seconds
+        self._clock = clock
+        self._next_start = 0.0
+        self._in_flight = 0
+        self._started_at = clock()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+            _LOGGER.debug("Mobile Alerts: Created shared API session")
+        return self._session
+
+    @property
+    def has_session(self) -> bool:
+        """Return True if the HTTP session is open."""
+        return self._session is not None and not self._session.closed
+
+    async def async_close(self) -> None:
+        """Close the HTTP session if it is open.
+
+        The statistics and the quota tracker are kept, a later fetch opens a
+        new session.
+        """
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+            _LOGGER.debug("Mobile Alerts: Closed shared API session")
+
+    async def _async_wait_for_slot(self) -> None:
+        """Wait until the fetch may start, at least the stagger after the last."""
+        now = self._clock()
+        start = max(now, self._next_start)
+        self._next_start = start + self._stagger
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def run(self, name: str, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a fetch within the concurrency cap and record its latency.
+
+        Args:
+            name: Name of the caller in the statistics (the phone_id)
+            fetch: Function that returns the fetch coroutine
+
+        Returns:
+            The result of the fetch
+
+        Raises:
+            Exception: Any error of the fetch is passed through
+        """
+        await self._async_wait_for_slot()
+        async with self._semaphore:
+            stats = self._stats.setdefault(
+                name,
+                {"fetches": 0, "failures": 0, "total_latency": 0.0, "max_latency": 0.0},
+            )
+            self._in_flight += 1
+            started = self._clock()
+            try:
+                return await fetch()
+            except Exception:
+                stats["failures"] += 1
+                raise
+            finally:
+                self._in_flight -= 1
+                latency = self._clock() - started
+                stats["fetches"] += 1
+                stats["total_latency"] += latency
+                stats["max_latency"] = max(stats["max_latency"], latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregate throughput and latency, e.g. for diagnostics."""
+        fetches = sum(stats["fetches"] for stats in self._stats.values())
+        total_latency = sum(stats["total_latency"] for stats in self._stats.values())
+        uptime = max(self._clock() - self._started_at, 1.0)
+        return {
+            "max_concurrent": self._max_concurrent,
+            "stagger_seconds": self._stagger,
+            "in_flight": self._in_flight,
+            "fetches": fetches,
+            "failures": sum(stats["failures"] for stats in self._stats.values()),
+            "fetches_per_minute": round(fetches * 60 / uptime, 2),
+            "avg_latency": round(total_latency / fetches, 3) if fetches else None,
+            "max_latency": round(
+                max((stats["max_latency"] for stats in self._stats.values()), default=0),
+                3,
+            ),
+            "by_name": {
+                name: {
+                    "fetches": stats["fetches"],
+                    "failures": stats["failures"],
+                    "avg_latency": round(
+                        stats["total_latency"] / stats["fetches"], 3
+                    )
+                    if stats["fetches"]
+                    else None,
+                    "max_latency": round(stats["max_latency"], 3),
+                }
+                for name, stats in self._stats.items()
+            },
+        }
@@ -0,0 +1,350 @@
+"""Local receiver for sensor packets of Mobile Alerts gateways (proxy mode).
+
+A gateway with a configured HTTP proxy sends each sensor packet to the proxy as
+soon as it arrives (PUT /gateway/put), instead of only to the cloud. This
+module decodes the packets into device records in the API format and pushes
+them to the coordinators, so entities update within a second and the cloud
+API is only polled as a fallback.
+
+Gateways cannot authenticate, so only uploads of the configured gateways are
+accepted: the gateway ID in the HTTP_IDENTIFY header (second field of
+"80XXXXXX:<gateway ID>:C0") and the peer address must both match.
+
+Packet layout (64 bytes, big endian):
+
+- 0: packet type
+- 1-4: time the gateway received the packet (epoch seconds, UTC)
+- 5: length of the checksummed part of the packet
+- 6-11: device ID (byte 6 is the sensor type ID)
+- 12-13: transmission counter of the sensor (wraps, not the cloud "idx")
+- 14-: current values, 2 bytes each
+- [length]: checksum, the sum of bytes 0 to length-1 & 0x7F
+"""
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+import time
+from typing import Any, Final
+
+import aiohttp
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import CONF_HOST, CONF_ID
+from homeassistant.core import HomeAssistant, callback
+
+from . import async_get_api_session
+from .const import (
+    API_TIMEOUT_SECONDS,
+    CONF_GATEWAY_FORWARD,
+    CONF_GATEWAY_FORWARD_URL,
+    CONF_GATEWAYS,
+    DOMAIN,
+    GATEWAY_CLOUD_URL,
+    GATEWAY_PACKET_SIZE,
+    GATEWAY_URL,
+)
+from .measurement import NOT_CONNECTED_VALUE, OUT_OF_RANGE_VALUE
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_HEADER_SIZE: Final = 14  # Up to and including the transmission counter
+
+
+class GatewayPacketError(ValueError):
+    """Raised for a truncated packet or a packet with a wrong checksum."""
+
+
+def decode_temperature(raw: int) -> float | int:
+    """Decode a 2 byte temperature value.
+
+    Returns:
+        Temperature in °C, or the API's special value for a sensor that is not
+        connected (bit 13) or out of range (bit 12)
+    """
+    if raw & 0x2000:
+        return NOT_CONNECTED_VALUE
+    if raw & 0x1000:
+        return OUT_OF_RANGE_VALUE
+    value = raw & 0x7FF
+    if value & 0x400:
+        value -= 0x800  # 11 bit two's complement
+    return value / 10
+
+
+def decode_humidity(raw: int) -> int:
+    """Decode a 2 byte humidity value in %."""
+    return raw & 0x7F
+
+
+# Current values of the packet per sensor type ID (first byte of the device
+# ID, see TYPE_ID_MODELS). Types that are missing here are left to the cloud
+# API polling.
+PACKET_LAYOUTS: Final[dict[str, tuple[tuple[str, Callable[[int], Any]], ...]]] = {
+    "02": (("t1", decode_temperature),),
+    "03": (("t1", decode_temperature), ("h", decode_humidity)),
+    "06": (
+        ("t1", decode_temperature),
+        ("t2", decode_temperature),
+        ("h", decode_humidity),
+    ),
+}
+
+
+def decode_packet(packet: bytes, received: int) -> dict[str, Any] | None:
+    """Decode a sensor packet into a device record in the API format.
+
+    Args:
+        packet: One packet of a gateway upload
+        received: Time the packet was received (epoch seconds), used as "c"
+
+    Returns:
+        The device record, or None if the sensor type is not supported. The
+        measurement has no "idx": the transmission counter of the packet is a
+        different sequence than the cloud's measurement index, so pushed
+        records are identified by "ts".
+
+    Raises:
+        GatewayPacketError: If the packet is truncated or its checksum is wrong
+    """
+    if len(packet) < GATEWAY_PACKET_SIZE:
+        raise GatewayPacketError(f"Truncated packet of {len(packet)} bytes")
+    length = packet[5]
+    if not _HEADER_SIZE <= length < GATEWAY_PACKET_SIZE:
+        raise GatewayPacketError(f"Invalid packet length {length}")
+    if sum(packet[:length]) & 0x7F != packet[length]:
+        raise GatewayPacketError("Invalid packet checksum")
+
+    device_id = packet[6:12].hex().upper()
+    layout = PACKET_LAYOUTS.get(device_id[:2])
+    if layout is None:
+        return None
+    if length < _HEADER_SIZE + 2 * len(layout):
+        raise GatewayPacketError(f"Packet too short for device {device_id}")
+
+    measurement: dict[str, Any] = {
+        "ts": int.from_bytes(packet[1:5], "big"),
+        "c": received,
+    }
+    for i, (key, decoder) in enumerate(layout):
+        offset = _HEADER_SIZE + 2 * i
+        measurement[key] = decoder(int.from_bytes(packet[offset : offset + 2], "big"))
+    return {"deviceid": device_id, "measurement": measurement}
+
+
+class GatewayReceiver:
+    """Decode gateway uploads and push them to the coordinators."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        gateways: dict[str, str],
+        forward: bool = False,
+        forward_url: str = GATEWAY_CLOUD_URL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the receiver.
+
+        Args:
+            hass: Home Assistant instance
+            gateways: IP address of each allowed gateway ID (upper case)
+            forward: Forward the uploads to the Mobile Alerts cloud, so the app
+                and the cloud API (fallback polling) keep getting the data
+            forward_url: Cloud endpoint the uploads are forwarded to
+            clock: Time source of the receive times (epoch seconds)
+
+        Raises:
+            ValueError: If no gateway is allowed
+        """
+        if not gateways:
+            raise ValueError("At least one gateway is required")
+        self._hass = hass
+        self._gateways = gateways
+        self.forward = forward
+        self._forward_url = forward_url
+        self._clock = clock
+        self._rejected = 0
+        self._uploads = 0
+        self._packets = 0
+        self._unsupported = 0
+        self._invalid = 0
+        self._forward_failures = 0
+        self._last_upload: float | None = None
+
+    def is_allowed(self, identify: str | None, remote: str | None) -> bool:
+        """Return True if an upload comes from a configured gateway.
+
+        Args:
+            identify: The HTTP_IDENTIFY header of the upload
+            remote: IP address of the peer
+        """
+        fields = (identify or "").split(":")
+        gateway_id = fields[1].upper() if len(fields) > 1 else None
+        if gateway_id is not None and self._gateways.get(gateway_id) == remote:
+            return True
+        self._rejected += 1
+        _LOGGER.warning(
+            "Rejected gateway upload from %s (HTTP_IDENTIFY %s)", remote, identify
+        )
+        return False
+
+    def decode_upload(self, body: bytes) -> tuple[list[dict[str, Any]], int]:
+        """Decode the packets of an upload.
+
+        Returns:
+            The newest device record per device ID of the supported sensor
+            types, and the number of valid packets (of all sensor types)
+        """
+        received = int(self._clock())
+        self._uploads += 1
+        self._last_upload = received
+        records: dict[str, dict[str, Any]] = {}
+        valid = 0
+        for offset in range(0, len(body), GATEWAY_PACKET_SIZE):
+            self._packets += 1
+            try:
+                record = decode_packet(
+                    body[offset : offset + GATEWAY_PACKET_SIZE], received
+                )
+            except GatewayPacketError as err:
+                self._invalid += 1
+                _LOGGER.debug("Skipping gateway packet at offset %d: %s", offset, err)
+                continue
+            valid += 1
+            if record is None:
+                self._unsupported += 1
+                continue
+            previous = records.get(record["deviceid"])
+            if (
+                previous is None
+                or previous["measurement"]["ts"] <= record["measurement"]["ts"]
+            ):
+                records[record["deviceid"]] = record
+        return list(records.values()), valid
+
+    @callback
+    def async_push(self, records: Iterable[dict[str, Any]]) -> int:
+        """Push decoded records to the coordinators of their devices.
+
+        Returns:
+            Number of coordinators that were updated
+        """
+        records = list(records)
+        if not records:
+            return 0
+        coordinators = self._hass.data.get(DOMAIN, {}).get("coordinators", {})
+        return sum(
+            coordinator.async_push_records(records)
+            for coordinator in coordinators.values()
+        )
+
+    async def async_forward(
+        self, body: bytes, headers: dict[str, str]
+    ) -> web.Response | None:
+        """Forward an upload to the cloud and return the cloud's response.
+
+        Returns:
+            The response for the gateway, or None if forwarding failed
+        """
+        try:
+            async with async_get_api_session(self._hass).put(
+                self._forward_url,
+                data=body,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS),
+            ) as response:
+                return web.Response(
+                    status=response.status,
+                    body=await response.read(),
+                    content_type=response.content_type,
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            self._forward_failures += 1
+            _LOGGER.warning("Could not forward gateway upload to the cloud: %s", err)
+            return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the receiver statistics, e.g. for diagnostics."""
+        return {
+            "gateways": len(self._gateways),
+            "forward": self.forward,
+            "rejected_uploads": self._rejected,
+            "uploads": self._uploads,
+            "packets": self._packets,
+            "unsupported_packets": self._unsupported,
+            "invalid_packets": self._invalid,
+            "forward_failures": self._forward_failures,
+            "last_upload": self._last_upload,
+        }
+
+
+class MobileAlertsGatewayView(HomeAssistantView):
+    """Endpoint for the uploads of gateways that use Home Assistant as proxy.
+
+    Gateways cannot authenticate, so the endpoint does not require auth.
+    Instead, uploads of gateways that are not configured are rejected, and the
+    packets only update the entities of devices that are set up.
+    """
+
+    url = GATEWAY_URL
+    name = "api:mobile_alerts:gateway"
+    requires_auth = False
+
+    def __init__(self, receiver: GatewayReceiver) -> None:
+        """Initialize the view."""
+        self._receiver = receiver
+
+    async def put(self, request: web.Request) -> web.Response:
+        """Handle an upload of a gateway."""
+        if not self._receiver.is_allowed(
+            request.headers.get("HTTP_IDENTIFY"), request.remote
+        ):
+            return web.Response(status=403)
+        body = await request.read()
+        records, valid = self._receiver.decode_upload(body)
+        # Entities first, the cloud round trip must not delay them
+        self._receiver.async_push(records)
+        if self._receiver.forward and valid:
+            headers = {
+                name: value
+                for name, value in request.headers.items()
+                if name.lower().startswith("http_") or name.lower() == "content-type"
+            }
+            response = await self._receiver.async_forward(body, headers)
+            if response is not None:
+                return response
+        return web.Response(status=200)
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Handle an upload of a gateway sent with POST."""
+        return await self.put(request)
+
+
+@callback
+def async_setup_gateway(
+    hass: HomeAssistant, gateway_config: dict[str, Any]
+) -> GatewayReceiver:
+    """Register the gateway endpoint.
+
+    Args:
+        hass: Home Assistant instance
+        gateway_config: The "gateway" YAML options, validated by
+            GATEWAY_SCHEMA (CONF_GATEWAYS with the id and host of each
+            allowed gateway, CONF_GATEWAY_FORWARD, CONF_GATEWAY_FORWARD_URL)
+
+    Returns:
+        The receiver, also stored as hass.data[DOMAIN]["gateway"]
+    """
+    receiver = GatewayReceiver(
+        hass,
+        gateways={
+            gateway[CONF_ID]: gateway[CONF_HOST]
+            for gateway in gateway_config[CONF_GATEWAYS]
+        },
+        forward=gateway_config[CONF_GATEWAY_FORWARD],
+        forward_url=gateway_config[CONF_GATEWAY_FORWARD_URL],
+    )
+    hass.data.setdefault(DOMAIN, {})["gateway"] = receiver
+    hass.http.register_view(MobileAlertsGatewayView(receiver))
+    _LOGGER.info("Mobile Alerts gateway receiver listening on %s", GATEWAY_URL)
+    return receiver
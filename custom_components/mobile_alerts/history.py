@@ -0,0 +1,181 @@
+"""In-memory measurement history with rolling statistics for Mobile Alerts."""
+
+from array import array
+import logging
+import math
+from typing import Final
+
+from .column_store import ColumnMeasurement
+from .const import HISTORY_SIZE
+from .measurement import Measurement
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Measurement keys with a history (numeric values with a physical unit)
+HISTORY_KEYS: Final = (
+    "t1",
+    "t2",
+    "t3",
+    "t4",
+    "h",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "ap",
+    "ppm",
+    "ws",
+    "wg",
+)
+
+STAT_MEAN: Final = "mean"
+STAT_MIN: Final = "min"
+STAT_MAX: Final = "max"
+STAT_TREND: Final = "trend"  # Least squares slope per hour
+STATISTICS: Final = (STAT_MEAN, STAT_MIN, STAT_MAX, STAT_TREND)
+STAT_SAMPLES: Final = "samples"
+
+
+class RingBuffer:
+    """Bounded history of (measurement time, value) pairs in flat arrays.
+
+    The arrays are allocated once with the full capacity, and the oldest
+    sample is overwritten when the buffer is full. The statistics are cached
+    until the next sample is added.
+    """
+
+    def __init__(self, capacity: int = HISTORY_SIZE) -> None:
+        """Initialize the buffer.
+
+        Args:
+            capacity: Max. number of samples
+        """
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._capacity = capacity
+        self._next = 0
+        self._count = 0
+        self._stats: dict[str, float | int | None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, overwriting the oldest one if the buffer is full."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+        self._stats = None
+
+    def samples(self) -> list[tuple[float, float]]:
+        """Return the samples from oldest to newest."""
+        start = (self._next - self._count) % self._capacity
+        return [
+            (
+                self._times[(start + i) % self._capacity],
+                self._values[(start + i) % self._capacity],
+            )
+            for i in range(self._count)
+        ]
+
+    def statistics(self) -> dict[str, float | int | None]:
+        """Return mean, min, max and trend (per hour) of the samples.
+
+        Returns:
+            dict with the STATISTICS keys and the number of samples. A value
+            is None while there are not enough samples (the trend needs two
+            samples at different times).
+        """
+        if self._stats is not None:
+            return self._stats
+        if not self._count:
+            self._stats = {**dict.fromkeys(STATISTICS), STAT_SAMPLES: 0}
+            return self._stats
+
+        # The buffer is either full or filled from index 0
+        times = self._times[: self._count]
+        values = self._values[: self._count]
+        mean = math.fsum(values) / self._count
+        mean_time = math.fsum(times) / self._count
+        covariance = math.fsum(
+            (time - mean_time) * (value - mean)
+            for time, value in zip(times, values)
+        )
+        variance = math.fsum((time - mean_time) ** 2 for time in times)
+        self._stats = {
+            STAT_MEAN: mean,
+            STAT_MIN: min(values),
+            STAT_MAX: max(values),
+            STAT_TREND: covariance / variance * 3600 if variance else None,
+            STAT_SAMPLES: self._count,
+        }
+        return self._stats
+
+
+class HistoryStore:
+    """History buffers per device and measurement key.
+
+    Filled by the coordinator with every new measurement (new ts), so rolling
+    statistics are available without querying the recorder database. New
+    measurements are detected by "ts", not "idx": records pushed by a local
+    gateway keep the cloud "idx" of the previous measurement.
+    """
+
+    def __init__(self, capacity: int = HISTORY_SIZE) -> None:
+        """Initialize the history store.
+
+        Args:
+            capacity: Max. number of samples per device and measurement key
+        """
+        self._capacity = capacity
+        self._buffers: dict[tuple[str, str], RingBuffer] = {}
+        self._last_ts: dict[str, int] = {}
+
+    def observe(
+        self, device_id: str, measurement: Measurement | ColumnMeasurement
+    ) -> bool:
+        """Add the values of a measurement if it is new.
+
+        Args:
+            device_id: The device ID
+            measurement: Decoded measurement of the device
+
+        Returns:
+            True if the measurement was added
+        """
+        timestamp = measurement.ts
+        if not isinstance(timestamp, int):
+            return False
+        last_ts = self._last_ts.get(device_id)
+        if last_ts is not None and timestamp <= last_ts:
+            return False
+        self._last_ts[device_id] = timestamp
+
+        for key in HISTORY_KEYS:
+            value = measurement.get(key)
+            # Skips missing keys and the not connected / out of range states
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            buffer = self._buffers.get((device_id, key))
+            if buffer is None:
+                buffer = self._buffers[(device_id, key)] = RingBuffer(self._capacity)
+            buffer.append(float(timestamp), float(value))
+        return True
+
+    def statistics(
+        self, device_id: str, key: str
+    ) -> dict[str, float | int | None] | None:
+        """Return the rolling statistics of a measurement key of a device.
+
+        Returns:
+            dict with the STATISTICS keys, or None if there is no history
+        """
+        buffer = self._buffers.get((device_id, key))
+        return buffer.statistics() if buffer is not None else None
+
+    def sample_count(self, device_id: str, key: str) -> int:
+        """Return the number of samples of a measurement key of a device."""
+        buffer = self._buffers.get((device_id, key))
+        return len(buffer) if buffer is not None else 0
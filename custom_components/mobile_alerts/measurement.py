@@ -0,0 +1,235 @@
+"""Typed measurement records decoded from Mobile Alerts API device records."""
+
+from datetime import datetime, timezone
+import logging
+from typing import Any, Final
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+# Special measurement values (see docs/api_documentation.md)
+NOT_CONNECTED_VALUE: Final = 43530
+OUT_OF_RANGE_VALUE: Final = 65295
+
+
+class SpecialValue:
+    """Status reported by the API instead of a measured value."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        """Initialize the special value.
+
+        Args:
+            name: Name of the status, e.g. for state attributes
+        """
+        self.name = name
+
+    def __repr__(self) -> str:
+        """Return the name of the status."""
+        return f"<{self.name}>"
+
+
+NOT_CONNECTED: Final = SpecialValue("not_connected")
+OUT_OF_RANGE: Final = SpecialValue("out_of_range")
+
+# Measurement keys by type
+FLOAT_FIELDS: Final = (
+    "t1",
+    "t2",
+    "t3",
+    "t4",
+    "h",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "r",
+    "ws",
+    "wg",
+    "ap",
+)
+INT_FIELDS: Final = (
+    "rf",
+    "wd",
+    "ppm",
+    "kp1t",
+    "kp1c",
+    "kp2t",
+    "kp2c",
+    "kp3t",
+    "kp3c",
+    "kp4t",
+    "kp4c",
+)
+BOOL_FIELDS: Final = ("w",)
+# Sensor values that can be reported as 43530 / 65295. Counters and totals
+# (rain "r" and "rf", key presses, ppm) can legitimately reach these values.
+SPECIAL_VALUE_FIELDS: Final = frozenset(
+    ("t1", "t2", "t3", "t4", "h", "h1", "h2", "h3", "h4", "ws", "wg", "wd", "ap")
+)
+# Values converted from a measurement key
+DERIVED_FIELDS: Final = ("wd_degrees",)
+MEASUREMENT_FIELDS: Final = frozenset(
+    FLOAT_FIELDS + INT_FIELDS + BOOL_FIELDS + DERIVED_FIELDS
+)
+
+WIND_DIRECTION_DEGREES: Final = 22.5  # wd is one of 16 compass points
+
+
+def wind_direction_degrees(wd: Any) -> Any:
+    """Convert a decoded wind direction (0-15) to degrees (0-337.5)."""
+    if isinstance(wd, SpecialValue) or wd is None:
+        return wd
+    if 0 <= wd <= 15:
+        return round(wd * WIND_DIRECTION_DEGREES, 1)
+    return None
+
+
+def _decode_number(
+    device_id: str, key: str, value: Any, number_type: type, special: bool = True
+) -> Any:
+    """Decode a numeric measurement value, mapping the special values.
+
+    Args:
+        device_id: The device ID (for logging)
+        key: The measurement key (for logging)
+        value: The raw value, a number or a numeric string
+        number_type: float or int
+        special: Map 43530 and 65295 to NOT_CONNECTED and OUT_OF_RANGE
+
+    Returns:
+        The typed value, a SpecialValue, or None if the value is invalid
+    """
+    try:
+        number = number_type(float(value))
+    except (TypeError, ValueError, OverflowError):
+        _LOGGER.warning("Invalid value for %s of device %s: %s", key, device_id, value)
+        return None
+    if not special:
+        return number
+    if number == NOT_CONNECTED_VALUE:
+        return NOT_CONNECTED
+    if number == OUT_OF_RANGE_VALUE:
+        return OUT_OF_RANGE
+    return number
+
+
+def decode_bool(value: Any) -> bool:
+    """Decode a flag that the API sends as bool, int or string."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+def decode_timestamp(device_id: str, value: Any) -> datetime | None:
+    """Decode an epoch or ISO timestamp into an aware datetime (UTC)."""
+    try:
+        if isinstance(value, str):
+            try:
+                timestamp = datetime.fromisoformat(value)
+            except ValueError:
+                return datetime.fromtimestamp(float(value), tz=timezone.utc)
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            return timestamp
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    except (ValueError, TypeError, OSError, OverflowError) as err:
+        _LOGGER.warning(
+            "Could not parse last seen timestamp %s of device %s: %s",
+            value,
+            device_id,
+            err,
+        )
+        return None
+
+
+class Measurement:
+    """Last measurement of a device, decoded once per poll.
+
+    Entities used to parse the raw API record on every state write (float and
+    int casts, timestamp parsing). The record is decoded once into typed
+    fields instead, so entities just read them. A field is None if the device
+    did not report it, and NOT_CONNECTED or OUT_OF_RANGE for the special
+    values 43530 and 65295 of the SPECIAL_VALUE_FIELDS.
+    """
+
+    __slots__ = (
+        "device_id",
+        "idx",
+        "ts",
+        "c",
+        "last_seen",
+        "low_battery",
+        *FLOAT_FIELDS,
+        *INT_FIELDS,
+        *BOOL_FIELDS,
+        *DERIVED_FIELDS,
+    )
+
+    def __init__(self, device_id: str) -> None:
+        """Initialize an empty measurement.
+
+        Args:
+            device_id: The device ID
+        """
+        self.device_id = device_id
+        self.idx: int | None = None
+        self.ts: int | None = None
+        self.c: int | None = None
+        self.last_seen: datetime | None = None
+        self.low_battery: bool | None = None
+        for key in MEASUREMENT_FIELDS:
+            setattr(self, key, None)
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any] | None) -> "Measurement | None":
+        """Decode the measurement of an API device record.
+
+        Args:
+            record: Device record as returned by the API
+
+        Returns:
+            The decoded measurement, or None if the record has no measurement
+        """
+        if not record or "measurement" not in record:
+            return None
+        device_id = record.get("deviceid", "")
+        measurement = cls(device_id)
+        for key, value in record["measurement"].items():
+            if value is None:
+                continue
+            if key in FLOAT_FIELDS or key in INT_FIELDS:
+                setattr(
+                    measurement,
+                    key,
+                    _decode_number(
+                        device_id,
+                        key,
+                        value,
+                        float if key in FLOAT_FIELDS else int,
+                        special=key in SPECIAL_VALUE_FIELDS,
+                    ),
+                )
+            elif key in BOOL_FIELDS:
+                setattr(measurement, key, decode_bool(value))
+            elif key in ("idx", "ts"):
+                setattr(
+                    measurement,
+                    key,
+                    _decode_number(device_id, key, value, int, special=False),
+                )
+            elif key == "c":
+                # Time the server received the measurement: last seen
+                measurement.last_seen = decode_timestamp(device_id, value)
+                if measurement.last_seen is not None:
+                    measurement.c = int(measurement.last_seen.timestamp())
+            elif key == "lowbattery":
+                measurement.low_battery = decode_bool(value)
+        measurement.wd_degrees = wind_direction_degrees(measurement.wd)
+        return measurement
+
+    def get(self, key: str) -> Any:
+        """Return the value of a measurement key, None if it is not decoded."""
+        if key in MEASUREMENT_FIELDS:
+            return getattr(self, key)
+        return None
@@ -0,0 +1,179 @@
+"""Rain rate and rain totals derived from the Mobile Alerts rain flip counter."""
+
+from datetime import datetime, tzinfo
+import logging
+from typing import Any, Final
+
+from .const import RAIN_MM_PER_FLIP
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class RainTracker:
+    """Incremental rain rate and hourly / daily totals of one rain gauge.
+
+    Each new measurement adds the flips since the previous one ("rf" delta),
+    so an update is O(1) and needs no history:
+
+    - A counter that went down was reset (e.g. battery change), the new value
+      counts the flips since the reset.
+    - After missed polls the delta covers several uploads. The rate is the
+      average over the whole gap, and a gap that crosses the start of the
+      current hour or day only adds the share of the flips after it,
+      assuming a constant rain rate within the gap.
+    """
+
+    def __init__(self, time_zone: tzinfo) -> None:
+        """Initialize the tracker.
+
+        Args:
+            time_zone: Time zone of the hour and day boundaries
+        """
+        self._time_zone = time_zone
+        self._last_flips: int | None = None
+        self._last_ts: float | None = None
+        self._rate: float | None = None
+        self._hour_start = 0.0
+        self._hour_total = 0.0
+        self._day_start = 0.0
+        self._day_total = 0.0
+
+    def _period_starts(self, timestamp: float) -> tuple[float, float]:
+        """Return the start of the hour and of the day of a timestamp."""
+        local = datetime.fromtimestamp(timestamp, tz=self._time_zone)
+        hour = local.replace(minute=0, second=0, microsecond=0)
+        day = hour.replace(hour=0)
+        return hour.timestamp(), day.timestamp()
+
+    def update(self, flips: int, timestamp: float) -> None:
+        """Add a new measurement of the flip counter.
+
+        Args:
+            flips: The flip counter ("rf")
+            timestamp: Measurement time ("ts", epoch seconds)
+        """
+        last_flips, last_ts = self._last_flips, self._last_ts
+        if last_ts is not None and timestamp <= last_ts:
+            return
+        self._last_flips = flips
+        self._last_ts = timestamp
+        hour_start, day_start = self._period_starts(timestamp)
+
+        if last_flips is None or last_ts is None:
+            # First measurement: only the baseline of the counter is known
+            self._hour_start, self._day_start = hour_start, day_start
+            return
+
+        if flips < last_flips:
+            _LOGGER.debug("Rain counter reset from %d to %d", last_flips, flips)
+            delta = flips
+        else:
+            delta = flips - last_flips
+        rain = delta * RAIN_MM_PER_FLIP
+        elapsed = timestamp - last_ts
+        self._rate = rain * 3600 / elapsed
+
+        if hour_start != self._hour_start:
+            self._hour_start = hour_start
+            self._hour_total = 0.0
+        if day_start != self._day_start:
+            self._day_start = day_start
+            self._day_total = 0.0
+        self._hour_total += rain * min((timestamp - hour_start) / elapsed, 1.0)
+        self._day_total += rain * min((timestamp - day_start) / elapsed, 1.0)
+
+    def values(self, now: float) -> dict[str, float | None]:
+        """Return the rain rate and totals.
+
+        Args:
+            now: Current time (epoch seconds). A total of an hour or day that
+                has ended without a new measurement is reported as 0.
+
+        Returns:
+            dict with rate (mm/h), hour and today (mm). Values are None until
+            a second measurement arrived.
+        """
+        if self._rate is None:
+            return {"rate": None, "hour": None, "today": None}
+        hour_start, day_start = self._period_starts(now)
+        hour_total = self._hour_total if hour_start <= self._hour_start else 0.0
+        day_total = self._day_total if day_start <= self._day_start else 0.0
+        return {
+            "rate": round(self._rate, 2),
+            "hour": round(hour_total, 3),
+            "today": round(day_total, 3),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the tracker, e.g. to persist it."""
+        return {
+            "flips": self._last_flips,
+            "ts": self._last_ts,
+            "rate": self._rate,
+            "hour_start": self._hour_start,
+            "hour_total": self._hour_total,
+            "day_start": self._day_start,
+            "day_total": self._day_total,
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """Restore the state returned by as_dict()."""
+        self._last_flips = state.get("flips")
+        self._last_ts = state.get("ts")
+        self._rate = state.get("rate")
+        self._hour_start = state.get("hour_start", 0.0)
+        self._hour_total = state.get("hour_total", 0.0)
+        self._day_start = state.get("day_start", 0.0)
+        self._day_total = state.get("day_total", 0.0)
+
+
+class RainEngine:
+    """Rain trackers of all rain gauges of a coordinator."""
+
+    def __init__(self, time_zone: tzinfo) -> None:
+        """Initialize the engine.
+
+        Args:
+            time_zone: Time zone of the hour and day boundaries
+        """
+        self._time_zone = time_zone
+        self._trackers: dict[str, RainTracker] = {}
+
+    def observe(self, device_id: str, flips: Any, timestamp: Any) -> None:
+        """Add a measurement of a device if it has a rain flip counter.
+
+        Args:
+            device_id: The device ID
+            flips: Decoded "rf" value (int, or None / special value)
+            timestamp: Decoded "ts" value
+        """
+        if (
+            isinstance(flips, bool)
+            or not isinstance(flips, int)
+            or not isinstance(timestamp, int)
+        ):
+            return
+        tracker = self._trackers.get(device_id)
+        if tracker is None:
+            tracker = self._trackers[device_id] = RainTracker(self._time_zone)
+        tracker.update(flips, timestamp)
+
+    def values(self, device_id: str, now: float) -> dict[str, float | None] | None:
+        """Return the rain rate and totals of a device, None if it has no counter."""
+        tracker = self._trackers.get(device_id)
+        return tracker.values(now) if tracker is not None else None
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the state of all trackers, e.g. to persist it."""
+        return {
+            device_id: tracker.as_dict()
+            for device_id, tracker in self._trackers.items()
+        }
+
+    def restore(self, states: dict[str, dict[str, Any]]) -> None:
+        """Restore trackers from as_dict(). Existing trackers are kept."""
+        for device_id, state in states.items():
+            if device_id in self._trackers:
+                continue
+            tracker = self._trackers[device_id] = RainTracker(self._time_zone)
+            tracker.restore(state)
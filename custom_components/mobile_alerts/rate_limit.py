@@ -0,0 +1,164 @@
+"""Client-side rate limiting for the Mobile Alerts API."""
+
+from collections import deque
+from collections.abc import Callable, Iterable
+import logging
+import time
+from typing import Any, Final
+
+from .const import (
+    API_INVALID_CALL_LIMIT,
+    API_INVALID_CALL_WINDOW_SECONDS,
+    API_RATE_LIMIT_CALLS,
+    API_RATE_LIMIT_WINDOW_SECONDS,
+)
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Track the documented API quotas before a request is sent.
+
+    The Mobile Alerts API allows 3 calls per sensor within one minute (more calls
+    block the sensor for 7 minutes with HTTP 429), and more than 5 invalid calls
+    from one IP address within 15 minutes block the IP (HTTP 403).
+
+    Every sensor has a token bucket with API_RATE_LIMIT_CALLS tokens. Each call
+    spends one token, and a token is returned exactly
+    API_RATE_LIMIT_WINDOW_SECONDS after it was spent, so the bucket can never
+    allow more calls than the server accepts within any window.
+
+    Device IDs that the API returned data for are remembered as verified:
+    calls for them cannot be invalid, so they are not held back when the
+    invalid call budget is used up (see needs_invalid_call_budget()).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            clock: Monotonic time source in seconds (replaceable for tests)
+        """
+        self._clock = clock
+        self._calls: dict[str, deque[float]] = {}
+        self._invalid_calls: deque[float] = deque()
+        self._blocked_until: dict[str, float] = {}
+        self._ip_blocked_until = 0.0
+        self._verified: set[str] = set()
+
+    def _prune(self, calls: deque[float], window: float, now: float) -> None:
+        """Drop call timestamps that are outside the window."""
+        while calls and calls[0] <= now - window:
+            calls.popleft()
+
+    def tokens_left(self, device_id: str) -> int:
+        """Return the number of calls the device can make right now."""
+        now = self._clock()
+        if self._blocked_until.get(device_id, 0.0) > now:
+            return 0
+        calls = self._calls.get(device_id)
+        if not calls:
+            return API_RATE_LIMIT_CALLS
+        self._prune(calls, API_RATE_LIMIT_WINDOW_SECONDS, now)
+        return API_RATE_LIMIT_CALLS - len(calls)
+
+    def delay_for(self, device_ids: Iterable[str]) -> float:
+        """Return the seconds to wait until all devices have a token left.
+
+        Args:
+            device_ids: The device IDs of the planned request
+
+        Returns:
+            0.0 if the request can be sent right away
+        """
+        now = self._clock()
+        delay = 0.0
+        for device_id in device_ids:
+            delay = max(delay, self._blocked_until.get(device_id, 0.0) - now)
+            calls = self._calls.get(device_id)
+            if not calls:
+                continue
+            self._prune(calls, API_RATE_LIMIT_WINDOW_SECONDS, now)
+            if len(calls) >= API_RATE_LIMIT_CALLS:
+                # Wait until the oldest call that blocks us leaves the window
+                blocking_call = calls[len(calls) - API_RATE_LIMIT_CALLS]
+                delay = max(
+                    delay, blocking_call + API_RATE_LIMIT_WINDOW_SECONDS - now
+                )
+        return delay
+
+    def acquire(self, device_ids: Iterable[str]) -> None:
+        """Spend one token for each device of a request that is sent now."""
+        now = self._clock()
+        for device_id in device_ids:
+            self._calls.setdefault(device_id, deque()).append(now)
+
+    def block_devices(self, device_ids: Iterable[str], seconds: float) -> None:
+        """Mark devices as blocked by the server (HTTP 429)."""
+        until = self._clock() + seconds
+        for device_id in device_ids:
+            self._blocked_until[device_id] = until
+
+    def block_ip(self, seconds: float) -> None:
+        """Mark this IP address as blocked by the server (HTTP 403)."""
+        self._ip_blocked_until = self._clock() + seconds
+
+    def ip_blocked_for(self) -> float:
+        """Return the seconds left until the IP address block ends."""
+        return max(self._ip_blocked_until - self._clock(), 0.0)
+
+    def record_invalid_call(self) -> None:
+        """Count a call that the server rejected as invalid."""
+        self._invalid_calls.append(self._clock())
+        _LOGGER.warning(
+            "Mobile Alerts API rejected a call as invalid, %d of %d invalid calls "
+            "left within %d minutes",
+            self.invalid_calls_left(),
+            API_INVALID_CALL_LIMIT,
+            API_INVALID_CALL_WINDOW_SECONDS // 60,
+        )
+
+    def invalid_budget_resets_in(self) -> float:
+        """Return the seconds until the oldest invalid call leaves the window."""
+        if self.invalid_calls_left() > 0:
+            return 0.0
+        return max(
+            self._invalid_calls[0] + API_INVALID_CALL_WINDOW_SECONDS - self._clock(),
+            0.0,
+        )
+
+    def mark_verified(self, device_ids: Iterable[str]) -> None:
+        """Remember device IDs that the API returned data for."""
+        self._verified.update(device_ids)
+
+    def needs_invalid_call_budget(self, device_ids: Iterable[str]) -> bool:
+        """Return True if a call for the devices could be rejected as invalid.
+
+        Args:
+            device_ids: The device IDs of the planned call
+        """
+        return not self._verified.issuperset(device_ids)
+
+    def invalid_calls_left(self) -> int:
+        """Return how many invalid calls are left before the IP is blocked."""
+        self._prune(
+            self._invalid_calls, API_INVALID_CALL_WINDOW_SECONDS, self._clock()
+        )
+        return max(API_INVALID_CALL_LIMIT - len(self._invalid_calls), 0)
+
+    def as_dict(self, device_ids: Iterable[str]) -> dict[str, Any]:
+        """Return the remaining quota, e.g. for diagnostics.
+
+        Args:
+            device_ids: The device IDs to report
+
+        Returns:
+            dict with the invalid call budget and the tokens left per device
+        """
+        return {
+            "invalid_calls_left": self.invalid_calls_left(),
+            "ip_blocked_for": round(self.ip_blocked_for()),
+            "devices": {
+                device_id: self.tokens_left(device_id) for device_id in device_ids
+            },
+        }
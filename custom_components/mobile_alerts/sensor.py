@@ -14,15 +14,26 @@ from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
+from . import (
+    async_get_api_session,
+    async_get_fetch_executor,
+    async_get_rate_limiter,
+)
 from .api import MobileAlertsApi
 from .const import (
+    ATTRIBUTE_POLICIES,
+    CONF_ATTRIBUTES,
     CONF_DEVICES,
     CONF_PHONE_ID,
     CONF_MODEL_ID,
+    DEFAULT_ATTRIBUTES,
     DOMAIN,
     SCAN_INTERVAL_MINUTES,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
 from .coordinator import MobileAlertsCoordinator
 from .device import DEVICE_MODELS, get_sensor_type_override
@@ -40,6 +51,9 @@ from .sensor_classes import (
     MobileAlertsWindDirectionSensor,
     MobileAlertsWindSpeedSensor,
     MobileAlertsWindGustSensor,
+    rain_sensors,
+    statistic_sensors,
+    wind_sensors,
 )
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -58,6 +72,9 @@ PLATFORM_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_PHONE_ID): cv.string,
         vol.Required(CONF_DEVICES): vol.All(cv.ensure_list, [SENSOR_SCHEMA]),
+        vol.Optional(CONF_ATTRIBUTES, default=DEFAULT_ATTRIBUTES): vol.In(
+            ATTRIBUTE_POLICIES
+        ),
     },
     extra=vol.ALLOW_EXTRA,
 )
@@ -97,6 +114,21 @@ MEASUREMENT_TYPE_MAP = {
 }
 
 
+def _seed_device_data(
+    hass: HomeAssistant, coordinator: MobileAlertsCoordinator, device_id: str
+) -> bool:
+    """Hand over device data that the config flow already fetched.
+
+    Returns:
+        True if the device was seeded
+    """
+    device_data = hass.data[DOMAIN].get("seed_devices", {}).pop(device_id, None)
+    if device_data is None:
+        return False
+    coordinator.seed_device(device_data)
+    return True
+
+
 async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
@@ -112,7 +144,11 @@ async def async_setup_platform(
     if not phone_id:
         phone_id = "ui_devices"
 
-    devices_config = config.get(CONF_DEVICES, [])
+    attributes = config.get(CONF_ATTRIBUTES, DEFAULT_ATTRIBUTES)
+    devices_config = [
+        {**device, CONF_ATTRIBUTES: attributes}
+        for device in config.get(CONF_DEVICES, [])
+    ]
 
     # Check for duplicate device IDs in config entries
     duplicate_device_ids = set()
@@ -157,8 +193,12 @@ async def async_setup_platform(
         _LOGGER.warning("No devices configured in YAML")
         return
 
-    # Create API instance
-    api = MobileAlertsApi(phone_id)
+    # Create API instance on the shared session
+    api = MobileAlertsApi(
+        phone_id,
+        session=async_get_api_session(hass),
+        rate_limiter=async_get_rate_limiter(hass),
+    )
 
     # Register all devices with API and build device info mapping
     device_info_map = {}  # Maps device_id to device info
@@ -198,7 +238,9 @@ async def async_setup_platform(
         hass.data[DOMAIN]["coordinators_by_entry"] = {}
 
     if phone_id not in hass.data[DOMAIN]["coordinators"]:
-        coordinator = MobileAlertsCoordinator(hass, api)
+        coordinator = MobileAlertsCoordinator(
+            hass, api, executor=async_get_fetch_executor(hass)
+        )
         hass.data[DOMAIN]["coordinators"][phone_id] = coordinator
         await coordinator.async_refresh()
         _LOGGER.debug(
@@ -225,6 +267,18 @@ async def async_setup_platform(
             sensors.append(
                 sensor_class(coordinator, device, device_info_map[device_id])
             )
+            # Optional rolling statistics (disabled by default)
+            sensors.extend(
+                statistic_sensors(coordinator, device, device_info_map[device_id])
+            )
+            # Rain rate and totals derived from the rain flip counter
+            sensors.extend(
+                rain_sensors(coordinator, device, device_info_map[device_id])
+            )
+            # Wind statistics of the recent measurements
+            sensors.extend(
+                wind_sensors(coordinator, device, device_info_map[device_id])
+            )
 
         # Special case: Wind direction has two sensors (text + degrees)
         if device_type == "wd":
@@ -272,6 +326,7 @@ async def async_setup_entry(
 
     entry_data = config_entry.data
     phone_id = entry_data.get(CONF_PHONE_ID, "")
+    attributes = config_entry.options.get(CONF_ATTRIBUTES, DEFAULT_ATTRIBUTES)
 
     # Treat empty phone_id same as "ui_devices" (UI-configured devices)
     if not phone_id:
@@ -324,14 +379,36 @@ async def async_setup_entry(
 
         if phone_id not in hass.data[DOMAIN]["coordinators"]:
             # Create new API instance for new coordinator
-            api = MobileAlertsApi(phone_id=phone_id)
-            await api.register_device(device_id)
-            coordinator = MobileAlertsCoordinator(hass, api)
+            api = MobileAlertsApi(
+                phone_id=phone_id,
+                session=async_get_api_session(hass),
+                rate_limiter=async_get_rate_limiter(hass),
+            )
+            coordinator = MobileAlertsCoordinator(
+                hass,
+                api,
+                store=Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{phone_id}"),
+                executor=async_get_fetch_executor(hass),
+            )
+            # Store the coordinator before awaiting anything, so entries set up
+            # concurrently reuse it and their registrations are coalesced
             hass.data[DOMAIN]["coordinators"][phone_id] = coordinator
             hass.data[DOMAIN]["coordinators_by_entry"][config_entry.entry_id] = (
                 coordinator
             )
-            await coordinator.async_config_entry_first_refresh()
+            # Devices in the snapshot or discovered by the config flow get their
+            # last known values right away and are not fetched by register_device
+            restored = await coordinator.async_restore_snapshot()
+            seeded = _seed_device_data(hass, coordinator, device_id)
+            await api.register_device(device_id)
+            if restored or seeded:
+                config_entry.async_create_background_task(
+                    hass,
+                    coordinator.async_refresh(),
+                    f"{DOMAIN} refresh {phone_id}",
+                )
+            else:
+                await coordinator.async_config_entry_first_refresh()
             _LOGGER.debug("Created new coordinator for phone_id=%s", phone_id)
         else:
             # Reuse existing coordinator and API
@@ -339,7 +416,10 @@ async def async_setup_entry(
             hass.data[DOMAIN]["coordinators_by_entry"][config_entry.entry_id] = (
                 coordinator
             )
-            # Register device and fetch its data
+            # Register device and fetch its data (batched with other entries),
+            # unless the snapshot already has it
+            await coordinator.async_restore_snapshot()
+            _seed_device_data(hass, coordinator, device_id)
             await coordinator._api.register_device(device_id)
             _LOGGER.debug(
                 "Reusing existing coordinator for phone_id=%s, registered device %s",
@@ -409,6 +489,7 @@ async def async_setup_entry(
                 CONF_DEVICE_ID: device_id,
                 CONF_NAME: device_name,
                 CONF_TYPE: sensor_type,  # Store sensor type (may be overridden, e.g., "water" for MA10350 t2)
+                CONF_ATTRIBUTES: attributes,
             }
 
             _LOGGER.debug(
@@ -420,6 +501,14 @@ async def async_setup_entry(
             if sensor_type in MEASUREMENT_TYPE_MAP:
                 sensor_class = MEASUREMENT_TYPE_MAP[sensor_type]
                 entities.append(sensor_class(coordinator, device_config, device_info))
+                # Optional rolling statistics (disabled by default)
+                entities.extend(
+                    statistic_sensors(coordinator, device_config, device_info)
+                )
+                # Rain rate and totals derived from the rain flip counter
+                entities.extend(rain_sensors(coordinator, device_config, device_info))
+                # Wind statistics of the recent measurements
+                entities.extend(wind_sensors(coordinator, device_config, device_info))
                 _LOGGER.debug(
                     "Created sensor from model %s: %s (API key: %s)",
                     model_id,
@@ -439,6 +528,7 @@ async def async_setup_entry(
                 CONF_DEVICE_ID: device_id,
                 CONF_NAME: device_name,
                 CONF_TYPE: "wd_degrees",
+                CONF_ATTRIBUTES: attributes,
             }
             entities.append(
                 MobileAlertsWindDirectionDegreesSensor(
@@ -457,6 +547,7 @@ async def async_setup_entry(
                     CONF_DEVICE_ID: device_id,
                     CONF_NAME: device_name,
                     CONF_TYPE: "battery",
+                    CONF_ATTRIBUTES: attributes,
                 },
                 device_info,
             )
@@ -468,6 +559,7 @@ async def async_setup_entry(
                     CONF_DEVICE_ID: device_id,
                     CONF_NAME: device_name,
                     CONF_TYPE: "last_seen",
+                    CONF_ATTRIBUTES: attributes,
                 },
                 device_info,
             )
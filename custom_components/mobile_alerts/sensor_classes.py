@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 import logging
-from typing import Final, cast
+from typing import Any, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -18,22 +18,161 @@ from homeassistant.const import (
     CONF_DEVICE_ID,
     CONF_NAME,
     CONF_TYPE,
+    DEGREE,
     PERCENTAGE,
     STATE_UNKNOWN,
     UnitOfLength,
     UnitOfSpeed,
     UnitOfTemperature,
+    UnitOfVolumetricFlux,
 )
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION
+from .column_store import ColumnMeasurement
+from .const import (
+    ATTRIBUTES_FULL,
+    ATTRIBUTES_NONE,
+    ATTRIBUTION,
+    CONF_ATTRIBUTES,
+    DEFAULT_ATTRIBUTES,
+)
 from .coordinator import MobileAlertsCoordinator
+from .device import ALERT_FLAG_SUFFIXES
+from .history import (
+    HISTORY_KEYS,
+    STAT_MAX,
+    STAT_MEAN,
+    STAT_MIN,
+    STAT_SAMPLES,
+    STAT_TREND,
+)
+from .measurement import MEASUREMENT_FIELDS, Measurement, SpecialValue
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# State attribute of entities while the coordinator serves stale data
+STALE_ATTRIBUTE: Final = "stale"
+
+
+def build_state_attributes(
+    data: dict[str, Any] | None,
+    measurement_key: str,
+    policy: str,
+    stale: bool = False,
+) -> dict[str, Any]:
+    """Build the state attributes of an entity from its device record.
+
+    Every state write stores the attributes in the recorder, so by default only
+    the fields relevant to the entity are exposed. The raw record is available
+    through the diagnostics.
+
+    Args:
+        data: Device record from the API, or None if not available
+        measurement_key: API measurement key of the entity (e.g. "t1")
+        policy: ATTRIBUTES_COMPACT, ATTRIBUTES_NONE or ATTRIBUTES_FULL
+        stale: The record is the last good data served during an API block or
+            restored at startup. Adds "stale": True with every policy.
+
+    Returns:
+        dict of state attributes
+    """
+    if data is None:
+        return {}
+    stale_attributes = {STALE_ATTRIBUTE: True} if stale else {}
+    if policy == ATTRIBUTES_NONE:
+        return stale_attributes
+    if policy == ATTRIBUTES_FULL:
+        return {**data, **stale_attributes} if stale else data
+
+    measurement = data.get("measurement") or {}
+    attributes: dict[str, Any] = {
+        "deviceid": data.get("deviceid"),
+        "idx": measurement.get("idx"),
+        "ts": measurement.get("ts"),
+    }
+    # Alert flags of this measurement, e.g. t1hi / t1lo for t1
+    for key, value in measurement.items():
+        if (
+            measurement_key
+            and key.startswith(measurement_key)
+            and key[len(measurement_key) :] in ALERT_FLAG_SUFFIXES
+        ):
+            attributes[key] = value
+    attributes.update(stale_attributes)
+    return attributes
+
+
+def read_measurement_value(
+    measurement: Measurement | ColumnMeasurement,
+    data: dict[str, Any],
+    measurement_key: str,
+) -> tuple[Any, bool]:
+    """Read the value of an entity from the decoded measurement.
+
+    Args:
+        measurement: Decoded measurement of the device
+        data: Device record from the API, for keys without a typed field
+        measurement_key: API measurement key of the entity, "" for the first
+            measured value
+
+    Returns:
+        (value, available). The value is STATE_UNKNOWN if the device did not
+        report the key, and a SpecialValue for not connected / out of range.
+    """
+    if measurement_key in MEASUREMENT_FIELDS:
+        value = measurement.get(measurement_key)
+        if value is None:
+            return STATE_UNKNOWN, False
+        return value, True
+
+    measurement_data = data["measurement"]
+    if not measurement_key:
+        # run through measurements to get first non date one and use this
+        for key, value in measurement_data.items():
+            if key in ["idx", "ts", "c"]:
+                continue
+            if key in MEASUREMENT_FIELDS:
+                return measurement.get(key), True
+            return value, True
+    elif measurement_key in measurement_data:
+        return measurement_data[measurement_key], True
+    return STATE_UNKNOWN, False
+
+
+def _number_or_none(value: Any) -> float | int | None:
+    """Return a decoded numeric value, None for unknown or special values."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def _binary_state(state: Any, available: bool, name: str) -> tuple[bool | None, bool]:
+    """Convert a decoded value to (is_on, available) of a binary sensor.
+
+    Handles both Boolean (True/False) and int (1/0) formats: True/1 is on
+    (wet/open), False/0 is off (dry/closed). Not connected / out of range is
+    an unknown state of an available entity.
+    """
+    if not available:
+        return False, False
+    if isinstance(state, SpecialValue):
+        return None, True
+    if isinstance(state, bool):
+        return state, True
+    try:
+        return int(state) == 1, True
+    except (ValueError, TypeError):
+        _LOGGER.warning(
+            "Invalid water/contact sensor value for %s: %s (type: %s)",
+            name,
+            state,
+            type(state).__name__,
+        )
+        return False, False
+
 
 class MobileAlertsSensor(CoordinatorEntity, SensorEntity):
     """Base implementation of a Mobile Alerts sensor.
@@ -60,6 +199,7 @@ class MobileAlertsSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._device_id = device[CONF_DEVICE_ID]
         self._device_name = device[CONF_NAME]
+        self._attribute_policy = device.get(CONF_ATTRIBUTES, DEFAULT_ATTRIBUTES)
         self._attr_device_info = device_info
 
         self._type = device.get(CONF_TYPE, "t1")
@@ -116,6 +256,8 @@ class MobileAlertsSensor(CoordinatorEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.device_changed(self._device_id):
+            return
         self.extract_reading()
         self.async_write_ha_state()
 
@@ -127,31 +269,21 @@ class MobileAlertsSensor(CoordinatorEntity, SensorEntity):
         MobileAlertsLastSeenSensor, MobileAlertsWindDirectionDegreesSensor).
         """
         data = self.coordinator.get_reading(self._device_id)
-        self._attr_extra_state_attributes = data if data is not None else {}
+        self._attr_extra_state_attributes = build_state_attributes(
+            data,
+            self._type,
+            self._attribute_policy,
+            stale=self.coordinator.is_stale,
+        )
         self._attr_native_value = None
         self._attr_available = False
-        if data is None:
-            return
-        if "measurement" not in data:
+        measurement = self.coordinator.get_measurement(self._device_id)
+        if data is None or measurement is None:
             return
 
-        measurement_data = data["measurement"]
-        state = STATE_UNKNOWN
-        available = False
-
-        if len(self._type) == 0:
-            # run through measurements to get first non date one and use this
-            for measurement, value in measurement_data.items():
-                if measurement in ["idx", "ts", "c"]:
-                    continue
-                state = value
-                available = True
-                break
-        elif self._type in measurement_data:
-            state = measurement_data[self._type]
-            available = True
-
-        self._attr_native_value = state
+        state, available = read_measurement_value(measurement, data, self._type)
+        # Not connected / out of range: no value, but the device is reachable
+        self._attr_native_value = None if isinstance(state, SpecialValue) else state
         self._attr_available = available
 
         _LOGGER.debug(
@@ -186,20 +318,10 @@ class MobileAlertsTemperatureSensor(MobileAlertsSensor):
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        if self._attr_native_value is None:
-            return None
-        try:
-            val = float(str(self._attr_native_value))
-            if val > 100 or val < -100:
-                return None
-            return val
-        except ValueError:
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
+        val = _number_or_none(self._attr_native_value)
+        if val is None or val > 100 or val < -100:
             return None
+        return val
 
 
 class MobileAlertsHumiditySensor(MobileAlertsSensor):
@@ -226,20 +348,10 @@ class MobileAlertsHumiditySensor(MobileAlertsSensor):
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        if self._attr_native_value is None:
-            return None
-        try:
-            val = float(str(self._attr_native_value))
-            if val > 100 or val < 0:
-                return None
-            return val
-        except ValueError:
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
+        val = _number_or_none(self._attr_native_value)
+        if val is None or val > 100 or val < 0:
             return None
+        return val
 
 
 class MobileAlertsRainSensor(MobileAlertsSensor):
@@ -269,15 +381,7 @@ class MobileAlertsRainSensor(MobileAlertsSensor):
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        try:
-            return cast(float, self._attr_native_value)
-        except ValueError:
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
-            return None
+        return _number_or_none(self._attr_native_value)
 
 
 class MobileAlertsRainFlowSensor(MobileAlertsSensor):
@@ -308,19 +412,8 @@ class MobileAlertsRainFlowSensor(MobileAlertsSensor):
 
     @property
     def native_value(self) -> StateType:
-        """Return the value reported by the sensor."""
-        try:
-            if self._attr_native_value is None:
-                return None
-            # Convert to int since it's a counter
-            return int(cast(int | float | str, self._attr_native_value))
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
-            return None
+        """Return the value reported by the sensor (decoded as int counter)."""
+        return _number_or_none(self._attr_native_value)
 
 
 class MobileAlertsWindSpeedSensor(MobileAlertsSensor):
@@ -347,18 +440,7 @@ class MobileAlertsWindSpeedSensor(MobileAlertsSensor):
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        try:
-            if self._attr_native_value is None:
-                return None
-            # Convert string values from API to float
-            return float(cast(int | float | str, self._attr_native_value))
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
-            return None
+        return _number_or_none(self._attr_native_value)
 
 
 class MobileAlertsWindDirectionSensor(MobileAlertsSensor):
@@ -403,20 +485,10 @@ class MobileAlertsWindDirectionSensor(MobileAlertsSensor):
             "NW",
             "NNW",
         ]
-        try:
-            if self._attr_native_value is None:
-                return None
-            val = int(cast(int | float | str, self._attr_native_value))
-            if 0 <= val <= 15:
-                return directions[val]
-            return None
-        except (ValueError, TypeError, IndexError):
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
-            return None
+        val = _number_or_none(self._attr_native_value)
+        if val is not None and 0 <= val <= 15:
+            return directions[int(val)]
+        return None
 
 
 class MobileAlertsWindDirectionDegreesSensor(MobileAlertsSensor):
@@ -441,26 +513,23 @@ class MobileAlertsWindDirectionDegreesSensor(MobileAlertsSensor):
         )
 
     def extract_reading(self) -> None:
-        """Extract wind direction data from coordinator (uses 'wd' key, not 'wd_degrees')."""
+        """Extract wind direction in degrees (converted from the 'wd' key)."""
         data = self.coordinator.get_reading(self._device_id)
-        self._attr_extra_state_attributes = data if data is not None else {}
+        self._attr_extra_state_attributes = build_state_attributes(
+            data,
+            "wd",
+            self._attribute_policy,
+            stale=self.coordinator.is_stale,
+        )
         self._attr_native_value = None
         self._attr_available = False
-        if data is None:
-            return
-        if "measurement" not in data:
+        measurement = self.coordinator.get_measurement(self._device_id)
+        if data is None or measurement is None:
             return
 
-        measurement_data = data["measurement"]
-        state = STATE_UNKNOWN
-        available = False
-
-        # Wind direction degrees uses the "wd" measurement key
-        if "wd" in measurement_data:
-            state = measurement_data["wd"]
-            available = True
-
-        self._attr_native_value = state
+        # Wind direction degrees is converted from the "wd" measurement key
+        state, available = read_measurement_value(measurement, data, "wd_degrees")
+        self._attr_native_value = None if isinstance(state, SpecialValue) else state
         self._attr_available = available
 
         _LOGGER.debug(
@@ -473,21 +542,7 @@ class MobileAlertsWindDirectionDegreesSensor(MobileAlertsSensor):
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor in degrees (0-337.5)."""
-        try:
-            if self._attr_native_value is None:
-                return None
-            val = int(cast(int | float | str, self._attr_native_value))
-            if 0 <= val <= 15:
-                # Calculate degrees: wd * 22.5
-                return round(val * 22.5, 1)
-            return None
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
-            return None
+        return _number_or_none(self._attr_native_value)
 
 
 class MobileAlertsWindGustSensor(MobileAlertsSensor):
@@ -514,18 +569,7 @@ class MobileAlertsWindGustSensor(MobileAlertsSensor):
     @property
     def native_value(self) -> StateType:
         """Return the value reported by the sensor."""
-        try:
-            if self._attr_native_value is None:
-                return None
-            # Convert string values from API to float
-            return float(cast(int | float | str, self._attr_native_value))
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Invalid value for entity %s: %s",
-                self.entity_id,
-                self._attr_native_value,
-            )
-            return None
+        return _number_or_none(self._attr_native_value)
 
 
 class MobileAlertsBatterySensor(MobileAlertsSensor):
@@ -562,52 +606,27 @@ class MobileAlertsBatterySensor(MobileAlertsSensor):
     def extract_reading(self) -> None:
         """Extract battery status from coordinator."""
         data = self.coordinator.get_reading(self._device_id)
-        self._attr_extra_state_attributes = data if data is not None else {}
+        self._attr_extra_state_attributes = build_state_attributes(
+            data,
+            self._type,
+            self._attribute_policy,
+            stale=self.coordinator.is_stale,
+        )
         self._attr_native_value = None
         self._attr_available = False
 
-        if data is None:
-            return
-        if "measurement" not in data:
+        measurement = self.coordinator.get_measurement(self._device_id)
+        if data is None or measurement is None:
             return
 
-        measurement_data = data["measurement"]
-
-        # Check for lowbattery field in the API response
-        if "lowbattery" in measurement_data:
-            try:
-                low_battery = measurement_data["lowbattery"]
-
-                # Convert boolean or string to battery status
-                if isinstance(low_battery, bool):
-                    self._attr_native_value = "Low" if low_battery else "OK"
-                elif isinstance(low_battery, str):
-                    # Handle string values like "true"/"false"
-                    if low_battery.lower() in ["true", "1", "yes"]:
-                        self._attr_native_value = "Low"
-                    else:
-                        self._attr_native_value = "OK"
-                else:
-                    # Fallback for other types
-                    self._attr_native_value = "Low" if low_battery else "OK"
-
-                # Set dynamic icon based on battery status
-                if self._attr_native_value == "Low":
-                    self._attr_icon = "mdi:battery-low"
-                else:
-                    self._attr_icon = "mdi:battery"
-
-                self._attr_available = True
-
-            except (ValueError, TypeError):
-                self._attr_native_value = "Unknown"
-                self._attr_icon = "mdi:battery-unknown"
-                self._attr_available = True
+        # If no lowbattery field is found, assume OK
+        if measurement.low_battery:
+            self._attr_native_value = "Low"
+            self._attr_icon = "mdi:battery-low"
         else:
-            # If no lowbattery field found, assume OK
             self._attr_native_value = "OK"
             self._attr_icon = "mdi:battery"
-            self._attr_available = True
+        self._attr_available = True
 
         _LOGGER.debug(
             "MobileAlertsBatterySensor::extract_reading %s %s:%s",
@@ -646,55 +665,24 @@ class MobileAlertsLastSeenSensor(MobileAlertsSensor):
     def extract_reading(self) -> None:
         """Extract last seen timestamp from coordinator."""
         data = self.coordinator.get_reading(self._device_id)
-        self._attr_extra_state_attributes = data if data is not None else {}
+        self._attr_extra_state_attributes = build_state_attributes(
+            data,
+            self._type,
+            self._attribute_policy,
+            stale=self.coordinator.is_stale,
+        )
         self._attr_native_value = None
         self._attr_available = False
 
-        if data is None:
-            return
-        if "measurement" not in data:
+        measurement = self.coordinator.get_measurement(self._device_id)
+        if data is None or measurement is None:
             return
 
-        measurement_data = data["measurement"]
-
-        # Last seen is in 'c' field (when sensor last transmitted to receiver)
-        if "c" in measurement_data:
-            try:
-                # 'c' should be a timestamp
-                timestamp_value = measurement_data["c"]
-
-                # Convert timestamp to datetime object with timezone
-                if isinstance(timestamp_value, (int, float)):
-                    # Unix timestamp - add UTC timezone
-                    self._attr_native_value = datetime.fromtimestamp(
-                        timestamp_value, tz=timezone.utc
-                    )
-                elif isinstance(timestamp_value, str):
-                    # ISO string or other format
-                    try:
-                        # Try parsing as ISO format first
-                        dt = datetime.fromisoformat(timestamp_value)
-                        # If no timezone info, assume UTC
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=timezone.utc)
-                        self._attr_native_value = dt
-                    except ValueError:
-                        # Try parsing as unix timestamp string
-                        unix_ts = float(timestamp_value)
-                        self._attr_native_value = datetime.fromtimestamp(
-                            unix_ts, tz=timezone.utc
-                        )
-
-                self._attr_available = True
-
-            except (ValueError, TypeError, OSError) as e:
-                _LOGGER.warning(
-                    "Could not parse last seen timestamp %s: %s",
-                    measurement_data.get("c"),
-                    e,
-                )
-                self._attr_native_value = None
-                self._attr_available = False
+        # Last seen is the 'c' field (when sensor last transmitted to receiver),
+        # parsed once when the measurement was decoded
+        if measurement.last_seen is not None:
+            self._attr_native_value = measurement.last_seen
+            self._attr_available = True
 
         _LOGGER.debug(
             "MobileAlertsLastSeenSensor::extract_reading %s %s:%s",
@@ -730,6 +718,7 @@ class MobileAlertsWaterSensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.MOISTURE
         self._device_id = device[CONF_DEVICE_ID]
         self._device_name = device[CONF_NAME]
+        self._attribute_policy = device.get(CONF_ATTRIBUTES, DEFAULT_ATTRIBUTES)
         self._attr_device_info = device_info
         self._id = self._device_id + self._type
         self._attr_unique_id = self._id
@@ -752,62 +741,35 @@ class MobileAlertsWaterSensor(CoordinatorEntity, BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.device_changed(self._device_id):
+            return
         self.extract_reading()
         self.async_write_ha_state()
 
     def extract_reading(self) -> None:
         """Extract reading from coordinator."""
-        data = self.coordinator.get_reading(self._device_id)
-        self._attr_extra_state_attributes = data if data is not None else {}
-        self._attr_available = False
-        if data is None:
-            return
-        if "measurement" not in data:
-            return
-
-        measurement_data = data["measurement"]
-        state = STATE_UNKNOWN
-        available = False
-
         # Map sensor type to measurement key
         # "water" is a sensor type override, but the actual measurement key is "t2"
         measurement_key = "t2" if self._type == "water" else self._type
 
-        if len(self._type) == 0:
-            # run through measurements to get first non date one and use this
-            for measurement, value in measurement_data.items():
-                if measurement in ["idx", "ts", "c"]:
-                    continue
-                state = value
-                available = True
-                break
-        elif measurement_key in measurement_data:
-            state = measurement_data[measurement_key]
-            available = True
-
-        # Convert state to on/off
-        # Handles both Boolean (True/False) and int (0/1) formats
-        if state is not None and state != STATE_UNKNOWN:
-            try:
-                if isinstance(state, bool):
-                    # Boolean format (True = on/wet/open, False = off/dry/closed)
-                    self._attr_is_on = state
-                else:
-                    # Int format (1 = on/wet/open, 0 = off/dry/closed)
-                    self._attr_is_on = int(state) == 1
-                self._attr_available = available
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "Invalid water/contact sensor value for %s: %s (type: %s)",
-                    self._attr_name,
-                    state,
-                    type(state).__name__,
-                )
-                self._attr_is_on = False
-                self._attr_available = False
-        else:
-            self._attr_is_on = False
-            self._attr_available = False
+        data = self.coordinator.get_reading(self._device_id)
+        self._attr_extra_state_attributes = build_state_attributes(
+            data,
+            measurement_key,
+            self._attribute_policy,
+            stale=self.coordinator.is_stale,
+        )
+        self._attr_available = False
+        measurement = self.coordinator.get_measurement(self._device_id)
+        if data is None or measurement is None:
+            return
+
+        state, available = read_measurement_value(
+            measurement, data, measurement_key if self._type else ""
+        )
+        self._attr_is_on, self._attr_available = _binary_state(
+            state, available, self._attr_name
+        )
 
         _LOGGER.debug(
             "MobileAlertsWaterSensor::extract_reading %s %s:%s",
@@ -840,6 +802,7 @@ class MobileAlertsContactSensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.OPENING
         self._device_id = device[CONF_DEVICE_ID]
         self._device_name = device[CONF_NAME]
+        self._attribute_policy = device.get(CONF_ATTRIBUTES, DEFAULT_ATTRIBUTES)
         self._attr_name = self._device_name
         self._attr_device_info = device_info
         self._id = self._device_id + self._type
@@ -854,59 +817,30 @@ class MobileAlertsContactSensor(CoordinatorEntity, BinarySensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if not self.coordinator.device_changed(self._device_id):
+            return
         self.extract_reading()
         self.async_write_ha_state()
 
     def extract_reading(self) -> None:
         """Extract contact state from coordinator."""
         data = self.coordinator.get_reading(self._device_id)
-        self._attr_extra_state_attributes = data if data is not None else {}
+        self._attr_extra_state_attributes = build_state_attributes(
+            data,
+            self._type,
+            self._attribute_policy,
+            stale=self.coordinator.is_stale,
+        )
         self._attr_available = False
-        if data is None:
-            return
-        if "measurement" not in data:
+        measurement = self.coordinator.get_measurement(self._device_id)
+        if data is None or measurement is None:
             return
 
-        measurement_data = data["measurement"]
-        state = STATE_UNKNOWN
-        available = False
-
-        if len(self._type) == 0:
-            # run through measurements to get first non-date one
-            for measurement, value in measurement_data.items():
-                if measurement in ["idx", "ts", "c"]:
-                    continue
-                state = value
-                available = True
-                break
-        elif self._type in measurement_data:
-            state = measurement_data[self._type]
-            available = True
-
-        # Convert state to on/off
-        # Contact sensors: True/False (API) or 1/0 (legacy format)
-        # True/1 = Open, False/0 = Closed
-        if state is not None and state != STATE_UNKNOWN:
-            try:
-                if isinstance(state, bool):
-                    # Boolean format from API (True = open, False = closed)
-                    self._attr_is_on = state
-                else:
-                    # Int format (1 = open, 0 = closed)
-                    self._attr_is_on = int(state) == 1
-                self._attr_available = available
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "Invalid contact sensor value for %s: %s (type: %s)",
-                    self._attr_name,
-                    state,
-                    type(state).__name__,
-                )
-                self._attr_is_on = False
-                self._attr_available = False
-        else:
-            self._attr_is_on = False
-            self._attr_available = False
+        state, available = read_measurement_value(measurement, data, self._type)
+        # Contact sensors: True = Open, False = Closed
+        self._attr_is_on, self._attr_available = _binary_state(
+            state, available, self._attr_name
+        )
 
         _LOGGER.debug(
             "MobileAlertsContactSensor::extract_reading %s %s:%s",
@@ -914,3 +848,354 @@ class MobileAlertsContactSensor(CoordinatorEntity, BinarySensorEntity):
             self._attr_is_on,
             self._attr_available,
         )
+
+
+STATISTIC_LABELS: Final = {
+    STAT_MEAN: "Mean",
+    STAT_MIN: "Min",
+    STAT_MAX: "Max",
+    STAT_TREND: "Trend",
+}
+
+
+def _statistic_unit(
+    measurement_key: str,
+) -> tuple[SensorDeviceClass | None, str | None]:
+    """Return the device class and unit of the statistics of a measurement key.
+
+    Must stay in sync with the units of the entities in MEASUREMENT_TYPE_MAP.
+    """
+    if measurement_key.startswith("t"):
+        return SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS
+    if measurement_key.startswith("h"):
+        return SensorDeviceClass.HUMIDITY, PERCENTAGE
+    if measurement_key == "ws":
+        return SensorDeviceClass.WIND_SPEED, UnitOfSpeed.METERS_PER_SECOND
+    if measurement_key == "wg":
+        return None, UnitOfSpeed.METERS_PER_SECOND
+    return None, None
+
+
+class MobileAlertsStatisticSensor(MobileAlertsSensor):
+    """Rolling statistic of a measurement (mean, min, max or trend per hour).
+
+    Computed from the in-memory history of the coordinator, without recorder
+    queries. These entities are optional and disabled by default.
+    """
+
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: MobileAlertsCoordinator,
+        device: dict[str, str],
+        device_info: DeviceInfo,
+        statistic: str,
+    ) -> None:
+        """Initialize the statistic sensor.
+
+        Args:
+            coordinator: Data update coordinator instance
+            device: Device configuration dict, CONF_TYPE is the measurement key
+            device_info: Home Assistant DeviceInfo for this sensor
+            statistic: STAT_MEAN, STAT_MIN, STAT_MAX or STAT_TREND
+        """
+        self._statistic = statistic
+        super().__init__(coordinator, device=device, device_info=device_info)
+        self._attr_unique_id = f"{self._id}_{statistic}"
+        self._attr_name = f"{self._attr_name} {STATISTIC_LABELS[statistic]}"
+
+        device_class, unit = _statistic_unit(self._type)
+        if statistic == STAT_TREND:
+            device_class = None
+            unit = f"{unit}/h" if unit else None
+        self._device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self.entity_description = SensorEntityDescription(
+            key=f"{self._type}_{statistic}",
+            device_class=device_class,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=unit,
+        )
+
+    def extract_reading(self) -> None:
+        """Read the statistic from the history of the coordinator."""
+        statistics = self.coordinator.get_statistics(self._device_id, self._type)
+        self._attr_native_value = None
+        self._attr_available = statistics is not None
+        self._attr_extra_state_attributes = {}
+        if statistics is None:
+            return
+
+        value = statistics[self._statistic]
+        self._attr_native_value = round(value, 2) if value is not None else None
+        if self._attribute_policy != ATTRIBUTES_NONE:
+            self._attr_extra_state_attributes = {
+                STAT_SAMPLES: statistics[STAT_SAMPLES]
+            }
+        if self.coordinator.is_stale:
+            self._attr_extra_state_attributes[STALE_ATTRIBUTE] = True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the statistic."""
+        return self._attr_native_value
+
+
+def statistic_sensors(
+    coordinator: MobileAlertsCoordinator,
+    device: dict[str, str],
+    device_info: DeviceInfo,
+) -> list[MobileAlertsStatisticSensor]:
+    """Create the statistic sensors of a measurement entity.
+
+    Args:
+        coordinator: Data update coordinator instance
+        device: Device configuration dict of the measurement entity
+        device_info: Home Assistant DeviceInfo for this sensor
+
+    Returns:
+        One sensor per statistic, or an empty list if the measurement key has
+        no history
+    """
+    if device.get(CONF_TYPE) not in HISTORY_KEYS:
+        return []
+    return [
+        MobileAlertsStatisticSensor(coordinator, device, device_info, statistic)
+        for statistic in STATISTIC_LABELS
+    ]
+
+
+# Derived rain values: (label, device class, unit, state class)
+RAIN_VALUES: Final = {
+    "rate": (
+        "Rain Rate",
+        SensorDeviceClass.PRECIPITATION_INTENSITY,
+        UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR,
+        SensorStateClass.MEASUREMENT,
+    ),
+    "hour": (
+        "Rain This Hour",
+        SensorDeviceClass.PRECIPITATION,
+        UnitOfLength.MILLIMETERS,
+        SensorStateClass.TOTAL_INCREASING,
+    ),
+    "today": (
+        "Rain Today",
+        SensorDeviceClass.PRECIPITATION,
+        UnitOfLength.MILLIMETERS,
+        SensorStateClass.TOTAL_INCREASING,
+    ),
+}
+
+
+class MobileAlertsTimeDerivedSensor(MobileAlertsSensor):
+    """Derived sensor whose value also depends on the current time.
+
+    Rain this hour, rain today and the hourly wind windows roll over at the
+    period boundary even if the device sends no new measurement, so these
+    sensors recompute on every coordinator update and write their state when
+    it changed, instead of only when the device changed.
+    """
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        previous = (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
+        self.extract_reading()
+        if self.coordinator.device_changed(self._device_id) or previous != (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        ):
+            self.async_write_ha_state()
+
+
+class MobileAlertsDerivedRainSensor(MobileAlertsTimeDerivedSensor):
+    """Rain rate, rain this hour or rain today of a rain gauge (MA10650).
+
+    Derived by the coordinator from the increments of the rain flip counter
+    ("rf"), so the values need no Utility Meter helpers.
+    """
+
+    def __init__(
+        self,
+        coordinator: MobileAlertsCoordinator,
+        device: dict[str, str],
+        device_info: DeviceInfo,
+        value: str,
+    ) -> None:
+        """Initialize the derived rain sensor.
+
+        Args:
+            coordinator: Data update coordinator instance
+            device: Device configuration dict of the rain flow entity
+            device_info: Home Assistant DeviceInfo for this sensor
+            value: Key of RAIN_VALUES ("rate", "hour" or "today")
+        """
+        self._value = value
+        super().__init__(coordinator, device=device, device_info=device_info)
+        label, device_class, unit, state_class = RAIN_VALUES[value]
+        self._attr_unique_id = f"{self._device_id}rain_{value}"
+        self._attr_name = f"{self._device_name} {label}"
+        self._device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self.entity_description = SensorEntityDescription(
+            key=f"rain_{value}",
+            translation_key=f"rain_{value}",
+            device_class=device_class,
+            state_class=state_class,
+            native_unit_of_measurement=unit,
+        )
+
+    def extract_reading(self) -> None:
+        """Read the derived rain value from the coordinator."""
+        rain = self.coordinator.get_rain(self._device_id)
+        self._attr_native_value = rain[self._value] if rain is not None else None
+        self._attr_available = rain is not None
+        self._attr_extra_state_attributes = {}
+        if rain is not None and self.coordinator.is_stale:
+            self._attr_extra_state_attributes[STALE_ATTRIBUTE] = True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the derived rain value."""
+        return self._attr_native_value
+
+
+def rain_sensors(
+    coordinator: MobileAlertsCoordinator,
+    device: dict[str, str],
+    device_info: DeviceInfo,
+) -> list[MobileAlertsDerivedRainSensor]:
+    """Create the derived rain sensors of a rain flow entity.
+
+    Args:
+        coordinator: Data update coordinator instance
+        device: Device configuration dict of the measurement entity
+        device_info: Home Assistant DeviceInfo for this sensor
+
+    Returns:
+        Rain rate, rain this hour and rain today sensors for the "rf"
+        measurement, an empty list for other measurement keys
+    """
+    if device.get(CONF_TYPE) != "rf":
+        return []
+    return [
+        MobileAlertsDerivedRainSensor(coordinator, device, device_info, value)
+        for value in RAIN_VALUES
+    ]
+
+
+# Derived wind values: (label, device class, unit)
+WIND_VALUES: Final = {
+    "direction_mean": ("Wind Direction Mean", None, DEGREE),
+    "direction_steadiness": ("Wind Direction Steadiness", None, PERCENTAGE),
+    "speed_mean_short": (
+        "Wind Speed 10 min Mean",
+        SensorDeviceClass.WIND_SPEED,
+        UnitOfSpeed.METERS_PER_SECOND,
+    ),
+    "speed_mean_long": (
+        "Wind Speed Hourly Mean",
+        SensorDeviceClass.WIND_SPEED,
+        UnitOfSpeed.METERS_PER_SECOND,
+    ),
+    "gust_peak": (
+        "Wind Gust Hourly Peak",
+        SensorDeviceClass.WIND_SPEED,
+        UnitOfSpeed.METERS_PER_SECOND,
+    ),
+}
+
+
+class MobileAlertsDerivedWindSensor(MobileAlertsTimeDerivedSensor):
+    """Wind statistic of a wind sensor (MA10660).
+
+    Derived by the coordinator from the recent measurements (vector mean
+    direction, mean speeds, peak gust), so the values need no statistics or
+    template helpers.
+    """
+
+    def __init__(
+        self,
+        coordinator: MobileAlertsCoordinator,
+        device: dict[str, str],
+        device_info: DeviceInfo,
+        value: str,
+    ) -> None:
+        """Initialize the derived wind sensor.
+
+        Args:
+            coordinator: Data update coordinator instance
+            device: Device configuration dict of the wind speed entity
+            device_info: Home Assistant DeviceInfo for this sensor
+            value: Key of WIND_VALUES
+        """
+        self._value = value
+        super().__init__(coordinator, device=device, device_info=device_info)
+        label, device_class, unit = WIND_VALUES[value]
+        self._attr_unique_id = f"{self._device_id}wind_{value}"
+        self._attr_name = f"{self._device_name} {label}"
+        self._device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self.entity_description = SensorEntityDescription(
+            key=f"wind_{value}",
+            translation_key=f"wind_{value}",
+            device_class=device_class,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=unit,
+        )
+
+    def extract_reading(self) -> None:
+        """Read the derived wind value from the coordinator."""
+        wind = self.coordinator.get_wind(self._device_id)
+        self._attr_native_value = wind[self._value] if wind is not None else None
+        self._attr_available = wind is not None
+        self._attr_extra_state_attributes = {}
+        if (
+            wind is not None
+            and self._value == "gust_peak"
+            and wind["gust_peak_time"] is not None
+            and self._attribute_policy != ATTRIBUTES_NONE
+        ):
+            self._attr_extra_state_attributes = {
+                "time": datetime.fromtimestamp(
+                    wind["gust_peak_time"], tz=timezone.utc
+                ).isoformat()
+            }
+        if wind is not None and self.coordinator.is_stale:
+            self._attr_extra_state_attributes[STALE_ATTRIBUTE] = True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the derived wind value."""
+        return self._attr_native_value
+
+
+def wind_sensors(
+    coordinator: MobileAlertsCoordinator,
+    device: dict[str, str],
+    device_info: DeviceInfo,
+) -> list[MobileAlertsDerivedWindSensor]:
+    """Create the derived wind sensors of a wind speed entity.
+
+    Args:
+        coordinator: Data update coordinator instance
+        device: Device configuration dict of the measurement entity
+        device_info: Home Assistant DeviceInfo for this sensor
+
+    Returns:
+        The wind statistic sensors for the "ws" measurement, an empty list for
+        other measurement keys
+    """
+    if device.get(CONF_TYPE) != "ws":
+        return []
+    return [
+        MobileAlertsDerivedWindSensor(coordinator, device, device_info, value)
+        for value in WIND_VALUES
+    ]
@@ -0,0 +1,303 @@
+"""Wind statistics (vector mean direction, mean speed, peak gust) for Mobile Alerts."""
+
+from collections import deque
+import logging
+import math
+from typing import Any, Final
+
+from .column_store import ColumnMeasurement
+from .const import (
+    WIND_LONG_WINDOW_SECONDS,
+    WIND_SHORT_WINDOW_MIN_SAMPLES,
+    WIND_SHORT_WINDOW_SECONDS,
+    WIND_WINDOW_SIZE,
+)
+from .measurement import Measurement
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+def _number(value: Any) -> float | None:
+    """Return a decoded value as float, None for missing or special values."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """Round a value, keeping None."""
+    return round(value, digits) if value is not None else None
+
+
+class WindWindow:
+    """Sliding time window of wind samples with running sums.
+
+    Adding a sample and evicting the samples that left the window update the
+    sums, so the means are O(1) (amortized) per measurement. The direction is
+    averaged as vectors weighted by the wind speed: each sample adds
+    (speed * sin(direction), speed * cos(direction)). The length of the mean
+    vector divided by the mean speed is the steadiness of the direction (1
+    for a constant direction, 0 for evenly spread directions).
+
+    A window that is short compared to the upload interval of the sensor would
+    mostly hold a single sample or none, so it can keep a minimum number of
+    samples that are older than the window, up to a maximum age.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        capacity: int = WIND_WINDOW_SIZE,
+        min_samples: int = 1,
+        max_age: float | None = None,
+    ) -> None:
+        """Initialize the window.
+
+        Args:
+            seconds: Length of the window
+            capacity: Max. number of samples, the oldest one is evicted first
+            min_samples: Number of samples kept even if they are older than
+                the window
+            max_age: Age after which even these samples are evicted (default:
+                the length of the window)
+        """
+        self._seconds = seconds
+        self._capacity = capacity
+        self._min_samples = min_samples
+        self._max_age = max(max_age if max_age is not None else seconds, seconds)
+        # (time, speed, east component, north component, speed with direction)
+        self._samples: deque[tuple[float, float, float, float, float]] = deque()
+        self._speed_sum = 0.0
+        self._east_sum = 0.0
+        self._north_sum = 0.0
+        self._directed_speed_sum = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def _evict(self) -> None:
+        """Remove the oldest sample from the sums."""
+        _, speed, east, north, directed = self._samples.popleft()
+        if not self._samples:
+            # Start over to avoid accumulating rounding errors
+            self._speed_sum = self._east_sum = self._north_sum = 0.0
+            self._directed_speed_sum = 0.0
+            return
+        self._speed_sum -= speed
+        self._east_sum -= east
+        self._north_sum -= north
+        self._directed_speed_sum -= directed
+
+    def add(self, timestamp: float, speed: float, direction: float | None) -> None:
+        """Add a sample and evict the samples older than the window.
+
+        Args:
+            timestamp: Measurement time (epoch seconds)
+            speed: Wind speed
+            direction: Wind direction in degrees, None if not reported
+        """
+        east = north = directed = 0.0
+        if direction is not None:
+            radians = math.radians(direction)
+            east = speed * math.sin(radians)
+            north = speed * math.cos(radians)
+            directed = speed
+        if len(self._samples) >= self._capacity:
+            self._evict()
+        self._samples.append((timestamp, speed, east, north, directed))
+        self._speed_sum += speed
+        self._east_sum += east
+        self._north_sum += north
+        self._directed_speed_sum += directed
+        self.expire(timestamp)
+
+    def expire(self, now: float) -> None:
+        """Evict the samples that are older than the window at the given time.
+
+        The newest min_samples samples are kept until they reach max_age.
+        """
+        while self._samples and (
+            self._samples[0][0] <= now - self._max_age
+            or (
+                len(self._samples) > self._min_samples
+                and self._samples[0][0] <= now - self._seconds
+            )
+        ):
+            self._evict()
+
+    def mean_speed(self) -> float | None:
+        """Return the mean wind speed, None if the window is empty."""
+        if not self._samples:
+            return None
+        return self._speed_sum / len(self._samples)
+
+    def mean_direction(self) -> tuple[float | None, float | None]:
+        """Return the vector mean direction (degrees) and its steadiness (0-1).
+
+        Both are None if there is no wind with a direction in the window.
+        """
+        if self._directed_speed_sum <= 0:
+            return None, None
+        resultant = math.hypot(self._east_sum, self._north_sum)
+        steadiness = min(resultant / self._directed_speed_sum, 1.0)
+        if resultant <= 1e-9 * self._directed_speed_sum:
+            return None, steadiness
+        direction = math.degrees(math.atan2(self._east_sum, self._north_sum)) % 360
+        return direction, steadiness
+
+
+class PeakWindow:
+    """Sliding time window maximum of the wind gust with its time.
+
+    Keeps a monotonic queue (gusts in decreasing order), so each sample is
+    added and removed at most once: O(1) amortized per measurement.
+    """
+
+    def __init__(self, seconds: float, capacity: int = WIND_WINDOW_SIZE) -> None:
+        """Initialize the window.
+
+        Args:
+            seconds: Length of the window
+            capacity: Max. number of queued samples
+        """
+        self._seconds = seconds
+        self._capacity = capacity
+        self._queue: deque[tuple[float, float]] = deque()
+
+    def add(self, timestamp: float, gust: float) -> None:
+        """Add a gust and evict the gusts older than the window."""
+        while self._queue and self._queue[-1][1] <= gust:
+            self._queue.pop()
+        if len(self._queue) >= self._capacity:
+            self._queue.popleft()
+        self._queue.append((timestamp, gust))
+        self.expire(timestamp)
+
+    def expire(self, now: float) -> None:
+        """Evict the gusts that are older than the window at the given time."""
+        while self._queue and self._queue[0][0] <= now - self._seconds:
+            self._queue.popleft()
+
+    def peak(self) -> tuple[float, float] | None:
+        """Return (time, gust) of the peak gust, None if the window is empty."""
+        return self._queue[0] if self._queue else None
+
+
+class WindTracker:
+    """Wind statistics of one wind sensor (MA10660).
+
+    The windows end at the time of the last measurement, or at the current
+    time if it is given to values(), so the hourly peak gust of a sensor that
+    stopped reporting expires instead of being kept indefinitely. Sensors
+    upload about every 7 minutes, so the 10 minute window keeps at least the
+    last two measurements (up to the length of the hourly window).
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._last_ts: float | None = None
+        self._short = WindWindow(
+            WIND_SHORT_WINDOW_SECONDS,
+            min_samples=WIND_SHORT_WINDOW_MIN_SAMPLES,
+            max_age=WIND_LONG_WINDOW_SECONDS,
+        )
+        self._long = WindWindow(WIND_LONG_WINDOW_SECONDS)
+        self._gusts = PeakWindow(WIND_LONG_WINDOW_SECONDS)
+
+    def update(
+        self,
+        timestamp: float,
+        speed: float | None,
+        gust: float | None,
+        direction: float | None,
+    ) -> None:
+        """Add a measurement.
+
+        Args:
+            timestamp: Measurement time ("ts", epoch seconds)
+            speed: Wind speed ("ws"), None if not reported
+            gust: Wind gust ("wg"), None if not reported
+            direction: Wind direction in degrees, None if not reported
+        """
+        if self._last_ts is not None and timestamp <= self._last_ts:
+            return
+        self._last_ts = timestamp
+        if speed is not None:
+            self._short.add(timestamp, speed, direction)
+            self._long.add(timestamp, speed, direction)
+        if gust is not None:
+            self._gusts.add(timestamp, gust)
+
+    def values(self, now: float | None = None) -> dict[str, Any]:
+        """Return the wind statistics.
+
+        Args:
+            now: Current time (epoch seconds), the samples older than a window
+                at this time are evicted; None to end the windows at the last
+                measurement
+
+        Returns:
+            dict with direction_mean (degrees) and direction_steadiness (%) of
+            the short window, speed_mean_short and speed_mean_long, gust_peak
+            and gust_peak_time (epoch seconds) of the long window. A value is
+            None if there is no sample for it.
+        """
+        if now is not None:
+            for window in (self._short, self._long, self._gusts):
+                window.expire(now)
+        direction, steadiness = self._short.mean_direction()
+        speed_short = self._short.mean_speed()
+        speed_long = self._long.mean_speed()
+        peak = self._gusts.peak()
+        return {
+            "direction_mean": _round(direction, 1),
+            "direction_steadiness": _round(
+                steadiness * 100 if steadiness is not None else None, 0
+            ),
+            "speed_mean_short": _round(speed_short, 2),
+            "speed_mean_long": _round(speed_long, 2),
+            "gust_peak": peak[1] if peak is not None else None,
+            "gust_peak_time": peak[0] if peak is not None else None,
+        }
+
+
+class WindEngine:
+    """Wind trackers of all wind sensors of a coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize the engine."""
+        self._trackers: dict[str, WindTracker] = {}
+
+    def observe(
+        self, device_id: str, measurement: Measurement | ColumnMeasurement
+    ) -> None:
+        """Add a measurement of a device if it reports wind speed or gust.
+
+        Args:
+            device_id: The device ID
+            measurement: Decoded measurement of the device
+        """
+        timestamp = measurement.ts
+        speed = _number(measurement.get("ws"))
+        gust = _number(measurement.get("wg"))
+        if not isinstance(timestamp, int) or (speed is None and gust is None):
+            return
+        tracker = self._trackers.get(device_id)
+        if tracker is None:
+            tracker = self._trackers[device_id] = WindTracker()
+        tracker.update(
+            timestamp, speed, gust, _number(measurement.get("wd_degrees"))
+        )
+
+    def values(
+        self, device_id: str, now: float | None = None
+    ) -> dict[str, Any] | None:
+        """Return the wind statistics of a device, None if it has no wind data.
+
+        Args:
+            device_id: The device ID
+            now: Current time (epoch seconds), see WindTracker.values()
+        """
+        tracker = self._trackers.get(device_id)
+        return tracker.values(now) if tracker is not None else None
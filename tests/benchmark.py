@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the Mobile Alerts integration.
+
+Generates synthetic fleets of devices (all sensor type IDs of the device
+model table, round robin) and measures the costs of a poll separately:
+
+- fetch_batch_ms: _fetch_batch() of all devices, from pre-serialized
+  response bodies (JSON decoding, index and measurement decoding)
+- get_reading_us: one get_reading() lookup
+- find_all_matching_models_us: model detection of one measurement
+- extract_reading_us: one extract_reading() call, per sensor class
+- refresh_to_state_write_ms: coordinator refresh with a new measurement of
+  every device, until all enabled entities have written their state
+
+No network access: the API client uses a fake session, and Home Assistant is
+the test instance of pytest-homeassistant-custom-component.
+
+Usage:
+    python3 tests/benchmark.py [--sizes 10,100,1000,10000] [--repeat 5]
+    python3 tests/benchmark.py --save-baseline  # Write the baseline file
+    python3 tests/benchmark.py --check  # Exit 1 on a regression
+
+Results are compared with tests/benchmark_baseline.json. A result is a
+regression if it takes more than --tolerance times the baseline. Timings
+depend on the machine, so the baseline is not committed (it is ignored by
+git): record it with --save-baseline on the machine that runs the
+comparison, e.g. on the main branch before a change.
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.components.binary_sensor import (  # noqa: E402
+    BinarySensorEntity,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_NAME, CONF_TYPE  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.device_registry import DeviceInfo  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    async_test_home_assistant,
+)
+
+from custom_components.mobile_alerts.api import MobileAlertsApi  # noqa: E402
+from custom_components.mobile_alerts.const import DOMAIN  # noqa: E402
+from custom_components.mobile_alerts.coordinator import (  # noqa: E402
+    MobileAlertsCoordinator,
+)
+from custom_components.mobile_alerts.device import (  # noqa: E402
+    DEVICE_MODELS,
+    TYPE_ID_MODELS,
+    find_all_matching_models,
+    get_sensor_type_override,
+)
+from custom_components.mobile_alerts.rate_limit import RateLimiter  # noqa: E402
+from custom_components.mobile_alerts.sensor import (  # noqa: E402
+    MEASUREMENT_TYPE_MAP,
+)
+from custom_components.mobile_alerts.sensor_classes import (  # noqa: E402
+    MobileAlertsBatterySensor,
+    MobileAlertsLastSeenSensor,
+    rain_sensors,
+    statistic_sensors,
+    wind_sensors,
+)
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json"
+)
+START_TS = 1_760_000_000
+
+
+def _value(key: str, rng: random.Random) -> Any:
+    """Return a plausible raw API value of a measurement key."""
+    if key.startswith("t"):
+        return round(rng.uniform(-10, 35), 1)
+    if key.startswith("h"):
+        return float(rng.randint(20, 95))
+    if key == "r":
+        return round(rng.uniform(0, 500), 1)
+    if key in ("ws", "wg"):
+        return round(rng.uniform(0, 20), 1)
+    if key == "wd":
+        return rng.randint(0, 15)
+    if key == "w":
+        return rng.random() < 0.5
+    if key == "ap":
+        return round(rng.uniform(980, 1040), 1)
+    # rf, ppm and the key press types / counters
+    return rng.randint(0, 2000)
+
+
+def _templates() -> list[tuple[str, list[str]]]:
+    """Return (type ID, measurement keys) of every type ID in the model table."""
+    return [
+        (type_id, sorted(DEVICE_MODELS[models[0]]["measurement_keys"]))
+        for type_id, models in sorted(TYPE_ID_MODELS.items())
+    ]
+
+
+def synthetic_fleet(size: int, generation: int = 0, seed: int = 0) -> list[dict]:
+    """Generate the device records of a fleet as returned by the API.
+
+    Args:
+        size: Number of devices
+        generation: Measurement number, each generation has a new idx / ts
+        seed: Seed of the values, so fleets are reproducible
+    """
+    rng = random.Random(seed * 1_000_003 + generation)
+    templates = _templates()
+    devices = []
+    for i in range(size):
+        type_id, keys = templates[i % len(templates)]
+        ts = START_TS + generation * 420 + i % 60
+        measurement: dict[str, Any] = {
+            "idx": 1000 + generation,
+            "ts": ts,
+            "c": ts + 3,
+            "lb": False,
+        }
+        measurement.update({key: _value(key, rng) for key in keys})
+        devices.append(
+            {
+                "deviceid": f"{type_id}{i:010X}",
+                "lastseen": ts + 3,
+                "lowbattery": False,
+                "measurement": measurement,
+            }
+        )
+    return devices
+
+
+class _FakeResponse:
+    """Response of the fake session."""
+
+    status = 200
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self) -> "_FakeResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+class FakeSession:
+    """HTTP session that answers API requests with pre-serialized bodies."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self.bodies: dict[str, bytes] = {}
+
+    def serve(self, api: MobileAlertsApi, devices: list[dict]) -> None:
+        """Pre-serialize the response of every chunk request of the API client."""
+        records = {device["deviceid"]: device for device in devices}
+        self.bodies = {}
+        for i in range(0, len(api._device_ids), api._chunk_size):
+            chunk = api._device_ids[i : i + api._chunk_size]
+            payload = json.dumps(api._request_payload(chunk))
+            self.bodies[payload] = json.dumps(
+                {"success": True, "devices": [records[d] for d in chunk]}
+            ).encode()
+
+    def post(self, url: str, data: str, headers: dict) -> _FakeResponse:
+        return _FakeResponse(self.bodies[data])
+
+
+def _api(size: int, session: FakeSession) -> MobileAlertsApi:
+    """Return an API client for a fleet that is never rate limited."""
+    # Each clock reading is an hour later, so the quota never runs out
+    clock = itertools.count(0, 3600).__next__
+    api = MobileAlertsApi(
+        phone_id="123456789012",
+        session=session,  # type: ignore[arg-type]
+        rate_limiter=RateLimiter(clock=clock),
+    )
+    api._device_ids = [device["deviceid"] for device in synthetic_fleet(size)]
+    return api
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    """Return the median time of a call in seconds (after a warm-up call)."""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def _async_time(func: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Return the median time of an awaited call in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _entities(coordinator: MobileAlertsCoordinator, devices: list[dict]) -> list:
+    """Create the entities of a fleet like the sensor platform does."""
+    entities: list = []
+    for device in devices:
+        device_id = device["deviceid"]
+        device_info = DeviceInfo(identifiers={(DOMAIN, device_id)}, name=device_id)
+        model_id = TYPE_ID_MODELS[device_id[:2]][0]
+        keys = list(device["measurement"])
+        if "wd" in keys:
+            keys.append("wd_degrees")
+        for key in keys:
+            sensor_type = get_sensor_type_override(model_id, key) or key
+            sensor_class = MEASUREMENT_TYPE_MAP.get(sensor_type)
+            if sensor_class is None:
+                continue
+            config = {
+                CONF_DEVICE_ID: device_id,
+                CONF_NAME: device_id,
+                CONF_TYPE: sensor_type,
+            }
+            entities.append(sensor_class(coordinator, config, device_info))
+            entities.extend(statistic_sensors(coordinator, config, device_info))
+            entities.extend(rain_sensors(coordinator, config, device_info))
+            entities.extend(wind_sensors(coordinator, config, device_info))
+        for key, sensor_class in (
+            ("battery", MobileAlertsBatterySensor),
+            ("last_seen", MobileAlertsLastSeenSensor),
+        ):
+            config = {CONF_DEVICE_ID: device_id, CONF_NAME: device_id, CONF_TYPE: key}
+            entities.append(sensor_class(coordinator, config, device_info))
+    return entities
+
+
+async def benchmark_size(hass: HomeAssistant, size: int, repeat: int) -> dict:
+    """Run all benchmarks of one fleet size."""
+    results: dict[str, Any] = {}
+    session = FakeSession()
+    api = _api(size, session)
+    fleet = synthetic_fleet(size)
+    session.serve(api, fleet)
+
+    results["fetch_batch_ms"] = (
+        await _async_time(api._fetch_batch, repeat) * 1000
+    )
+
+    device_ids = api._device_ids
+    results["get_reading_us"] = (
+        _time(lambda: [api.get_reading(d) for d in device_ids], repeat)
+        / size
+        * 1e6
+    )
+
+    measurements = [device["measurement"] for device in fleet]
+    results["find_all_matching_models_us"] = (
+        _time(lambda: [find_all_matching_models(m) for m in measurements], repeat)
+        / size
+        * 1e6
+    )
+
+    coordinator = MobileAlertsCoordinator(hass, api)
+    await coordinator.async_refresh()
+    entities = _entities(coordinator, fleet)
+    by_class: dict[str, list] = defaultdict(list)
+    for entity in entities:
+        by_class[type(entity).__name__].append(entity)
+    results["extract_reading_us"] = {
+        name: _time(lambda group=group: [e.extract_reading() for e in group], repeat)
+        / len(group)
+        * 1e6
+        for name, group in sorted(by_class.items())
+    }
+
+    # Full refresh: every device has a new measurement, enabled entities write
+    unsubscribers = []
+    for n, entity in enumerate(entities):
+        if not entity.entity_registry_enabled_default:
+            continue
+        entity.hass = hass
+        domain = "binary_sensor" if isinstance(entity, BinarySensorEntity) else "sensor"
+        entity.entity_id = f"{domain}.bench_{n}"
+        unsubscribers.append(
+            coordinator.async_add_listener(entity._handle_coordinator_update)
+        )
+    generations = itertools.count(1)
+
+    async def refresh() -> None:
+        session.serve(api, synthetic_fleet(size, generation=next(generations)))
+        await coordinator.async_refresh()
+
+    timings = []
+    for _ in range(repeat):
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        await refresh()
+        timings.append(time.perf_counter() - start)
+    results["refresh_to_state_write_ms"] = statistics.median(timings) * 1000
+    results["entities"] = len(unsubscribers)
+    for unsubscribe in unsubscribers:
+        unsubscribe()
+    await coordinator.async_shutdown()
+    return results
+
+
+async def run(sizes: list[int], repeat: int) -> dict:
+    """Run the benchmarks of all fleet sizes."""
+    async with async_test_home_assistant() as hass:
+        results = {}
+        for size in sizes:
+            # Few repeats for large fleets, so a full run takes a few minutes
+            size_repeat = max(1, min(repeat, repeat * 1000 // size))
+            results[str(size)] = await benchmark_size(hass, size, size_repeat)
+            print(f"{size} devices: done", file=sys.stderr)
+        await hass.async_stop(force=True)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def _flatten(results: dict) -> dict[str, float]:
+    """Return the timings as {"size/metric[/class]": value}."""
+    flat = {}
+    for size, metrics in results.items():
+        for metric, value in metrics.items():
+            if metric == "entities":
+                continue
+            if isinstance(value, dict):
+                for name, item in value.items():
+                    flat[f"{size}/{metric}/{name}"] = item
+            else:
+                flat[f"{size}/{metric}"] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print the results next to the baseline and return the regressions."""
+    baseline_flat = _flatten(baseline.get("results", {}))
+    regressions = []
+    for name, value in _flatten(current["results"]).items():
+        base = baseline_flat.get(name)
+        if base is None or base <= 0:
+            print(f"{name:70} {value:12.3f}")
+            continue
+        ratio = value / base
+        marker = "  REGRESSION" if ratio > tolerance else ""
+        print(f"{name:70} {value:12.3f} {base:12.3f} {ratio:6.2f}x{marker}")
+        if ratio > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(map(str, DEFAULT_SIZES)),
+        help="Comma separated fleet sizes",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regressions")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Max. ratio to the baseline before a result is a regression",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    current = asyncio.run(run(sizes, args.repeat))
+
+    baseline: dict = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    elif not args.save_baseline:
+        print(
+            f"No baseline at {args.baseline}, "
+            "record one with: python3 tests/benchmark.py --save-baseline"
+        )
+    print(f"{'benchmark':70} {'current':>12} {'baseline':>12}")
+    regressions = compare(current, baseline, args.tolerance)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"Baseline written to {args.baseline}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.tolerance}x")
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -261,6 +261,9 @@ def mock_aiohttp_client(aiohttp_client):
         mock_response = AsyncMock()
         mock_response.status = 200
         mock_response.text = AsyncMock(return_value=json.dumps(MOCK_API_RESPONSE))
+        mock_response.read = AsyncMock(
+            return_value=json.dumps(MOCK_API_RESPONSE).encode()
+        )
         mock_response.json = AsyncMock(return_value=MOCK_API_RESPONSE)
         return mock_response
 
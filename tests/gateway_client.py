@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Stand-in for a Mobile Alerts gateway in proxy mode.
+
+Builds sensor packets like a gateway and uploads them to the local gateway
+receiver of the integration (PUT /gateway/put), for tests and manual testing.
+
+Usage:
+    python3 tests/gateway_client.py --url http://localhost:8123/gateway/put \\
+        --device 031234567890 --t1 21.5 --h 55
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+import aiohttp
+
+PACKET_SIZE = 64
+GATEWAY_ID = "001D8C0E1234"
+
+
+def encode_temperature(value: float | None) -> int:
+    """Encode a temperature, None for a sensor that is not connected."""
+    if value is None:
+        return 0x2000
+    return round(value * 10) & 0x7FF
+
+
+def encode_packet(
+    device_id: str,
+    tx_counter: int,
+    values: list[int],
+    timestamp: int | None = None,
+) -> bytes:
+    """Build a 64 byte sensor packet.
+
+    Args:
+        device_id: 12 hex digit device ID
+        tx_counter: Transmission counter of the sensor
+        values: Encoded current values (2 bytes each)
+        timestamp: Receive time of the gateway, now if omitted
+    """
+    length = 14 + 2 * len(values)
+    packet = bytearray(PACKET_SIZE)
+    packet[0] = 0xCE
+    packet[1:5] = int(timestamp or time.time()).to_bytes(4, "big")
+    packet[5] = length
+    packet[6:12] = bytes.fromhex(device_id)
+    packet[12:14] = tx_counter.to_bytes(2, "big")
+    for i, value in enumerate(values):
+        packet[14 + 2 * i : 16 + 2 * i] = value.to_bytes(2, "big")
+    packet[length] = sum(packet[:length]) & 0x7F
+    return bytes(packet)
+
+
+class FakeGateway:
+    """Uploads packets like a gateway that uses the receiver as proxy."""
+
+    def __init__(self, gateway_id: str = GATEWAY_ID) -> None:
+        """Initialize the gateway."""
+        self.gateway_id = gateway_id
+
+    def headers(self) -> dict[str, str]:
+        """Return the headers of an upload."""
+        return {
+            "HTTP_IDENTIFY": f"80{self.gateway_id[-6:]}:{self.gateway_id}:C0",
+            "Content-Type": "application/octet-stream",
+        }
+
+    async def upload(self, client: Any, url: str, packets: list[bytes]) -> Any:
+        """Upload packets with an aiohttp client session or test client."""
+        return await client.put(url, data=b"".join(packets), headers=self.headers())
+
+
+async def main() -> None:
+    """Upload one packet built from the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://localhost:8123/gateway/put")
+    parser.add_argument("--device", required=True, help="Device ID (type 02/03/06)")
+    parser.add_argument("--tx", type=int, default=1, help="Transmission counter")
+    parser.add_argument("--t1", type=float, required=True)
+    parser.add_argument("--t2", type=float)
+    parser.add_argument("--h", type=int)
+    args = parser.parse_args()
+
+    values = [encode_temperature(args.t1)]
+    if args.device[:2] == "06":
+        values.append(encode_temperature(args.t2))
+    if args.h is not None:
+        values.append(args.h)
+    packet = encode_packet(args.device, args.tx, values)
+    async with aiohttp.ClientSession() as session:
+        response = await FakeGateway().upload(session, args.url, [packet])
+        print(f"HTTP {response.status}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,10 +5,32 @@ This server simulates the Mobile Alerts API to allow testing of the Home Assista
 integration without requiring real devices or API calls.
 
 Usage:
-    python3 tests/mock_api_server.py [--port 8888]
+    python3 tests/mock_api_server.py [--port 8888] [--fleet 5000]
 
 Environment Variables:
     MOCK_API_PORT: Port to run the server on (default: 8888)
+    MOCK_API_FLEET: Number of synthetic devices (default: 0, the test devices)
+    MOCK_API_PROFILE: Fault profile (default: none)
+
+Scale mode (--fleet N) generates N devices across all supported models (round
+robin over the type IDs of the integration's device table) for load tests.
+Each device uploads a new measurement every --upload-interval seconds
+(staggered): idx, ts and c advance and the values drift. Responses are
+assembled from pre-serialized device records, so a request for thousands of
+devices costs little more than joining bytes. Device IDs are the type ID
+followed by the device number in hex, e.g. 030000000007.
+
+Fault profiles (--profile NAME) make the lastmeasurement endpoint behave like
+the API at its worst, to tune timeouts, backoff and rate limit handling:
+latency with jitter and spikes, slow bodies that trickle in, HTTP 429 when a
+device is called more than 3 times per minute, HTTP 403 after more than 5
+invalid calls within 15 minutes, malformed JSON and "success": false with an
+errorcode. See FAULT_PROFILES. The profile and single fault options can be
+changed at runtime:
+
+    curl localhost:8888/control/faults
+    curl -X POST localhost:8888/control/faults -d '{"profile": "quota"}'
+    curl -X POST localhost:8888/control/faults -d '{"error_rate": 0.5}'
 
 The server provides several test devices:
 - MA10100: Wireless Thermometer (only t1)
@@ -34,13 +56,17 @@ Test Device IDs:
 import argparse
 import asyncio
 import copy
+import heapq
 import json
 import logging
 import os
+import random
 import signal
 import sys
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Collection, Deque, Dict, List, Optional, Tuple
 
 from aiohttp import web
 
@@ -185,12 +211,431 @@ TEST_DEVICES: Dict[str, Dict[str, Any]] = {
 }
 
 
+def _fleet_models() -> List[Tuple[str, str, List[str]]]:
+    """Return (type ID, model ID, measurement keys) of all supported models.
+
+    Imported from the integration on demand, so the default mode only needs
+    aiohttp.
+    """
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from custom_components.mobile_alerts.device import DEVICE_MODELS, TYPE_ID_MODELS
+
+    return [
+        (type_id, model_id, sorted(DEVICE_MODELS[model_id]["measurement_keys"]))
+        for type_id, model_ids in sorted(TYPE_ID_MODELS.items())
+        for model_id in model_ids
+    ]
+
+
+def _initial_value(model_id: str, key: str, rng: random.Random) -> Any:
+    """Return a realistic first value of a measurement key."""
+    if model_id == "MA10350" and key == "t2":
+        return 0  # Water detector
+    if key.startswith("t"):
+        return round(rng.uniform(-5, 30), 1)
+    if key.startswith("h"):
+        return float(rng.randint(30, 80))
+    if key == "r":
+        return round(rng.uniform(0, 300), 3)
+    if key in ("ws", "wg"):
+        return round(rng.uniform(0, 8), 1)
+    if key == "wd":
+        return rng.randint(0, 15)
+    if key == "w":
+        return False
+    if key == "ap":
+        return round(rng.uniform(990, 1030), 1)
+    if key == "ppm":
+        return rng.randint(400, 1200)
+    # rf and the key press types / counters
+    return rng.randint(0, 1000)
+
+
+def _drift(model_id: str, key: str, value: Any, rng: random.Random) -> Any:
+    """Return the next value of a measurement key (random walk)."""
+    if model_id == "MA10350" and key == "t2":
+        return 1 if rng.random() < 0.02 else 0
+    if key.startswith("t"):
+        return round(min(max(value + rng.uniform(-0.3, 0.3), -30.0), 50.0), 1)
+    if key.startswith("h"):
+        return float(min(max(value + rng.randint(-1, 1), 10), 99))
+    if key == "rf":
+        return value + (rng.randint(1, 5) if rng.random() < 0.1 else 0)
+    if key in ("ws", "wg"):
+        return round(min(max(value + rng.uniform(-1, 1), 0.0), 40.0), 1)
+    if key == "wd":
+        return (value + rng.randint(-1, 1)) % 16
+    if key == "w":
+        return not value if rng.random() < 0.05 else value
+    if key == "ap":
+        return round(value + rng.uniform(-0.3, 0.3), 1)
+    if key == "ppm":
+        return min(max(value + rng.randint(-20, 20), 400), 5000)
+    if key.startswith("kp") and key.endswith("c"):
+        return value + (1 if rng.random() < 0.05 else 0)
+    return value
+
+
+class SyntheticFleet:
+    """Synthetic devices with drifting values, served as pre-serialized bytes.
+
+    The devices upload on a staggered schedule. Due uploads are taken from a
+    heap, so a request only updates the devices that uploaded since the last
+    one, and only their records are serialized again.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        upload_interval: float = 420.0,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Generate the fleet.
+
+        Args:
+            size: Number of devices
+            upload_interval: Seconds between two measurements of a device
+            seed: Seed of the values, so fleets are reproducible
+            clock: Time source (epoch seconds)
+        """
+        self._rng = random.Random(seed)
+        self._upload_interval = upload_interval
+        self._clock = clock
+        self.models: Dict[str, str] = {}
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self._serialized: Dict[str, bytes] = {}
+        self._uploads: List[Tuple[float, str]] = []
+        self._responses: Dict[str, bytes] = {}
+        self.version = 0
+
+        models = _fleet_models()
+        now = clock()
+        for i in range(size):
+            type_id, model_id, keys = models[i % len(models)]
+            device_id = f"{type_id}{i:010X}"
+            # Stagger the uploads over one interval
+            last_upload = now - (i * upload_interval / max(size, 1))
+            measurement: Dict[str, Any] = {
+                "idx": self._rng.randint(1, 100000),
+                "ts": int(last_upload),
+                "c": int(last_upload) + 3,
+                "lb": False,
+            }
+            for key in keys:
+                measurement[key] = _initial_value(model_id, key, self._rng)
+            if model_id == "MA10650":
+                measurement["r"] = round(measurement["rf"] * 0.258, 3)
+            self.models[device_id] = model_id
+            self.records[device_id] = {
+                "deviceid": device_id,
+                "lastseen": measurement["c"],
+                "lowbattery": False,
+                "measurement": measurement,
+            }
+            self._serialize(device_id)
+            self._uploads.append((last_upload + upload_interval, device_id))
+        heapq.heapify(self._uploads)
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self.records)
+
+    def _serialize(self, device_id: str) -> None:
+        """Serialize the record of a device."""
+        self._serialized[device_id] = json.dumps(
+            self.records[device_id], separators=(",", ":")
+        ).encode()
+
+    def advance(self) -> int:
+        """Apply the uploads that are due.
+
+        Returns:
+            Number of devices with a new measurement
+        """
+        now = self._clock()
+        updated = 0
+        while self._uploads and self._uploads[0][0] <= now:
+            upload, device_id = heapq.heappop(self._uploads)
+            model_id = self.models[device_id]
+            record = self.records[device_id]
+            measurement = record["measurement"]
+            measurement["idx"] += 1
+            measurement["ts"] = int(upload)
+            measurement["c"] = int(upload) + 3
+            for key, value in measurement.items():
+                if key not in ("idx", "ts", "c", "lb"):
+                    measurement[key] = _drift(model_id, key, value, self._rng)
+            if model_id == "MA10650":
+                measurement["r"] = round(measurement["rf"] * 0.258, 3)
+            record["lastseen"] = measurement["c"]
+            self._serialize(device_id)
+            heapq.heappush(self._uploads, (upload + self._upload_interval, device_id))
+            updated += 1
+        if updated:
+            self.version += 1
+            self._responses.clear()
+        return updated
+
+    def response(self, device_ids: str) -> bytes:
+        """Return the serialized API response for a deviceids parameter.
+
+        Unknown device IDs are left out, like the real API does. The response
+        of a device list is cached until a device of the fleet uploads again.
+        """
+        self.advance()
+        cached = self._responses.get(device_ids)
+        if cached is not None:
+            return cached
+        records = [
+            self._serialized[device_id]
+            for device_id in device_ids.upper().split(",")
+            if device_id in self._serialized
+        ]
+        body = b'{"success":true,"devices":[' + b",".join(records) + b"]}"
+        self._responses[device_ids] = body
+        return body
+
+
+# Quotas of the real API (see docs/api_documentation.md, "API Rate Limits")
+RATE_LIMIT_CALLS = 3  # Max. calls per device within the window
+RATE_LIMIT_WINDOW_SECONDS = 60
+INVALID_CALL_LIMIT = 5  # Max. invalid calls per IP address within the window
+INVALID_CALL_WINDOW_SECONDS = 15 * 60
+
+# Fault options and their defaults (no faults)
+DEFAULT_FAULTS: Dict[str, Any] = {
+    "latency_ms": 0.0,  # Base latency of a response
+    "jitter_ms": 0.0,  # Uniform random latency added on top, 0 to jitter_ms
+    "spike_rate": 0.0,  # Share of responses with an extra latency spike
+    "spike_ms": 0.0,  # Latency of a spike
+    "trickle_bytes": 0,  # Send the body in chunks of this size (0: at once)
+    "trickle_delay_ms": 0.0,  # Delay between two chunks
+    "rate_limit": False,  # HTTP 429 above RATE_LIMIT_CALLS per device
+    "rate_limit_block_seconds": 7 * 60,  # Block of a device after HTTP 429
+    "invalid_call_limit": False,  # HTTP 403 above INVALID_CALL_LIMIT per IP
+    "ip_block_seconds": 15 * 60,  # Block of an IP address after HTTP 403
+    "malformed_rate": 0.0,  # Share of responses with truncated JSON
+    "error_rate": 0.0,  # Share of responses with "success": false
+    "error_codes": [1, 2, 3],  # Error codes of these responses
+}
+
+FAULT_PROFILES: Dict[str, Dict[str, Any]] = {
+    "none": {},
+    "slow": {"latency_ms": 1500.0, "jitter_ms": 1000.0},
+    "jitter": {
+        "latency_ms": 100.0,
+        "jitter_ms": 400.0,
+        "spike_rate": 0.05,
+        "spike_ms": 35000.0,  # Beyond the client timeout of 30 s
+    },
+    "trickle": {"trickle_bytes": 64, "trickle_delay_ms": 250.0},
+    "quota": {"rate_limit": True, "invalid_call_limit": True},
+    "flaky": {
+        "latency_ms": 50.0,
+        "jitter_ms": 200.0,
+        "malformed_rate": 0.1,
+        "error_rate": 0.2,
+    },
+    "worst": {
+        "latency_ms": 500.0,
+        "jitter_ms": 2000.0,
+        "spike_rate": 0.05,
+        "spike_ms": 35000.0,
+        "trickle_bytes": 256,
+        "trickle_delay_ms": 100.0,
+        "rate_limit": True,
+        "invalid_call_limit": True,
+        "malformed_rate": 0.05,
+        "error_rate": 0.1,
+    },
+}
+
+
+class FaultInjector:
+    """Faults of the lastmeasurement endpoint, configured by a fault profile.
+
+    The quotas are tracked like the real API does: calls per device ID and
+    invalid calls (unknown device IDs, no device IDs without a phone ID, or
+    an unreadable request) per IP address, each in a sliding window. A
+    discovery request (phone ID and empty device IDs) is valid. Exceeding
+    the quotas blocks the device (HTTP 429) or the IP address (HTTP 403) for
+    the configured time.
+    """
+
+    def __init__(
+        self,
+        profile: str = "none",
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the injector.
+
+        Args:
+            profile: Name of the fault profile, see FAULT_PROFILES
+            seed: Seed of the random faults, so runs are reproducible
+            clock: Time source of the quota windows (seconds)
+        """
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self.profile = "none"
+        self.faults: Dict[str, Any] = dict(DEFAULT_FAULTS)
+        self._device_calls: Dict[str, Deque[float]] = {}
+        self._device_blocks: Dict[str, float] = {}
+        self._invalid_calls: Dict[str, Deque[float]] = {}
+        self._ip_blocks: Dict[str, float] = {}
+        self.set_profile(profile)
+
+    def set_profile(self, profile: str) -> None:
+        """Select a fault profile and reset the quotas.
+
+        Raises:
+            ValueError: If the profile does not exist
+        """
+        if profile not in FAULT_PROFILES:
+            raise ValueError(f"Unknown fault profile: {profile}")
+        self.profile = profile
+        self.faults = {**DEFAULT_FAULTS, **FAULT_PROFILES[profile]}
+        self.reset()
+
+    def configure(self, options: Dict[str, Any]) -> None:
+        """Change single fault options of the current profile.
+
+        Raises:
+            ValueError: If an option does not exist
+        """
+        unknown = set(options) - set(DEFAULT_FAULTS)
+        if unknown:
+            raise ValueError(f"Unknown fault options: {', '.join(sorted(unknown))}")
+        self.faults.update(options)
+
+    def reset(self) -> None:
+        """Forget the calls and blocks of the quotas."""
+        self._device_calls.clear()
+        self._device_blocks.clear()
+        self._invalid_calls.clear()
+        self._ip_blocks.clear()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the profile and the fault options."""
+        return {
+            "profile": self.profile,
+            "profiles": sorted(FAULT_PROFILES),
+            "faults": self.faults,
+            "blocked_devices": len(self._device_blocks),
+            "blocked_ips": len(self._ip_blocks),
+        }
+
+    @staticmethod
+    def _count(
+        calls: Dict[str, Deque[float]], key: str, now: float, window: float
+    ) -> int:
+        """Record a call in a sliding window and return the calls in the window."""
+        window_calls = calls.setdefault(key, deque())
+        window_calls.append(now)
+        while window_calls[0] <= now - window:
+            window_calls.popleft()
+        return len(window_calls)
+
+    def latency(self) -> float:
+        """Return the latency of a response in seconds."""
+        latency = self.faults["latency_ms"] + self._rng.uniform(
+            0, self.faults["jitter_ms"]
+        )
+        if self._rng.random() < self.faults["spike_rate"]:
+            latency += self.faults["spike_ms"]
+        return latency / 1000
+
+    def check(
+        self,
+        remote: str,
+        device_ids: Optional[List[str]],
+        known: Collection[str],
+        phone_id: Optional[str] = None,
+    ) -> Optional[web.Response]:
+        """Apply the quotas and the error faults to a request.
+
+        Args:
+            remote: IP address of the client
+            device_ids: Requested device IDs, None if the request was unreadable
+            known: Device IDs the server knows
+            phone_id: Requested phone ID, if any
+
+        Returns:
+            The fault response, or None to answer the request normally
+        """
+        now = self._clock()
+        faults = self.faults
+        if faults["invalid_call_limit"]:
+            if self._ip_blocks.get(remote, 0) > now:
+                return web.json_response({"success": False}, status=403)
+            if (
+                device_ids is None
+                or (not device_ids and not phone_id)
+                or any(d not in known for d in device_ids)
+            ):
+                calls = self._count(
+                    self._invalid_calls, remote, now, INVALID_CALL_WINDOW_SECONDS
+                )
+                if calls > INVALID_CALL_LIMIT:
+                    _LOGGER.info("Fault: IP address %s blocked (403)", remote)
+                    self._ip_blocks[remote] = now + faults["ip_block_seconds"]
+                    return web.json_response({"success": False}, status=403)
+        if faults["rate_limit"] and device_ids:
+            limited = False
+            for device_id in (d for d in device_ids if d in known):
+                calls = self._count(
+                    self._device_calls, device_id, now, RATE_LIMIT_WINDOW_SECONDS
+                )
+                if self._device_blocks.get(device_id, 0) > now:
+                    limited = True
+                elif calls > RATE_LIMIT_CALLS:
+                    _LOGGER.info("Fault: Device %s rate limited (429)", device_id)
+                    self._device_blocks[device_id] = (
+                        now + faults["rate_limit_block_seconds"]
+                    )
+                    limited = True
+            if limited:
+                return web.json_response({"success": False}, status=429)
+        if self._rng.random() < faults["error_rate"]:
+            error_code = self._rng.choice(faults["error_codes"])
+            _LOGGER.info("Fault: errorcode %s", error_code)
+            return web.json_response(
+                {
+                    "success": False,
+                    "errorcode": error_code,
+                    "errormessage": f"Injected error {error_code}",
+                }
+            )
+        return None
+
+    def corrupt(self, body: bytes) -> bytes:
+        """Return the body, truncated JSON for the share of malformed responses."""
+        if body and self._rng.random() < self.faults["malformed_rate"]:
+            _LOGGER.info("Fault: malformed JSON")
+            return body[: self._rng.randint(0, len(body) - 1)]
+        return body
+
+
 class MockAPIServer:
     """Mock Mobile Alerts API Server."""
 
-    def __init__(self, port: int = 8888):
-        """Initialize the mock API server."""
+    def __init__(
+        self,
+        port: int = 8888,
+        fleet: Optional[SyntheticFleet] = None,
+        faults: Optional[FaultInjector] = None,
+    ):
+        """Initialize the mock API server.
+
+        Args:
+            port: Port to run the server on
+            fleet: Synthetic devices to serve instead of TEST_DEVICES
+            faults: Fault injector of the lastmeasurement endpoint
+        """
         self.port = port
+        self.fleet = fleet
+        self.faults = faults if faults is not None else FaultInjector()
         self.app = web.Application()
         self.runner = None
         self.site = None
@@ -198,12 +643,58 @@ class MockAPIServer:
 
     def _setup_routes(self) -> None:
         """Setup API routes."""
-        self.app.router.add_post("/api/pv1/device/lastmeasurement", self.handle_api)
+        self.app.router.add_post(
+            "/api/pv1/device/lastmeasurement", self.handle_lastmeasurement
+        )
         self.app.router.add_post("/api/pv1/device/register", self.handle_register)
         self.app.router.add_get("/health", self.handle_health)
+        self.app.router.add_get("/control/faults", self.handle_faults)
+        self.app.router.add_post("/control/faults", self.handle_faults)
+
+    async def handle_lastmeasurement(
+        self, request: web.Request
+    ) -> web.StreamResponse:
+        """Handle lastmeasurement API calls, with the faults of the profile."""
+        await asyncio.sleep(self.faults.latency())
+        phone_id: Optional[str] = None
+        try:
+            data = json.loads(await request.read())
+            device_ids: Optional[List[str]] = [
+                device_id.strip().upper()
+                for device_id in data.get("deviceids", "").split(",")
+                if device_id.strip()
+            ]
+            phone_id = data.get("phoneid")
+        except (ValueError, AttributeError):
+            device_ids = None
+        response = self.faults.check(
+            request.remote or "", device_ids, set(self._known_devices()), phone_id
+        )
+        if response is None:
+            response = await self.handle_api(request)
+        status = response.status
+        body = self.faults.corrupt(response.body)
+
+        chunk_size = self.faults.faults["trickle_bytes"]
+        if chunk_size <= 0:
+            return web.Response(
+                status=status, body=body, content_type="application/json"
+            )
+        stream = web.StreamResponse(status=status)
+        stream.content_type = "application/json"
+        stream.content_length = len(body)
+        await stream.prepare(request)
+        for offset in range(0, len(body), chunk_size):
+            if offset:
+                await asyncio.sleep(self.faults.faults["trickle_delay_ms"] / 1000)
+            await stream.write(body[offset : offset + chunk_size])
+        await stream.write_eof()
+        return stream
 
     async def handle_api(self, request: web.Request) -> web.Response:
         """Handle lastmeasurement API calls."""
+        if self.fleet is not None:
+            return await self._handle_fleet_api(request)
         try:
             data = await request.json()
             device_ids = data.get("deviceids", "").split(",")
@@ -222,7 +713,7 @@ class MockAPIServer:
                         int(datetime.now().timestamp()) + 5
                     )
                     devices.append(device_data)
-                    _LOGGER.info(
+                    _LOGGER.debug(
                         "API: Returning data for device %s (%s)",
                         device_id,
                         device_data.get("name", "Unknown"),
@@ -231,20 +722,43 @@ class MockAPIServer:
                     _LOGGER.warning("API: Device %s not found", device_id)
 
             response = {"success": True, "devices": devices}
-            _LOGGER.debug("API Response: %s", json.dumps(response, indent=2))
+            _LOGGER.info("API: Returning data for %d device(s)", len(devices))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("API Response: %s", json.dumps(response, indent=2))
             return web.json_response(response)
 
         except Exception as err:
             _LOGGER.error("API Error: %s", err)
             return web.json_response({"success": False, "error": str(err)}, status=500)
 
+    async def _handle_fleet_api(self, request: web.Request) -> web.Response:
+        """Handle a lastmeasurement API call in scale mode."""
+        try:
+            device_ids = json.loads(await request.read()).get("deviceids", "")
+        except (ValueError, AttributeError):
+            return web.json_response(
+                {"success": False, "error": "Invalid request"}, status=400
+            )
+        body = self.fleet.response(str(device_ids))
+        _LOGGER.debug("API: Returning %d bytes", len(body))
+        return web.Response(body=body, content_type="application/json")
+
+    def _known_devices(self) -> List[str]:
+        """Return the device IDs the server knows."""
+        if self.fleet is not None:
+            return list(self.fleet.records)
+        return list(TEST_DEVICES)
+
     async def handle_register(self, request: web.Request) -> web.Response:
         """Handle device registration."""
         try:
             data = await request.json()
             device_id = data.get("deviceid", "").strip().upper()
 
-            if device_id in TEST_DEVICES:
+            known = (
+                self.fleet.records if self.fleet is not None else TEST_DEVICES
+            )
+            if device_id in known:
                 _LOGGER.info("Register: Device %s registered successfully", device_id)
                 return web.json_response({"success": True, "deviceid": device_id})
             else:
@@ -259,14 +773,34 @@ class MockAPIServer:
 
     async def handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
+        devices = self._known_devices()
         return web.json_response(
             {
                 "status": "healthy",
-                "devices": list(TEST_DEVICES.keys()),
-                "device_count": len(TEST_DEVICES),
+                # A large fleet is only summarized
+                "devices": devices if len(devices) <= 100 else devices[:100],
+                "device_count": len(devices),
             }
         )
 
+    async def handle_faults(self, request: web.Request) -> web.Response:
+        """Show or change the fault profile and options.
+
+        A POST body selects a profile ({"profile": "quota"}), changes single
+        options ({"error_rate": 0.5}) or both, the profile first.
+        """
+        if request.method == "POST":
+            try:
+                options = dict(json.loads(await request.read() or b"{}"))
+                profile = options.pop("profile", None)
+                if profile is not None:
+                    self.faults.set_profile(profile)
+                self.faults.configure(options)
+            except (TypeError, ValueError) as err:
+                return web.json_response({"error": str(err)}, status=400)
+            _LOGGER.info("Faults: %s", self.faults.as_dict())
+        return web.json_response(self.faults.as_dict())
+
     async def start(self) -> None:
         """Start the mock API server."""
         self.runner = web.AppRunner(self.app)
@@ -280,13 +814,17 @@ class MockAPIServer:
         _LOGGER.info("Server running on: http://0.0.0.0:%d", self.port)
         _LOGGER.info("Health check: http://localhost:%d/health", self.port)
         _LOGGER.info("")
-        _LOGGER.info("Available test devices:")
-        for device_id, device_info in TEST_DEVICES.items():
-            _LOGGER.info(
-                "  - %s: %s",
-                device_id,
-                device_info.get("name", "Unknown"),
-            )
+        _LOGGER.info("Fault profile: %s", self.faults.profile)
+        if self.fleet is not None:
+            _LOGGER.info("Synthetic fleet of %d devices", len(self.fleet))
+        else:
+            _LOGGER.info("Available test devices:")
+            for device_id, device_info in TEST_DEVICES.items():
+                _LOGGER.info(
+                    "  - %s: %s",
+                    device_id,
+                    device_info.get("name", "Unknown"),
+                )
         _LOGGER.info("")
         _LOGGER.info("Configure Home Assistant to use this mock server:")
         _LOGGER.info(
@@ -302,9 +840,19 @@ class MockAPIServer:
             _LOGGER.info("Mock API Server stopped")
 
 
-async def run_server(port: int = 8888) -> None:
+async def run_server(
+    port: int = 8888,
+    fleet_size: int = 0,
+    upload_interval: float = 420.0,
+    profile: str = "none",
+) -> None:
     """Run the mock API server."""
-    server = MockAPIServer(port=port)
+    fleet = (
+        SyntheticFleet(fleet_size, upload_interval=upload_interval)
+        if fleet_size > 0
+        else None
+    )
+    server = MockAPIServer(port=port, fleet=fleet, faults=FaultInjector(profile))
     await server.start()
 
     # Handle shutdown gracefully
@@ -334,9 +882,34 @@ def main() -> None:
         default=int(os.getenv("MOCK_API_PORT", "8888")),
         help="Port to run the server on (default: 8888)",
     )
+    parser.add_argument(
+        "--fleet",
+        type=int,
+        default=int(os.getenv("MOCK_API_FLEET", "0")),
+        help="Serve N synthetic devices across all models (default: 0, off)",
+    )
+    parser.add_argument(
+        "--upload-interval",
+        type=float,
+        default=420.0,
+        help="Seconds between two measurements of a synthetic device",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(FAULT_PROFILES),
+        default=os.getenv("MOCK_API_PROFILE", "none"),
+        help="Fault profile of the lastmeasurement endpoint (default: none)",
+    )
     args = parser.parse_args()
 
-    asyncio.run(run_server(port=args.port))
+    asyncio.run(
+        run_server(
+            port=args.port,
+            fleet_size=args.fleet,
+            upload_interval=args.upload_interval,
+            profile=args.profile,
+        )
+    )
 
 
 if __name__ == "__main__":
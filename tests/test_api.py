@@ -1,8 +1,19 @@
 """Tests for Mobile Alerts API."""
 
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
-from custom_components.mobile_alerts.api import MobileAlertsApi
+from custom_components.mobile_alerts import api as api_module
+from custom_components.mobile_alerts.api import (
+    ApiBlockedError,
+    ApiError,
+    ApiIpBlockedError,
+    ApiRateLimitedError,
+    MobileAlertsApi,
+)
 
 
 @pytest.mark.asyncio
@@ -135,3 +146,313 @@ def test_get_reading_nonexistent_device(fake_device_ids, mock_api_response):
 
     reading = api.get_reading("NONEXISTENT")
     assert reading is None
+
+
+@pytest.mark.asyncio
+async def test_api_uses_shared_session():
+    """Test that a shared session is reused and not closed by the client."""
+    session = MagicMock()
+    session.closed = False
+    session.close = AsyncMock()
+
+    api = MobileAlertsApi(phone_id="123456789", session=session)
+    assert api._get_session() is session
+    assert api._get_session() is session
+
+    await api.async_close()
+    session.close.assert_not_called()
+
+
+def test_get_reading_uses_device_index(fake_device_ids, mock_api_response):
+    """Test that the deviceid index follows data updates."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._data = mock_api_response["devices"]
+
+    assert set(api._index) == set(fake_device_ids)
+    assert api.get_reading(fake_device_ids[3]) is mock_api_response["devices"][3]
+
+    # Replace a single device record
+    updated = {"deviceid": fake_device_ids[3], "measurement": {"idx": 1, "t1": 5.0}}
+    api.update_device(updated)
+    assert api.get_reading(fake_device_ids[3]) is updated
+    assert len(api._data) == len(fake_device_ids)
+
+    # Clearing the data clears the index
+    api._data = None
+    assert api._index == {}
+    assert api.get_reading(fake_device_ids[3]) is None
+
+
+@pytest.mark.asyncio
+async def test_device_accessors(fake_device_ids, mock_api_response):
+    """Test the public accessors of the registered devices and their records."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._post_api_request = AsyncMock(return_value=mock_api_response)
+    await api.register_device(fake_device_ids[0])
+
+    assert api.phone_id == "123456789"
+    assert api.device_ids == (fake_device_ids[0],)
+    assert api.get_device(fake_device_ids[0]) is mock_api_response["devices"][0]
+    assert api.get_device("000000000000") is None
+
+    devices = api.devices
+    assert devices == mock_api_response["devices"]
+    devices.clear()
+    assert api.get_reading(fake_device_ids[0]) is mock_api_response["devices"][0]
+
+
+@pytest.mark.asyncio
+async def test_register_device_coalesces_requests(fake_device_ids, mock_api_response):
+    """Test that concurrent registrations are fetched in one request."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._post_api_request = AsyncMock(return_value=mock_api_response)
+
+    with patch("custom_components.mobile_alerts.api.REGISTER_COALESCE_SECONDS", 0):
+        await asyncio.gather(
+            *(api.register_device(device_id) for device_id in fake_device_ids[:3])
+        )
+
+    api._post_api_request.assert_awaited_once()
+    payload = api._post_api_request.await_args.args[0]
+    assert payload["deviceids"] == ",".join(fake_device_ids[:3])
+    assert api._device_ids == fake_device_ids[:3]
+    for device_id in fake_device_ids[:3]:
+        assert api.get_reading(device_id) is not None
+
+
+@pytest.mark.asyncio
+async def test_register_device_error_reaches_all_callers(fake_device_ids):
+    """Test that a failed coalesced fetch fails every waiting registration."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._post_api_request = AsyncMock(side_effect=ApiError("HTTP 500"))
+
+    with patch("custom_components.mobile_alerts.api.REGISTER_COALESCE_SECONDS", 0):
+        results = await asyncio.gather(
+            *(api.register_device(device_id) for device_id in fake_device_ids[:2]),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, ApiError) for result in results)
+    api._post_api_request.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_merged(mock_api_response):
+    """Test that an identical in-flight request is not sent twice."""
+    api = MobileAlertsApi(phone_id="123456789")
+    release = asyncio.Event()
+
+    async def slow_send(request_payload):
+        await release.wait()
+        return mock_api_response
+
+    api._send_api_request = AsyncMock(side_effect=slow_send)
+    payload = {"deviceids": "A1B2C3D4E5F6"}
+
+    first = asyncio.create_task(api._post_api_request(payload))
+    second = asyncio.create_task(api._post_api_request(dict(payload)))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is mock_api_response
+    assert await second is mock_api_response
+    api._send_api_request.assert_awaited_once()
+    assert api._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_request_refused_without_invalid_call_budget():
+    """Test that no request is sent once the invalid call budget is used up."""
+    api = MobileAlertsApi(phone_id="123456789")
+    for _ in range(5):
+        api._rate_limiter.record_invalid_call()
+
+    with pytest.raises(ApiError):
+        await api._post_api_request({"deviceids": "A1B2C3D4E5F6"})
+
+
+@pytest.mark.asyncio
+async def test_verified_devices_polled_without_invalid_call_budget():
+    """Test that polls of verified devices go through when the budget is used up."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._device_ids = ["A1B2C3D4E5F6"]
+    api.restore([{"deviceid": "A1B2C3D4E5F6", "measurement": {"idx": 1}}])
+    for _ in range(5):
+        api._rate_limiter.record_invalid_call()
+    response = MagicMock(status=200)
+    response.read = AsyncMock(
+        return_value=json.dumps(
+            {"success": True, "devices": [{"deviceid": "A1B2C3D4E5F6"}]}
+        ).encode()
+    )
+    session = MagicMock(closed=False)
+    session.post.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.post.return_value.__aexit__ = AsyncMock(return_value=None)
+    api._session = session
+
+    await api.fetch_data()
+    session.post.assert_called_once()
+
+    # Unverified devices and discovery probes wait for the budget
+    with pytest.raises(ApiBlockedError) as err:
+        await api._post_api_request({"deviceids": "B2C3D4E5F6A7"})
+    assert 0 < err.value.retry_after <= 15 * 60
+    with pytest.raises(ApiBlockedError):
+        await api.discover_devices()
+    session.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_response_blocks_devices():
+    """Test that HTTP 429 raises a typed error and blocks the devices."""
+    api = MobileAlertsApi(phone_id="123456789")
+
+    with pytest.raises(ApiRateLimitedError) as err:
+        api._raise_for_status(429, ["A1B2C3D4E5F6"])
+    assert err.value.retry_after == 7 * 60
+
+    # The next request is refused locally instead of extending the block
+    with pytest.raises(ApiRateLimitedError):
+        await api._post_api_request({"deviceids": "A1B2C3D4E5F6"})
+
+
+@pytest.mark.asyncio
+async def test_ip_blocked_response_blocks_requests():
+    """Test that HTTP 403 raises a typed error and blocks all requests."""
+    api = MobileAlertsApi(phone_id="123456789")
+
+    with pytest.raises(ApiIpBlockedError):
+        api._raise_for_status(403, [])
+
+    with pytest.raises(ApiIpBlockedError):
+        await api._post_api_request({"deviceids": "B2C3D4E5F6A7"})
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_splits_into_chunks(fake_device_ids, mock_api_response):
+    """Test that large batches are fetched in concurrent chunks."""
+    api = MobileAlertsApi(phone_id="123456789", chunk_size=2)
+    api._device_ids = list(fake_device_ids)
+    devices = {device["deviceid"]: device for device in mock_api_response["devices"]}
+
+    async def send(request_payload):
+        requested = request_payload["deviceids"].split(",")
+        return {
+            "devices": [devices[device_id] for device_id in requested if device_id in devices]
+        }
+
+    api._post_api_request = AsyncMock(side_effect=send)
+    await api.fetch_data()
+
+    payloads = [call.args[0]["deviceids"] for call in api._post_api_request.await_args_list]
+    assert all(len(ids.split(",")) <= 2 for ids in payloads)
+    assert ",".join(payloads) == ",".join(fake_device_ids)
+    for device_id in devices:
+        assert api.get_reading(device_id) is devices[device_id]
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_failed_chunk_keeps_other_chunks(
+    fake_device_ids, mock_api_response
+):
+    """Test that a failed chunk only drops its own devices."""
+    api = MobileAlertsApi(phone_id="123456789", chunk_size=1)
+    api._device_ids = list(fake_device_ids[:2])
+    api._data = mock_api_response["devices"]
+
+    async def send(request_payload):
+        if request_payload["deviceids"] == fake_device_ids[1]:
+            raise ApiError("HTTP 500")
+        return {"devices": [mock_api_response["devices"][0]]}
+
+    api._post_api_request = AsyncMock(side_effect=send)
+    await api.fetch_data()
+
+    assert api.get_reading(fake_device_ids[0]) is not None
+    assert api.get_reading(fake_device_ids[1]) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_blocked_chunk_keeps_last_data(
+    fake_device_ids, mock_api_response
+):
+    """Test that a rate limited chunk keeps its last good records."""
+    api = MobileAlertsApi(phone_id="123456789", chunk_size=1)
+    api._device_ids = list(fake_device_ids[:2])
+    api._data = mock_api_response["devices"]
+
+    async def send(request_payload):
+        if request_payload["deviceids"] == fake_device_ids[1]:
+            raise ApiRateLimitedError("HTTP 429", 420)
+        return {"devices": [mock_api_response["devices"][0]]}
+
+    api._post_api_request = AsyncMock(side_effect=send)
+    await api.fetch_data()
+
+    assert api.get_reading(fake_device_ids[1]) is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_batch_all_chunks_failed_raises(fake_device_ids):
+    """Test that the error is raised when every chunk fails."""
+    api = MobileAlertsApi(phone_id="123456789", chunk_size=1)
+    api._device_ids = list(fake_device_ids[:2])
+    api._post_api_request = AsyncMock(side_effect=ApiError("HTTP 500"))
+
+    with pytest.raises(ApiError):
+        await api.fetch_data()
+
+
+def _session_returning(body: bytes) -> MagicMock:
+    """Return a session whose POST responds with HTTP 200 and the body."""
+    response = MagicMock()
+    response.status = 200
+    response.read = AsyncMock(return_value=body)
+    response.text = AsyncMock(side_effect=AssertionError("text() must not be used"))
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.closed = False
+    session.post = MagicMock(return_value=context)
+    return session
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_response_decoded_from_bytes(mock_api_response, use_orjson):
+    """Test that responses are decoded from the raw body, with either backend."""
+    body = json.dumps({"success": True, **mock_api_response}).encode()
+    api = MobileAlertsApi(phone_id="123456789", session=_session_returning(body))
+
+    with patch.object(api_module, "orjson", api_module.orjson if use_orjson else None):
+        response = await api._post_api_request({"deviceids": "A1B2C3D4E5F6"})
+        devices = await api.discover_devices()
+
+    assert response["devices"] == mock_api_response["devices"]
+    assert devices == mock_api_response["devices"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_response_raises():
+    """Test that an invalid JSON body raises an ApiError."""
+    api = MobileAlertsApi(phone_id="123456789", session=_session_returning(b"<html>"))
+
+    with pytest.raises(ApiError, match="Invalid JSON"):
+        await api._post_api_request({"deviceids": "A1B2C3D4E5F6"})
+
+
+def test_get_measurement_decodes_once_per_record(fake_device_ids, mock_api_response):
+    """Test that a record is decoded once and again after it was replaced."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._data = mock_api_response["devices"]
+
+    measurement = api.get_measurement(fake_device_ids[0])
+    assert measurement is not None
+    assert api.get_measurement(fake_device_ids[0]) is measurement
+
+    api.update_device({"deviceid": fake_device_ids[0], "measurement": {"t1": 5.0}})
+    updated = api.get_measurement(fake_device_ids[0])
+    assert updated is not measurement
+    assert updated.t1 == 5.0
+    assert api.get_measurement("NONEXISTENT") is None
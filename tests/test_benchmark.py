@@ -0,0 +1,27 @@
+"""Smoke test of the benchmark suite, so it keeps working as the code changes."""
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.mobile_alerts.device import TYPE_ID_MODELS
+
+from tests.benchmark import benchmark_size, compare, synthetic_fleet
+
+
+def test_synthetic_fleet_covers_all_type_ids():
+    """Test that the synthetic fleet is reproducible and covers all type IDs."""
+    fleet = synthetic_fleet(len(TYPE_ID_MODELS) * 2)
+
+    assert fleet == synthetic_fleet(len(TYPE_ID_MODELS) * 2)
+    assert {device["deviceid"][:2] for device in fleet} == set(TYPE_ID_MODELS)
+    assert synthetic_fleet(3, generation=1)[0]["measurement"]["idx"] == 1001
+
+
+async def test_benchmark_small_fleet(hass: HomeAssistant):
+    """Test one benchmark round and the comparison with a baseline."""
+    results = await benchmark_size(hass, 20, repeat=1)
+
+    assert results["entities"] > 20
+    assert "MobileAlertsTemperatureSensor" in results["extract_reading_us"]
+    current = {"results": {"20": results}}
+    baseline = {"results": {"20": {**results, "fetch_batch_ms": 1e-9}}}
+    assert compare(current, baseline, tolerance=1.5) == ["20/fetch_batch_ms"]
@@ -0,0 +1,86 @@
+"""Tests for the upload cadence tracker."""
+
+from custom_components.mobile_alerts.cadence import CadenceTracker
+from custom_components.mobile_alerts.coordinator import SCAN_INTERVAL
+
+DEVICE_ID = "A1B2C3D4E5F6"
+OTHER_DEVICE_ID = "B2C3D4E5F6A7"
+
+
+def test_interval_learned_across_missed_uploads():
+    """Test that the interval is per measurement, not per poll."""
+    tracker = CadenceTracker()
+    tracker.observe(DEVICE_ID, 1000.0, 10)
+    tracker.observe(DEVICE_ID, 1000.0 + 3 * 420, 13)
+
+    assert tracker.interval_for(DEVICE_ID) == 420
+
+
+def test_interval_is_smoothed():
+    """Test that a new interval only moves the average partially."""
+    tracker = CadenceTracker()
+    tracker.observe(DEVICE_ID, 0.0, 1)
+    tracker.observe(DEVICE_ID, 400.0, 2)
+    tracker.observe(DEVICE_ID, 900.0, 3)
+
+    assert tracker.interval_for(DEVICE_ID) == 400 + 0.3 * 100
+
+
+def test_unchanged_and_event_uploads_are_ignored():
+    """Test that repeated data and event-driven uploads keep the interval."""
+    tracker = CadenceTracker()
+    tracker.observe(DEVICE_ID, 0.0, 1)
+    tracker.observe(DEVICE_ID, 420.0, 2)
+    tracker.observe(DEVICE_ID, 420.0, 2)
+    tracker.observe(DEVICE_ID, 430.0, 3)
+
+    assert tracker.interval_for(DEVICE_ID) == 420
+
+
+def test_poll_delay_waits_for_next_expected_upload():
+    """Test that the poll waits for the next upload of any device."""
+    tracker = CadenceTracker()
+    for device_id, last_upload in ((DEVICE_ID, 1000.0), (OTHER_DEVICE_ID, 1200.0)):
+        tracker.observe(device_id, last_upload - 420, 1)
+        tracker.observe(device_id, last_upload, 2)
+
+    # Next uploads at 1420 and 1620
+    assert tracker.poll_delay(1300.0, 600) == 120 + 30
+
+
+def test_poll_delay_with_staggered_uploads():
+    """Test that many devices with staggered uploads still shorten the delay."""
+    tracker = CadenceTracker()
+    # 20 devices uploading every 7 minutes, spread over the interval
+    for i in range(20):
+        last_upload = 1000.0 + i * 21
+        tracker.observe(f"DEVICE{i:06d}", last_upload - 420, 1)
+        tracker.observe(f"DEVICE{i:06d}", last_upload, 2)
+
+    delay = tracker.poll_delay(1410.0, SCAN_INTERVAL.total_seconds())
+    # The first upload is due at 1420, the minimum delay applies
+    assert delay == 120
+    assert delay < SCAN_INTERVAL.total_seconds()
+
+
+def test_poll_delay_is_clamped():
+    """Test the bounds of the poll delay."""
+    tracker = CadenceTracker()
+    assert tracker.poll_delay(0.0, 600) == 600
+
+    tracker.observe(DEVICE_ID, 0.0, 1)
+    tracker.observe(DEVICE_ID, 60.0, 2)
+    assert tracker.poll_delay(60.0, 600) == 120
+
+
+def test_invalid_records_are_skipped():
+    """Test that records without a numeric c/idx do not raise."""
+    tracker = CadenceTracker()
+    tracker.observe_devices(
+        [
+            {"deviceid": DEVICE_ID, "measurement": {"idx": "0E7EA4A71203", "c": 0}},
+            {"deviceid": OTHER_DEVICE_ID},
+        ]
+    )
+
+    assert tracker.interval_for(DEVICE_ID) is None
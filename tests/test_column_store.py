@@ -0,0 +1,128 @@
+"""Tests for the NumPy column store of Mobile Alerts measurements."""
+
+import random
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.mobile_alerts.api import MobileAlertsApi
+from custom_components.mobile_alerts.column_store import (
+    ColumnMeasurement,
+    ColumnStore,
+)
+from custom_components.mobile_alerts.measurement import (
+    MEASUREMENT_FIELDS,
+    NOT_CONNECTED,
+    OUT_OF_RANGE,
+    Measurement,
+)
+
+pytest.importorskip("numpy")
+
+RECORDS = [
+    {
+        "deviceid": "0B1234567890",
+        "measurement": {
+            "idx": 43530,
+            "ts": 1761498841,
+            "c": 1761498849,
+            "ws": 2.5,
+            "wg": "4.1",
+            "wd": 3,
+            "lowbattery": True,
+        },
+    },
+    {
+        "deviceid": "021234567890",
+        "measurement": {"idx": 7, "t1": 43530, "h": 65295, "c": "2025-10-26T17:14:09"},
+    },
+    {
+        "deviceid": "101234567890",
+        "measurement": {"idx": 8, "w": "true", "rf": 12.7, "wd": 43530},
+    },
+    {
+        "deviceid": "081234567890",
+        "measurement": {"idx": 9, "rf": 43530, "kp1c": 65295, "ppm": 43530},
+    },
+    {"deviceid": "201234567890"},
+]
+
+
+def _same(column_value, record_value):
+    """Compare a column store value with the per-record value."""
+    if isinstance(record_value, float):
+        return column_value == pytest.approx(record_value)
+    return column_value == record_value and type(column_value) is type(record_value)
+
+
+def _assert_equivalent(records):
+    """Assert that the column store decodes like Measurement.from_record."""
+    store = ColumnStore(records)
+    for record in records:
+        expected = Measurement.from_record(record)
+        actual = store.measurement(record["deviceid"])
+        if expected is None:
+            assert actual is None
+            continue
+        for key in (*MEASUREMENT_FIELDS, "idx", "ts", "c", "last_seen", "low_battery"):
+            assert _same(getattr(actual, key), getattr(expected, key)), key
+        for key in MEASUREMENT_FIELDS:
+            assert _same(actual.get(key), expected.get(key)), key
+
+
+def test_special_values_are_masked():
+    """Test that 43530 and 65295 are masked as explicit states."""
+    store = ColumnStore(RECORDS)
+
+    assert store.measurement("021234567890").t1 is NOT_CONNECTED
+    assert store.measurement("021234567890").h is OUT_OF_RANGE
+    assert store.measurement("101234567890").wd_degrees is NOT_CONNECTED
+    # idx is a counter, not a measured value
+    assert store.measurement("0B1234567890").idx == 43530
+    assert store.measurement("0B1234567890").wd_degrees == 67.5
+    # Counters reaching the special values are not masked
+    assert store.measurement("081234567890").rf == 43530
+    assert store.measurement("081234567890").kp1c == 65295
+
+
+def test_equivalent_to_per_record_decoding():
+    """Test that the column store matches the per-record decoding."""
+    _assert_equivalent(RECORDS)
+    # An invalid value falls back to value by value conversion
+    _assert_equivalent(
+        [*RECORDS, {"deviceid": "031234567890", "measurement": {"t1": "n/a"}}]
+    )
+
+
+def test_equivalent_on_random_fleet():
+    """Test the equivalence on a random fleet with special values."""
+    rng = random.Random(42)
+    keys = ["t1", "t2", "h", "rf", "wd", "ws", "ap", "ppm", "kp1c"]
+    records = []
+    for i in range(300):
+        measurement = {"idx": i, "ts": 1761498000 + i, "c": 1761498000 + i}
+        for key in rng.sample(keys, 4):
+            measurement[key] = rng.choice(
+                [43530, 65295, round(rng.uniform(-20, 40), 1), rng.randint(0, 15)]
+            )
+        records.append({"deviceid": f"{i:012X}", "measurement": measurement})
+
+    _assert_equivalent(records)
+
+
+@pytest.mark.asyncio
+async def test_api_uses_column_store_for_large_batches(mock_api_response):
+    """Test that the API client backs large batches with the column store."""
+    api = MobileAlertsApi(phone_id="123456789", column_store_min_devices=2)
+    api._device_ids = [device["deviceid"] for device in mock_api_response["devices"]]
+    api._post_api_request = AsyncMock(return_value=mock_api_response)
+    await api.fetch_data()
+
+    device_id = api._device_ids[0]
+    measurement = api.get_measurement(device_id)
+    assert isinstance(measurement, ColumnMeasurement)
+    assert measurement.t1 == Measurement.from_record(api.get_reading(device_id)).t1
+
+    # A replaced record is decoded on its own
+    api.update_device({"deviceid": device_id, "measurement": {"t1": 5.0}})
+    assert isinstance(api.get_measurement(device_id), Measurement)
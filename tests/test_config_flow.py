@@ -3,8 +3,10 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 from homeassistant.const import CONF_DEVICE_ID, CONF_NAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.mobile_alerts.config_flow import MobileAlertsConfigFlow
+from custom_components.mobile_alerts.const import CONF_MODEL_ID, CONF_PHONE_ID, DOMAIN
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
@@ -61,3 +63,82 @@ async def test_config_flow_user_step_api_error(hass):
         assert result["step_id"] == "user"
         assert "errors" in result
         assert result["errors"]["base"] == "api_error"
+
+
+@pytest.mark.asyncio
+async def test_config_flow_import_phone_id(hass):
+    """Test that all devices of a phone ID are imported from one request."""
+    flow = MobileAlertsConfigFlow()
+    flow.hass = hass
+    flow.context = {"source": "user"}
+    devices = [
+        {"deviceid": "0B002FA7C3D3", "measurement": {"ws": 1.0, "wg": 2.0, "wd": 3}},
+        {"deviceid": "10002FA7C3D4", "measurement": {"w": True}},
+        # Ambiguous without a known type ID, skipped
+        {"deviceid": "A1B2C3D4E5F6", "measurement": {"t1": 1.0, "t2": 2.0, "h": 3}},
+    ]
+
+    with patch(
+        "custom_components.mobile_alerts.config_flow.MobileAlertsApi"
+    ) as mock_api_class, patch.object(
+        hass.config_entries.flow, "async_init", AsyncMock()
+    ) as mock_init:
+        mock_api = AsyncMock()
+        mock_api_class.return_value = mock_api
+        mock_api.discover_devices = AsyncMock(return_value=devices)
+
+        result = await flow.async_step_user({CONF_PHONE_ID: "123456789"})
+        await hass.async_block_till_done()
+
+    mock_api.discover_devices.assert_awaited_once()
+    mock_api.register_device.assert_not_awaited()
+    assert result["type"] == "create_entry"
+    assert result["data"][CONF_DEVICE_ID] == "0B002FA7C3D3"
+    assert result["data"][CONF_MODEL_ID] == "MA10660"
+    assert result["data"][CONF_PHONE_ID] == "123456789"
+
+    mock_init.assert_called_once()
+    assert mock_init.call_args.kwargs["context"] == {"source": "import"}
+    assert mock_init.call_args.kwargs["data"][CONF_MODEL_ID] == "MA10800"
+    assert set(hass.data[DOMAIN]["seed_devices"]) == {"0B002FA7C3D3", "10002FA7C3D4"}
+
+
+@pytest.mark.asyncio
+async def test_config_flow_rejects_device_id_with_phone_id(hass):
+    """Test that a device ID together with a phone ID is not silently ignored."""
+    flow = MobileAlertsConfigFlow()
+    flow.hass = hass
+
+    with patch(
+        "custom_components.mobile_alerts.config_flow.MobileAlertsApi"
+    ) as mock_api_class:
+        result = await flow.async_step_user(
+            {CONF_DEVICE_ID: "0B002FA7C3D3", CONF_PHONE_ID: "123456789"}
+        )
+
+    mock_api_class.assert_not_called()
+    assert result["type"] == "form"
+    assert result["errors"]["base"] == "phone_id_with_device_id"
+
+
+@pytest.mark.asyncio
+async def test_config_flow_import_abort_drops_seed(hass):
+    """Test that an aborted import does not keep the handed over record."""
+    MockConfigEntry(domain=DOMAIN, unique_id="10002FA7C3D4").add_to_hass(hass)
+    hass.data.setdefault(DOMAIN, {})["seed_devices"] = {
+        "10002FA7C3D4": {"deviceid": "10002FA7C3D4", "measurement": {"w": True}}
+    }
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": "import"},
+        data={
+            CONF_DEVICE_ID: "10002FA7C3D4",
+            CONF_NAME: "Contact",
+            CONF_MODEL_ID: "MA10800",
+            CONF_PHONE_ID: "123456789",
+        },
+    )
+
+    assert result["type"] == "abort"
+    assert result["reason"] == "already_configured"
+    assert hass.data[DOMAIN]["seed_devices"] == {}
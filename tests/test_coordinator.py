@@ -0,0 +1,287 @@
+"""Tests for the Mobile Alerts data update coordinator."""
+
+import copy
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from custom_components.mobile_alerts.api import (
+    ApiError,
+    ApiIpBlockedError,
+    ApiRateLimitedError,
+    MobileAlertsApi,
+)
+from custom_components.mobile_alerts.coordinator import (
+    SCAN_INTERVAL,
+    MobileAlertsCoordinator,
+)
+
+
+@pytest.fixture
+def mock_api(mock_api_response):
+    """Create a mock API client returning the mock API response."""
+    api = MagicMock()
+    api.fetch_data = AsyncMock(return_value=mock_api_response)
+    api.measurement_stamps = MagicMock(return_value={})
+    api.snapshot = MagicMock(return_value=[])
+    return api
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_serves_stale_data(hass: HomeAssistant, mock_api):
+    """Test that a rate limit block keeps the last good data available."""
+    coordinator = MobileAlertsCoordinator(hass, mock_api)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not coordinator.is_stale
+
+    mock_api.fetch_data.side_effect = ApiRateLimitedError("HTTP 429", 420)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.is_stale
+    assert coordinator.data["stale"] is True
+    assert coordinator.data["last_success"] is not None
+    assert len(coordinator.data["devices"]) == 8
+
+    # No request is made during the block window
+    mock_api.fetch_data.reset_mock()
+    await coordinator.async_refresh()
+    mock_api.fetch_data.assert_not_awaited()
+    assert coordinator.data["stale"] is True
+
+
+@pytest.mark.asyncio
+async def test_ip_block_extends_update_interval(hass: HomeAssistant, mock_api):
+    """Test that the next poll is scheduled after an IP block window."""
+    coordinator = MobileAlertsCoordinator(hass, mock_api)
+    await coordinator.async_refresh()
+
+    mock_api.fetch_data.side_effect = ApiIpBlockedError("HTTP 403", 900)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.update_interval > timedelta(seconds=900)
+
+
+@pytest.mark.asyncio
+async def test_block_without_previous_data_fails(hass: HomeAssistant, mock_api):
+    """Test that a block before the first good update marks the update failed."""
+    mock_api.fetch_data.side_effect = ApiRateLimitedError("HTTP 429", 420)
+    coordinator = MobileAlertsCoordinator(hass, mock_api)
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+
+
+@pytest.mark.asyncio
+async def test_api_error_fails_update(hass: HomeAssistant, mock_api):
+    """Test that other API errors still mark the update as failed."""
+    coordinator = MobileAlertsCoordinator(hass, mock_api)
+    await coordinator.async_refresh()
+
+    mock_api.fetch_data.side_effect = ApiError("HTTP 500")
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval == SCAN_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_only_changed_devices_are_notified(
+    hass: HomeAssistant, fake_device_ids, mock_api_response
+):
+    """Test that only devices with a new measurement idx/ts write their state."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._device_ids = list(fake_device_ids[:2])
+    response = copy.deepcopy(mock_api_response)
+    api._post_api_request = AsyncMock(return_value=response)
+    coordinator = MobileAlertsCoordinator(hass, api)
+
+    await coordinator.async_refresh()
+    # First refresh writes every entity
+    assert coordinator.device_changed(fake_device_ids[0])
+    assert coordinator.device_changed(fake_device_ids[1])
+
+    await coordinator.async_refresh()
+    assert not coordinator.device_changed(fake_device_ids[0])
+    assert not coordinator.device_changed(fake_device_ids[1])
+
+    response["devices"][1]["measurement"]["idx"] += 1
+    await coordinator.async_refresh()
+    assert not coordinator.device_changed(fake_device_ids[0])
+    assert coordinator.device_changed(fake_device_ids[1])
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_notifies_all_devices(
+    hass: HomeAssistant, fake_device_ids, mock_api_response
+):
+    """Test that all entities write their state on failure and on recovery."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._device_ids = list(fake_device_ids[:2])
+    api._post_api_request = AsyncMock(return_value=mock_api_response)
+    coordinator = MobileAlertsCoordinator(hass, api)
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert not coordinator.device_changed(fake_device_ids[0])
+
+    api._post_api_request.side_effect = ApiError("HTTP 500")
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.device_changed(fake_device_ids[0])
+
+    api._post_api_request.side_effect = None
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.device_changed(fake_device_ids[0])
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_restored(
+    hass: HomeAssistant, hass_storage, fake_device_ids, mock_api_response
+):
+    """Test that the last good data is persisted and restored without API calls."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._device_ids = list(fake_device_ids[:2])
+    api._post_api_request = AsyncMock(return_value=mock_api_response)
+    store = Store(hass, 1, "mobile_alerts.snapshot.123456789")
+    coordinator = MobileAlertsCoordinator(hass, api, store=store)
+    await coordinator.async_refresh()
+    await store.async_save(coordinator._snapshot_data())
+
+    restored_api = MobileAlertsApi(phone_id="123456789")
+    restored_api._post_api_request = AsyncMock()
+    restored = MobileAlertsCoordinator(
+        hass, restored_api, store=Store(hass, 1, "mobile_alerts.snapshot.123456789")
+    )
+    assert await restored.async_restore_snapshot()
+    await restored_api.register_device(fake_device_ids[0])
+
+    restored_api._post_api_request.assert_not_awaited()
+    assert restored.data["stale"] is True
+    assert restored.is_stale
+    assert len(restored.data["devices"]) == 2
+    assert restored.get_reading(fake_device_ids[0]) == mock_api_response["devices"][0]
+
+
+@pytest.mark.asyncio
+async def test_poll_follows_upload_cadence(hass: HomeAssistant, mock_api):
+    """Test that the next poll is planned after the next expected upload."""
+    coordinator = MobileAlertsCoordinator(hass, mock_api)
+    now = dt_util.utcnow().timestamp()
+    records = [
+        {"deviceid": "A1B2C3D4E5F6", "measurement": {"idx": 10, "c": now - 900}},
+        # Two uploads of 7 minutes since the last poll
+        {"deviceid": "A1B2C3D4E5F6", "measurement": {"idx": 12, "c": now - 60}},
+    ]
+    for record in records:
+        mock_api.snapshot.return_value = [record]
+        await coordinator.async_refresh()
+
+    # Next upload in 6 minutes, polled 30 seconds later
+    assert coordinator.update_interval == timedelta(seconds=6 * 60 + 30)
+    assert coordinator.upload_intervals == {"A1B2C3D4E5F6": 420}
+
+
+@pytest.mark.asyncio
+async def test_refresh_records_history(hass: HomeAssistant, mock_api_response):
+    """Test that each refresh adds the new measurements to the history."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = mock_api_response["devices"][0]
+    device_id = device["deviceid"]
+    api._device_ids = [device_id]
+    responses = [
+        {
+            **device,
+            "measurement": {**device["measurement"], "idx": idx, "ts": ts, "t1": t1},
+        }
+        for idx, ts, t1 in ((1, 1000, 20.0), (2, 1420, 22.0), (2, 1420, 22.0))
+    ]
+
+    async def fetch_data(is_initial: bool = False):
+        api._data = [responses.pop(0)]
+        return {"devices": api._data}
+
+    api.fetch_data = fetch_data
+    coordinator = MobileAlertsCoordinator(hass, api)
+    for _ in range(3):
+        await coordinator.async_refresh()
+
+    statistics = coordinator.get_statistics(device_id, "t1")
+    assert statistics["samples"] == 2
+    assert statistics["mean"] == 21.0
+    assert statistics["min"] == 20.0
+    assert statistics["max"] == 22.0
+
+
+async def test_refresh_derives_rain(hass: HomeAssistant, mock_api_response):
+    """Test that the rain flip counter is turned into rain rate and totals."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = mock_api_response["devices"][0]
+    device_id = device["deviceid"]
+    api._device_ids = [device_id]
+    now = int(dt_util.utcnow().timestamp())
+    responses = [
+        {**device, "measurement": {"idx": idx, "ts": ts, "rf": rf}}
+        for idx, ts, rf in ((1, now - 420, 100), (2, now, 102))
+    ]
+
+    async def fetch_data(is_initial: bool = False):
+        api._data = [responses.pop(0)]
+        return {"devices": api._data}
+
+    api.fetch_data = fetch_data
+    coordinator = MobileAlertsCoordinator(hass, api)
+    for _ in range(2):
+        await coordinator.async_refresh()
+
+    rain = coordinator.get_rain(device_id)
+    assert rain["rate"] == pytest.approx(2 * 0.258 * 3600 / 420, abs=0.01)
+    assert coordinator._snapshot_data()["rain"][device_id]["flips"] == 102
+
+
+async def test_refresh_derives_wind(hass: HomeAssistant, mock_api_response):
+    """Test that each new measurement is added to the wind statistics."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = mock_api_response["devices"][0]
+    device_id = device["deviceid"]
+    api._device_ids = [device_id]
+    now = int(dt_util.utcnow().timestamp())
+    responses = [
+        {**device, "measurement": {"idx": idx, "ts": ts, "ws": ws, "wg": wg, "wd": 8}}
+        for idx, ts, ws, wg in ((1, now - 360, 2.0, 5.0), (2, now, 4.0, 7.5))
+    ]
+
+    async def fetch_data(is_initial: bool = False):
+        api._data = [responses.pop(0)]
+        return {"devices": api._data}
+
+    api.fetch_data = fetch_data
+    coordinator = MobileAlertsCoordinator(hass, api)
+    assert coordinator.get_wind(device_id) is None
+    for _ in range(2):
+        await coordinator.async_refresh()
+
+    wind = coordinator.get_wind(device_id)
+    assert wind["direction_mean"] == 180.0
+    assert wind["speed_mean_short"] == 3.0
+    assert wind["gust_peak"] == 7.5
+    assert wind["gust_peak_time"] == now
+
+
+async def test_seed_device_without_api_call(hass: HomeAssistant, mock_api_response):
+    """Test that a record handed over by the config flow is served as is."""
+    api = MobileAlertsApi(phone_id="123456789")
+    api._post_api_request = AsyncMock()
+    coordinator = MobileAlertsCoordinator(hass, api)
+    device = mock_api_response["devices"][0]
+
+    coordinator.seed_device(device)
+
+    api._post_api_request.assert_not_awaited()
+    assert coordinator.get_reading(device["deviceid"]) is device
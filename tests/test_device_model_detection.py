@@ -1,8 +1,14 @@
 """Tests for device model detection with real-world measurement data."""
 
+from itertools import combinations
+from typing import Any
+
 from custom_components.mobile_alerts.device import (
     find_all_matching_models,
+    find_device_models,
+    find_models_by_device_id,
     DEVICE_MODELS,
+    TYPE_ID_MODELS,
 )
 
 
@@ -304,3 +310,150 @@ class TestDeviceModelDetection:
             assert isinstance(model_info["display_name"], str)
             assert isinstance(model_info["measurement_keys"], set)
             assert isinstance(model_info["description"], str)
+
+
+def reference_find_all_matching_models(
+    measurement: dict[str, Any] | None,
+) -> list[tuple[str, dict[str, Any]]]:
+    """Linear scan detection (implementation before the compiled detector)."""
+    if not measurement:
+        return []
+    keys = set(measurement.keys())
+    for key in ("idx", "ts", "c", "lb"):
+        keys.discard(key)
+    alert_suffixes = [
+        "hi",
+        "lo",
+        "hise",
+        "lose",
+        "hiee",
+        "loee",
+        "his",
+        "los",
+        "aactive",
+        "as",
+        "active",
+        "st",
+    ]
+    keys = {k for k in keys if not any(k.endswith(s) for s in alert_suffixes)}
+    if not keys:
+        return []
+
+    exact_matches = [
+        (model_id, model_info)
+        for model_id, model_info in DEVICE_MODELS.items()
+        if keys == model_info["measurement_keys"]
+    ]
+    if exact_matches:
+        return exact_matches
+
+    best_score = 0
+    subset_matches: list[tuple[str, dict[str, Any]]] = []
+    for model_id, model_info in DEVICE_MODELS.items():
+        if model_info["measurement_keys"].issubset(keys):
+            score = len(model_info["measurement_keys"])
+            if score > best_score:
+                best_score = score
+                subset_matches = [(model_id, model_info)]
+            elif score == best_score:
+                subset_matches.append((model_id, model_info))
+    return subset_matches
+
+
+def _sample_measurements() -> list[dict[str, Any]]:
+    """Return measurements covering exact, subset, alert and unknown keys."""
+    all_keys = sorted(
+        set().union(*(info["measurement_keys"] for info in DEVICE_MODELS.values()))
+        | {"t3", "xyz", "t1hi", "h2lo", "wsst"}
+    )
+    samples = []
+    for size in range(1, 4):
+        for keys in combinations(all_keys, size):
+            samples.append({key: 1 for key in keys} | {"idx": 1, "ts": 2, "c": 3})
+    for model_info in DEVICE_MODELS.values():
+        model_keys = model_info["measurement_keys"]
+        samples.append({key: 1 for key in model_keys} | {"t1hi": False, "lb": False})
+        samples.append({key: 1 for key in model_keys} | {"xyz": 1})
+    return samples
+
+
+class TestCompiledModelDetector:
+    """Test the compiled detector against the linear scan."""
+
+    def test_same_candidates_as_linear_scan(self):
+        """Test that the compiled detector returns the same ranked candidates."""
+        for measurement in _sample_measurements():
+            assert find_all_matching_models(
+                measurement
+            ) == reference_find_all_matching_models(measurement), measurement
+
+    def test_device_models_same_as_linear_scan(self):
+        """Test find_device_models against the type ID table and linear scan."""
+        samples = [
+            (measurement, reference_find_all_matching_models(measurement))
+            for measurement in _sample_measurements()
+        ]
+        device_ids = [f"{type_id}1234567890" for type_id in TYPE_ID_MODELS]
+        device_ids.append("FF1234567890")  # Unknown type ID
+        for device_id in device_ids:
+            candidates = find_models_by_device_id(device_id)
+            candidate_ids = {model_id for model_id, _ in candidates}
+            # A single candidate does not depend on the measurement
+            checked = samples[:10] if len(candidates) == 1 else samples
+            for measurement, matches in checked:
+                if len(candidates) == 1:
+                    expected = candidates
+                elif candidates:
+                    narrowed = [match for match in matches if match[0] in candidate_ids]
+                    expected = narrowed or candidates
+                else:
+                    expected = matches
+                assert find_device_models(device_id, measurement) == expected, (
+                    device_id,
+                    measurement,
+                )
+
+
+class TestTypeIdDetection:
+    """Test model detection from the type ID prefix of the device ID."""
+
+    def test_type_id_models_exist(self):
+        """Test that all models of the type ID table are known models."""
+        for type_id, model_ids in TYPE_ID_MODELS.items():
+            assert len(type_id) == 2
+            for model_id in model_ids:
+                assert model_id in DEVICE_MODELS, f"{type_id}: {model_id}"
+
+    def test_unique_type_id_needs_no_measurement(self):
+        """Test that a unique type ID resolves the model without data."""
+        result = find_device_models("0b002fa7c3d3", None)
+        assert [model_id for model_id, _ in result] == ["MA10660"]
+
+    def test_type_id_resolves_same_keys(self):
+        """Test that MA10300 and MA10350 are told apart by the type ID."""
+        measurement = {"t1": 22.5, "t2": 1, "h": 55, "idx": 1, "ts": 2, "c": 3}
+        assert len(find_all_matching_models(measurement)) == 2
+        assert [m for m, _ in find_device_models("04AAAAAAAAAA", measurement)] == [
+            "MA10350"
+        ]
+        assert [m for m, _ in find_device_models("09AAAAAAAAAA", measurement)] == [
+            "MA10300"
+        ]
+
+    def test_ambiguous_type_id_narrowed_by_keys(self):
+        """Test that shared type IDs are narrowed down with the keys."""
+        measurement = {"t1": 22.5, "t2": 18.3, "h1": 55}
+        result = find_device_models("06AAAAAAAAAA", measurement)
+        assert [model_id for model_id, _ in result] == ["MA10700"]
+
+        # Without data all candidates of the type ID are offered
+        result = find_device_models("06AAAAAAAAAA", None)
+        assert [model_id for model_id, _ in result] == ["MA10300", "MA10700"]
+
+    def test_unknown_type_id_falls_back_to_keys(self):
+        """Test that unknown type IDs use measurement key matching."""
+        assert find_models_by_device_id("17AAAAAAAAAA") == []
+        measurement = {"w": True}
+        assert find_device_models("17AAAAAAAAAA", measurement) == (
+            find_all_matching_models(measurement)
+        )
@@ -0,0 +1,38 @@
+"""Tests for Mobile Alerts diagnostics."""
+
+import pytest
+from homeassistant.const import CONF_DEVICE_ID, CONF_NAME
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.mobile_alerts.api import MobileAlertsApi
+from custom_components.mobile_alerts.const import CONF_PHONE_ID, DOMAIN
+from custom_components.mobile_alerts.coordinator import MobileAlertsCoordinator
+from custom_components.mobile_alerts.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+@pytest.mark.asyncio
+async def test_diagnostics_contain_raw_data(
+    hass: HomeAssistant, fake_device_ids, mock_api_response
+):
+    """Test that diagnostics expose the raw record and redact the phone ID."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_DEVICE_ID: fake_device_ids[0],
+            CONF_NAME: "Outside",
+            CONF_PHONE_ID: "123456789",
+        },
+    )
+    api = MobileAlertsApi(phone_id="123456789")
+    api._device_ids = [fake_device_ids[0]]
+    api._data = mock_api_response["devices"]
+    coordinator = MobileAlertsCoordinator(hass, api)
+    hass.data[DOMAIN] = {"coordinators_by_entry": {entry.entry_id: coordinator}}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][CONF_PHONE_ID] == "**REDACTED**"
+    assert diagnostics["raw_data"] == mock_api_response["devices"][0]
+    assert diagnostics["quota"]["devices"] == {fake_device_ids[0]: 3}
@@ -0,0 +1,107 @@
+"""Tests for the Mobile Alerts fetch executor."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.mobile_alerts.coordinator import MobileAlertsCoordinator
+from custom_components.mobile_alerts.executor import FetchExecutor
+
+
+@pytest.mark.asyncio
+async def test_caps_concurrent_fetches():
+    """Test that no more than max_concurrent fetches run at the same time."""
+    executor = FetchExecutor(max_concurrent=2, stagger_seconds=0)
+    running = 0
+    peak = 0
+
+    async def fetch() -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "ok"
+
+    results = await asyncio.gather(
+        *(executor.run(f"phone{i}", fetch) for i in range(5))
+    )
+
+    assert results == ["ok"] * 5
+    assert peak == 2
+    assert executor.as_dict()["fetches"] == 5
+
+
+@pytest.mark.asyncio
+async def test_staggers_fetch_starts():
+    """Test that fetches triggered together start stagger_seconds apart."""
+    loop = asyncio.get_running_loop()
+    executor = FetchExecutor(stagger_seconds=0.05, clock=loop.time)
+    starts: list[float] = []
+
+    async def fetch() -> None:
+        starts.append(loop.time())
+
+    await asyncio.gather(*(executor.run(f"phone{i}", fetch) for i in range(3)))
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.045 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_reports_failures_and_latency():
+    """Test the aggregate and per phone_id statistics."""
+    executor = FetchExecutor(stagger_seconds=0)
+
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    await executor.run("phone1", AsyncMock(return_value={}))
+    with pytest.raises(RuntimeError):
+        await executor.run("phone2", fail)
+
+    stats = executor.as_dict()
+    assert stats["fetches"] == 2
+    assert stats["failures"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["avg_latency"] is not None
+    assert stats["by_name"]["phone1"]["failures"] == 0
+    assert stats["by_name"]["phone2"]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_through_executor(hass, mock_api_response):
+    """Test that a coordinator with an executor fetches through it."""
+    api = MagicMock()
+    api.phone_id = "123456789"
+    api.fetch_data = AsyncMock(return_value=mock_api_response)
+    api.measurement_stamps = MagicMock(return_value={})
+    api.snapshot = MagicMock(return_value=[])
+    executor = FetchExecutor(stagger_seconds=0)
+    coordinator = MobileAlertsCoordinator(hass, api, executor=executor)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    api.fetch_data.assert_awaited_once_with(is_initial=True)
+    assert executor.as_dict()["by_name"]["123456789"]["fetches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_statistics():
+    """Test that closing the session keeps the statistics and quota tracker."""
+    executor = FetchExecutor(stagger_seconds=0)
+    session = executor.session
+    limiter = executor.rate_limiter
+    await executor.run("phone1", AsyncMock(return_value={}))
+
+    await executor.async_close()
+
+    assert session.closed
+    assert not executor.has_session
+    assert executor.rate_limiter is limiter
+    assert executor.as_dict()["fetches"] == 1
+    new_session = executor.session
+    assert new_session is not session
+    await executor.async_close()
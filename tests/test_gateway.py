@@ -0,0 +1,242 @@
+"""Tests for the Mobile Alerts local gateway receiver."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp.test_utils import make_mocked_request
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import voluptuous as vol
+
+from custom_components.mobile_alerts import GATEWAY_SCHEMA
+from custom_components.mobile_alerts.api import MobileAlertsApi
+from custom_components.mobile_alerts.const import DOMAIN, GATEWAY_URL
+from custom_components.mobile_alerts.coordinator import MobileAlertsCoordinator
+from custom_components.mobile_alerts.gateway import (
+    GatewayPacketError,
+    GatewayReceiver,
+    async_setup_gateway,
+    decode_packet,
+)
+
+from tests.gateway_client import (
+    GATEWAY_ID,
+    FakeGateway,
+    encode_packet,
+    encode_temperature,
+)
+
+GATEWAY_HOST = "192.168.1.20"
+
+
+class _ViewClient:
+    """Client that calls the view handler with a mocked request."""
+
+    def __init__(self, view, remote=GATEWAY_HOST):
+        """Initialize the client."""
+        self._view = view
+        self._transport = MagicMock()
+        self._transport.get_extra_info.return_value = (remote, 51234)
+
+    async def put(self, url, data, headers):
+        """Send a PUT request to the view."""
+        request = make_mocked_request(
+            "PUT", url, headers=headers, transport=self._transport
+        )
+        request.read = AsyncMock(return_value=data)
+        return await self._view.put(request)
+
+
+def test_decode_packet():
+    """Test decoding a thermo-hygrometer packet into an API device record."""
+    packet = encode_packet(
+        "031234567890", 517, [encode_temperature(-3.4), 56], timestamp=1700000000
+    )
+
+    assert decode_packet(packet, received=1700000002) == {
+        "deviceid": "031234567890",
+        "measurement": {
+            "ts": 1700000000,
+            "c": 1700000002,
+            "t1": -3.4,
+            "h": 56,
+        },
+    }
+    # Cable sensor not connected
+    packet = encode_packet("061234567890", 1, [encode_temperature(20.0), 0x2000, 40])
+    assert decode_packet(packet, received=0)["measurement"]["t2"] == 43530
+
+
+def test_decode_invalid_packets():
+    """Test truncated, corrupt and unsupported packets."""
+    packet = encode_packet("021234567890", 1, [encode_temperature(20.0)])
+    with pytest.raises(GatewayPacketError):
+        decode_packet(packet[:40], received=0)
+    corrupt = bytearray(packet)
+    corrupt[14] ^= 0x01
+    with pytest.raises(GatewayPacketError):
+        decode_packet(bytes(corrupt), received=0)
+    # Anemometer packets are left to the cloud API
+    assert decode_packet(encode_packet("0B1234567890", 1, [0, 0, 0]), 0) is None
+
+    receiver = GatewayReceiver(
+        MagicMock(), {GATEWAY_ID: GATEWAY_HOST}, clock=lambda: 1000.0
+    )
+    records, valid = receiver.decode_upload(
+        packet + bytes(corrupt) + encode_packet("0B1234567890", 1, [0, 0, 0])
+    )
+    assert [record["deviceid"] for record in records] == ["021234567890"]
+    assert valid == 2
+    stats = receiver.as_dict()
+    assert stats["packets"] == 3
+    assert stats["invalid_packets"] == 1
+    assert stats["unsupported_packets"] == 1
+
+
+async def test_push_updates_coordinator_and_skips_poll(
+    hass: HomeAssistant, mock_api_response
+):
+    """Test that pushed records update entities and replace the cloud poll."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = {**mock_api_response["devices"][1], "deviceid": "031234567890"}
+    api._device_ids = ["031234567890"]
+    api._data = [device]
+    api.fetch_data = AsyncMock(return_value={"devices": [device]})
+    coordinator = MobileAlertsCoordinator(hass, api)
+    listener = MagicMock()
+    unsubscribe = coordinator.async_add_listener(listener)
+
+    record = decode_packet(
+        encode_packet("031234567890", 9, [encode_temperature(23.5), 48]), 1700000000
+    )
+    assert not coordinator.async_push_records(
+        [{**record, "deviceid": "021234567890"}]
+    )
+    assert coordinator.async_push_records([record])
+
+    listener.assert_called_once()
+    assert coordinator.get_measurement("031234567890").t1 == 23.5
+    reading = coordinator.get_reading("031234567890")
+    assert reading["measurement"]["h"] == 48
+    # Keys that the packet does not contain are kept
+    assert reading["measurement"]["b"] == device["measurement"]["b"]
+
+    await coordinator.async_refresh()
+    api.fetch_data.assert_not_called()
+    unsubscribe()
+
+
+async def test_push_keys_records_on_ts(hass: HomeAssistant, mock_api_response):
+    """Test that the wrapping transmission counter does not replace the idx."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = {
+        **mock_api_response["devices"][1],
+        "deviceid": "031234567890",
+        "measurement": {"idx": 4711, "ts": 1700000000, "t1": 20.0, "h": 50},
+    }
+    api._device_ids = ["031234567890"]
+    api._data = [device]
+    coordinator = MobileAlertsCoordinator(hass, api)
+
+    def push(tx_counter, timestamp, t1):
+        packet = encode_packet(
+            "031234567890", tx_counter, [encode_temperature(t1), 50], timestamp
+        )
+        return coordinator.async_push_records([decode_packet(packet, timestamp)])
+
+    assert push(0xFFFF, 1700000060, 21.0)
+    assert push(0, 1700000120, 22.0)  # The counter wrapped
+    # A replayed or late packet is ignored, whatever its counter
+    assert not push(1, 1700000090, 30.0)
+
+    measurement = coordinator.get_measurement("031234567890")
+    assert (measurement.idx, measurement.ts, measurement.t1) == (4711, 1700000120, 22.0)
+    assert coordinator.get_statistics("031234567890", "t1")["samples"] == 2
+
+
+async def test_gateway_view(hass: HomeAssistant):
+    """Test an upload of the stand-in gateway through the HTTP endpoint."""
+    hass.http = MagicMock()
+    receiver = async_setup_gateway(
+        hass,
+        GATEWAY_SCHEMA(
+            {"gateways": [{"id": GATEWAY_ID.lower(), "host": GATEWAY_HOST}]}
+        ),
+    )
+    view = hass.http.register_view.call_args.args[0]
+    assert view.url == GATEWAY_URL
+    assert not view.requires_auth
+    assert not receiver.forward
+    coordinator = MagicMock()
+    hass.data[DOMAIN]["coordinators"] = {"123456789": coordinator}
+
+    packet = encode_packet("031234567890", 3, [encode_temperature(None), 50])
+    response = await FakeGateway().upload(_ViewClient(view), GATEWAY_URL, [packet])
+
+    assert response.status == 200
+    records = coordinator.async_push_records.call_args.args[0]
+    assert records[0]["measurement"]["t1"] == 43530
+    assert receiver.as_dict()["uploads"] == 1
+
+
+async def test_gateway_view_rejects_unknown_gateways(hass: HomeAssistant):
+    """Test the allowlist and that only valid uploads are forwarded."""
+    hass.http = MagicMock()
+    receiver = async_setup_gateway(
+        hass,
+        GATEWAY_SCHEMA(
+            {"forward": True, "gateways": [{"id": GATEWAY_ID, "host": GATEWAY_HOST}]}
+        ),
+    )
+    view = hass.http.register_view.call_args.args[0]
+    receiver.async_forward = AsyncMock(return_value=None)
+    coordinator = MagicMock()
+    hass.data[DOMAIN]["coordinators"] = {"123456789": coordinator}
+    packet = encode_packet("031234567890", 3, [encode_temperature(20.0), 50])
+
+    for client, gateway in (
+        (_ViewClient(view, remote="10.0.0.99"), FakeGateway()),
+        (_ViewClient(view), FakeGateway("001D8C0EFFFF")),
+    ):
+        response = await gateway.upload(client, GATEWAY_URL, [packet])
+        assert response.status == 403
+    coordinator.async_push_records.assert_not_called()
+    receiver.async_forward.assert_not_called()
+    assert receiver.as_dict()["rejected_uploads"] == 2
+
+    response = await FakeGateway().upload(
+        _ViewClient(view), GATEWAY_URL, [b"\x00" * 64]
+    )
+    assert response.status == 200
+    receiver.async_forward.assert_not_called()
+    await FakeGateway().upload(_ViewClient(view), GATEWAY_URL, [packet])
+    receiver.async_forward.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "gateway_config",
+    [
+        {},
+        {"gateways": []},
+        {"gateways": [{"id": GATEWAY_ID}]},
+        {"gateways": [{"id": "gateway", "host": GATEWAY_HOST}]},
+        {"gateways": [{"id": GATEWAY_ID, "host": "gateway.local"}]},
+        {"gateways": [{"id": GATEWAY_ID, "host": GATEWAY_HOST}], "forward": "yes!"},
+    ],
+)
+def test_gateway_schema_rejects_incomplete_config(gateway_config):
+    """Test that the receiver cannot be configured without a valid allowlist."""
+    with pytest.raises(vol.Invalid):
+        GATEWAY_SCHEMA(gateway_config)
+
+
+async def test_invalid_gateway_config_fails_setup(hass: HomeAssistant):
+    """Test that an invalid gateway config fails the setup of the component."""
+    hass.http = MagicMock()
+
+    assert not await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {"gateway": {"gateways": []}}}
+    )
+    hass.http.register_view.assert_not_called()
+    with pytest.raises(ValueError):
+        GatewayReceiver(hass, {})
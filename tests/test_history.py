@@ -0,0 +1,65 @@
+"""Tests for the Mobile Alerts measurement history."""
+
+import pytest
+
+from custom_components.mobile_alerts.history import (
+    STAT_MAX,
+    STAT_MEAN,
+    STAT_MIN,
+    STAT_SAMPLES,
+    STAT_TREND,
+    HistoryStore,
+    RingBuffer,
+)
+from custom_components.mobile_alerts.measurement import Measurement
+
+
+def _measurement(idx, ts, **values):
+    """Return a decoded measurement."""
+    return Measurement.from_record(
+        {"deviceid": "0B1234567890", "measurement": {"idx": idx, "ts": ts, **values}}
+    )
+
+
+def test_ring_buffer_overwrites_oldest_samples():
+    """Test that the buffer keeps the newest samples only."""
+    buffer = RingBuffer(capacity=3)
+    for i in range(5):
+        buffer.append(1000.0 + i * 60, float(i))
+
+    assert len(buffer) == 3
+    assert buffer.samples() == [(1120.0, 2.0), (1180.0, 3.0), (1240.0, 4.0)]
+    statistics = buffer.statistics()
+    assert statistics[STAT_MEAN] == 3.0
+    assert statistics[STAT_MIN] == 2.0
+    assert statistics[STAT_MAX] == 4.0
+    assert statistics[STAT_SAMPLES] == 3
+
+
+def test_trend_per_hour():
+    """Test the least squares trend of the samples."""
+    buffer = RingBuffer(capacity=10)
+    assert buffer.statistics()[STAT_TREND] is None
+
+    buffer.append(0.0, 20.0)
+    assert buffer.statistics()[STAT_TREND] is None
+    # +0.5 per 15 minutes
+    for i in range(1, 5):
+        buffer.append(i * 900.0, 20.0 + i * 0.5)
+
+    assert buffer.statistics()[STAT_TREND] == pytest.approx(2.0)
+
+
+def test_history_records_new_measurements_only():
+    """Test that a measurement is recorded once per idx."""
+    history = HistoryStore(capacity=10)
+
+    assert history.observe("0B1234567890", _measurement(1, 1000, t1=20.0, h=50))
+    assert not history.observe("0B1234567890", _measurement(1, 1000, t1=20.0, h=50))
+    assert history.observe("0B1234567890", _measurement(2, 1420, t1=22.0, h=43530))
+
+    assert history.sample_count("0B1234567890", "t1") == 2
+    # The not connected value is not recorded
+    assert history.sample_count("0B1234567890", "h") == 1
+    assert history.statistics("0B1234567890", "t1")[STAT_MEAN] == 21.0
+    assert history.statistics("0B1234567890", "t2") is None
@@ -0,0 +1,115 @@
+"""Tests for the typed Mobile Alerts measurement records."""
+
+from datetime import datetime, timezone
+
+from custom_components.mobile_alerts.measurement import (
+    NOT_CONNECTED,
+    OUT_OF_RANGE,
+    Measurement,
+)
+
+
+def test_decode_typed_fields():
+    """Test that values are decoded into typed fields once."""
+    measurement = Measurement.from_record(
+        {
+            "deviceid": "0B1234567890",
+            "measurement": {
+                "idx": 143866,
+                "ts": 1761498841,
+                "c": 1761498849,
+                "t1": "19.1",
+                "h": 61,
+                "rf": 12.0,
+                "wd": "3",
+                "ws": 2,
+                "w": "true",
+                "kp1c": 5,
+                "lowbattery": "false",
+                "t1hi": False,
+            },
+        }
+    )
+
+    assert measurement.device_id == "0B1234567890"
+    assert measurement.idx == 143866
+    assert measurement.ts == 1761498841
+    assert measurement.c == 1761498849
+    assert measurement.last_seen == datetime.fromtimestamp(
+        1761498849, tz=timezone.utc
+    )
+    assert measurement.t1 == 19.1
+    assert isinstance(measurement.h, float)
+    assert measurement.rf == 12 and isinstance(measurement.rf, int)
+    assert measurement.wd == 3
+    assert measurement.ws == 2.0
+    assert measurement.w is True
+    assert measurement.kp1c == 5
+    assert measurement.low_battery is False
+    # Keys the device did not report
+    assert measurement.t2 is None
+    assert measurement.get("ap") is None
+    assert measurement.get("t1hi") is None
+
+
+def test_decode_special_values():
+    """Test that 43530 and 65295 are decoded into explicit states."""
+    measurement = Measurement.from_record(
+        {
+            "deviceid": "0B1234567890",
+            "measurement": {"idx": 43530, "t1": 43530, "t2": 65295.0, "h": "43530"},
+        }
+    )
+
+    assert measurement.t1 is NOT_CONNECTED
+    assert measurement.t2 is OUT_OF_RANGE
+    assert measurement.h is NOT_CONNECTED
+    # Only measured values are special, idx is a plain counter
+    assert measurement.idx == 43530
+
+
+def test_counters_are_not_special():
+    """Test that counters reaching 43530 or 65295 pass through unchanged."""
+    measurement = Measurement.from_record(
+        {
+            "deviceid": "081234567890",
+            "measurement": {"rf": 43530, "kp1c": 65295, "ppm": 43530, "r": 65295.0},
+        }
+    )
+
+    assert measurement.rf == 43530
+    assert measurement.kp1c == 65295
+    assert measurement.ppm == 43530
+    assert measurement.r == 65295.0
+
+
+def test_decode_invalid_values():
+    """Test that invalid values are decoded as missing."""
+    measurement = Measurement.from_record(
+        {
+            "deviceid": "0B1234567890",
+            "measurement": {"t1": "n/a", "c": "yesterday", "h": None},
+        }
+    )
+
+    assert measurement.t1 is None
+    assert measurement.c is None
+    assert measurement.last_seen is None
+    assert measurement.h is None
+
+
+def test_decode_iso_timestamp():
+    """Test that an ISO last seen timestamp is decoded as UTC."""
+    measurement = Measurement.from_record(
+        {"deviceid": "0B1234567890", "measurement": {"c": "2025-10-26T17:14:09"}}
+    )
+
+    assert measurement.last_seen == datetime(
+        2025, 10, 26, 17, 14, 9, tzinfo=timezone.utc
+    )
+
+
+def test_record_without_measurement():
+    """Test that a record without measurement is not decoded."""
+    assert Measurement.from_record(None) is None
+    assert Measurement.from_record({"deviceid": "0B1234567890"}) is None
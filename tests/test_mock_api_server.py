@@ -0,0 +1,128 @@
+"""Tests for the scale mode and the fault profiles of the mock API server."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp.test_utils import make_mocked_request
+import pytest
+
+from custom_components.mobile_alerts.api import decode_json
+from custom_components.mobile_alerts.device import TYPE_ID_MODELS
+
+from tests.mock_api_server import FaultInjector, MockAPIServer, SyntheticFleet
+
+
+class _Clock:
+    """Settable time source."""
+
+    def __init__(self, now: float) -> None:
+        """Initialize the clock."""
+        self.now = now
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_fleet_advances_only_due_devices():
+    """Test that uploads advance idx/ts/c and invalidate the cached response."""
+    clock = _Clock(1700000000.0)
+    fleet = SyntheticFleet(100, upload_interval=100.0, clock=clock)
+    device_ids = ",".join(fleet.records)
+    assert {device_id[:2] for device_id in fleet.records} == set(TYPE_ID_MODELS)
+
+    body = fleet.response(device_ids)
+    assert fleet.response(device_ids) is body
+    before = json.loads(body)["devices"]
+    assert len(before) == 100
+
+    clock.now += 10.5  # The last 10 devices of the staggered fleet upload
+    after = json.loads(fleet.response(device_ids))["devices"]
+    changed = [
+        new["deviceid"]
+        for old, new in zip(before, after)
+        if new["measurement"]["idx"] == old["measurement"]["idx"] + 1
+    ]
+    assert changed == list(fleet.records)[90:]
+    last = after[-1]["measurement"]
+    assert last["ts"] == 1700000001 and last["c"] == 1700000004
+
+
+def test_fleet_response_parsed_by_client():
+    """Test that the client decodes the pre-serialized responses."""
+    fleet = SyntheticFleet(len(TYPE_ID_MODELS) * 3, seed=1)
+    device_ids = ",".join(list(fleet.records) + ["0A0000000000"])
+
+    data = decode_json(fleet.response(device_ids))
+
+    assert data["success"] is True
+    assert [device["deviceid"] for device in data["devices"]] == list(fleet.records)
+
+
+def test_faults_quotas():
+    """Test HTTP 429 per device and HTTP 403 per IP address like the real API."""
+    clock = _Clock(1000.0)
+    faults = FaultInjector("quota", seed=1, clock=clock)
+    known = {"A", "B"}
+
+    assert [faults.check("ip", ["A"], known) for _ in range(3)] == [None] * 3
+    assert faults.check("ip", ["A", "B"], known).status == 429
+    assert faults.check("ip", ["B"], known) is None
+    clock.now += 60
+    assert faults.check("ip", ["A"], known).status == 429  # Still blocked
+    clock.now += 7 * 60
+    assert faults.check("ip", ["A"], known) is None
+
+    # Discovery requests (phone ID, no device IDs) are valid
+    discovery = [faults.check("ip", [], known, "123456789") for _ in range(6)]
+    assert discovery == [None] * 6
+    assert [faults.check("ip", ["X"], known) for _ in range(5)] == [None] * 5
+    assert faults.check("ip", None, known).status == 403
+    assert faults.check("ip", ["B"], known).status == 403
+    assert faults.check("other", ["B"], known) is None
+
+
+def test_faults_errors():
+    """Test errorcode responses and malformed JSON."""
+    faults = FaultInjector(seed=1)
+    assert faults.check("ip", ["A"], {"A"}) is None
+    assert faults.corrupt(b"{}") == b"{}"
+
+    faults.configure({"error_rate": 1.0, "error_codes": [7], "malformed_rate": 1.0})
+    response = faults.check("ip", ["A"], {"A"})
+    assert json.loads(response.body) == {
+        "success": False,
+        "errorcode": 7,
+        "errormessage": "Injected error 7",
+    }
+    with pytest.raises(ValueError):
+        decode_json(faults.corrupt(response.body))
+    with pytest.raises(ValueError):
+        faults.configure({"timeout": 1})
+
+
+async def test_control_endpoint():
+    """Test switching the fault profile at runtime."""
+    server = MockAPIServer(faults=FaultInjector(seed=1))
+
+    async def post(handler, payload):
+        request = make_mocked_request("POST", "/", transport=MagicMock())
+        request.read = AsyncMock(return_value=json.dumps(payload).encode())
+        return await handler(request)
+
+    response = await post(server.handle_faults, {"profile": "nope"})
+    assert response.status == 400
+    response = await post(server.handle_faults, {"profile": "quota"})
+    assert json.loads(response.body)["faults"]["rate_limit"] is True
+
+    request = {"deviceids": "107EEEB46F00"}
+    for _ in range(3):
+        response = await post(server.handle_lastmeasurement, request)
+        data = decode_json(response.body)
+        assert data["devices"][0]["deviceid"] == "107EEEB46F00"
+    response = await post(server.handle_lastmeasurement, request)
+    assert response.status == 429
+
+    await post(server.handle_faults, {"profile": "none"})
+    response = await post(server.handle_lastmeasurement, request)
+    assert response.status == 200
@@ -0,0 +1,70 @@
+"""Tests for the Mobile Alerts rain engine."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.mobile_alerts.const import RAIN_MM_PER_FLIP
+from custom_components.mobile_alerts.measurement import NOT_CONNECTED
+from custom_components.mobile_alerts.rain import RainEngine, RainTracker
+
+# 2024-06-01 10:00:00 UTC
+HOUR = datetime(2024, 6, 1, 10, tzinfo=timezone.utc).timestamp()
+
+
+def test_rate_and_totals_from_flip_deltas():
+    """Test the rain rate and totals of successive counter values."""
+    tracker = RainTracker(timezone.utc)
+    tracker.update(100, HOUR + 60)
+    assert tracker.values(HOUR + 60) == {"rate": None, "hour": None, "today": None}
+
+    tracker.update(110, HOUR + 60 + 420)
+    values = tracker.values(HOUR + 600)
+    assert values["rate"] == pytest.approx(10 * RAIN_MM_PER_FLIP * 3600 / 420, abs=0.01)
+    assert values["hour"] == pytest.approx(2.58)
+    assert values["today"] == pytest.approx(2.58)
+
+    # No rain: the rate drops to 0, the totals are kept
+    tracker.update(110, HOUR + 900)
+    assert tracker.values(HOUR + 900) == {"rate": 0.0, "hour": 2.58, "today": 2.58}
+    # Without a new measurement the next hour has no rain yet
+    assert tracker.values(HOUR + 3700)["hour"] == 0.0
+    assert tracker.values(HOUR + 3700)["today"] == 2.58
+
+
+def test_counter_reset():
+    """Test that a counter that went down counts the flips since the reset."""
+    tracker = RainTracker(timezone.utc)
+    tracker.update(500, HOUR)
+    tracker.update(4, HOUR + 420)
+
+    assert tracker.values(HOUR + 420)["hour"] == pytest.approx(4 * RAIN_MM_PER_FLIP)
+
+
+def test_missed_polls_are_prorated_across_the_hour():
+    """Test that a gap crossing the start of the hour only adds its share."""
+    tracker = RainTracker(timezone.utc)
+    tracker.update(0, HOUR - 1800)
+    tracker.update(20, HOUR + 1800)
+
+    values = tracker.values(HOUR + 1800)
+    assert values["rate"] == pytest.approx(20 * RAIN_MM_PER_FLIP)
+    assert values["hour"] == pytest.approx(10 * RAIN_MM_PER_FLIP)
+    assert values["today"] == pytest.approx(20 * RAIN_MM_PER_FLIP)
+
+
+def test_engine_skips_invalid_values_and_restores_state():
+    """Test the engine state per device."""
+    engine = RainEngine(timezone.utc)
+    engine.observe("0B1234567890", NOT_CONNECTED, int(HOUR))
+    assert engine.values("0B1234567890", HOUR) is None
+
+    engine.observe("0B1234567890", 10, int(HOUR))
+    engine.observe("0B1234567890", 12, int(HOUR) + 420)
+
+    restored = RainEngine(timezone.utc)
+    restored.restore(engine.as_dict())
+    assert restored.values("0B1234567890", HOUR + 420) == engine.values(
+        "0B1234567890", HOUR + 420
+    )
+    assert restored.values("0B1234567890", HOUR + 420)["hour"] == pytest.approx(0.516)
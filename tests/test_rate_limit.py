@@ -0,0 +1,103 @@
+"""Tests for the Mobile Alerts API rate limiter."""
+
+from custom_components.mobile_alerts.rate_limit import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Initialize the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_three_calls_per_minute_per_device():
+    """Test that a device gets at most 3 calls within one minute."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    for _ in range(3):
+        assert limiter.delay_for(["A1B2C3D4E5F6"]) == 0
+        limiter.acquire(["A1B2C3D4E5F6"])
+        clock.now += 10
+
+    assert limiter.tokens_left("A1B2C3D4E5F6") == 0
+    # Oldest call was at t=1000, so the next one is allowed at t=1060
+    assert limiter.delay_for(["A1B2C3D4E5F6"]) == 30
+
+    clock.now += 30
+    assert limiter.delay_for(["A1B2C3D4E5F6"]) == 0
+    assert limiter.tokens_left("A1B2C3D4E5F6") == 1
+
+
+def test_delay_uses_most_limited_device():
+    """Test that a batch request waits for the most limited device."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    limiter.acquire(["A1B2C3D4E5F6", "B2C3D4E5F6A7"])
+    limiter.acquire(["A1B2C3D4E5F6"])
+    clock.now += 20
+    limiter.acquire(["A1B2C3D4E5F6"])
+
+    assert limiter.delay_for(["B2C3D4E5F6A7"]) == 0
+    assert limiter.delay_for(["A1B2C3D4E5F6", "B2C3D4E5F6A7"]) == 40
+
+
+def test_invalid_call_budget():
+    """Test that invalid calls are counted within the 15 minute window."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    for _ in range(5):
+        limiter.record_invalid_call()
+    assert limiter.invalid_calls_left() == 0
+
+    clock.now += 15 * 60
+    assert limiter.invalid_calls_left() == 5
+
+
+def test_invalid_call_budget_only_for_unverified_devices():
+    """Test that the budget guards unverified devices until the oldest call expires."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.mark_verified(["A1B2C3D4E5F6"])
+
+    assert not limiter.needs_invalid_call_budget(["A1B2C3D4E5F6"])
+    assert limiter.needs_invalid_call_budget(["A1B2C3D4E5F6", "B2C3D4E5F6A7"])
+
+    for _ in range(5):
+        limiter.record_invalid_call()
+        clock.now += 60
+    assert limiter.invalid_budget_resets_in() == 10 * 60
+
+
+def test_as_dict():
+    """Test the quota report."""
+    limiter = RateLimiter(clock=FakeClock())
+    limiter.acquire(["A1B2C3D4E5F6"])
+
+    assert limiter.as_dict(["A1B2C3D4E5F6", "B2C3D4E5F6A7"]) == {
+        "invalid_calls_left": 5,
+        "ip_blocked_for": 0,
+        "devices": {"A1B2C3D4E5F6": 2, "B2C3D4E5F6A7": 3},
+    }
+
+
+def test_server_blocks():
+    """Test that devices and the IP address can be marked as blocked."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    limiter.block_devices(["A1B2C3D4E5F6"], 420)
+    assert limiter.tokens_left("A1B2C3D4E5F6") == 0
+    assert limiter.delay_for(["A1B2C3D4E5F6", "B2C3D4E5F6A7"]) == 420
+
+    limiter.block_ip(900)
+    clock.now += 420
+    assert limiter.delay_for(["A1B2C3D4E5F6"]) == 0
+    assert limiter.ip_blocked_for() == 480
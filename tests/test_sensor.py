@@ -1,12 +1,14 @@
 """Tests for Mobile Alerts sensor entities."""
 
 import pytest
-from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import CONF_DEVICE_ID, CONF_NAME, CONF_TYPE, PERCENTAGE
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
+import homeassistant.util.dt as dt_util
 
 from custom_components.mobile_alerts.sensor import (
     MobileAlertsCoordinator,
@@ -15,8 +17,19 @@ from custom_components.mobile_alerts.sensor import (
     MobileAlertsBatterySensor,
     MobileAlertsLastSeenSensor,
 )
-from custom_components.mobile_alerts.api import MobileAlertsApi
-from custom_components.mobile_alerts.const import DOMAIN
+from custom_components.mobile_alerts.sensor_classes import (
+    rain_sensors,
+    statistic_sensors,
+    wind_sensors,
+)
+from custom_components.mobile_alerts.api import ApiRateLimitedError, MobileAlertsApi
+from custom_components.mobile_alerts.measurement import Measurement
+from custom_components.mobile_alerts.const import (
+    ATTRIBUTES_FULL,
+    ATTRIBUTES_NONE,
+    CONF_ATTRIBUTES,
+    DOMAIN,
+)
 
 
 @pytest.fixture
@@ -24,9 +37,20 @@ def mock_coordinator():
     """Create a mock coordinator for testing."""
     mock_coord = MagicMock(spec=MobileAlertsCoordinator)
     mock_coord.get_reading = MagicMock()
+    mock_coord.is_stale = False
+    _decode_readings(mock_coord)
     return mock_coord
 
 
+def _decode_readings(mock_coord):
+    """Decode the measurement of the mocked reading like the API client does."""
+    mock_coord.get_measurement = MagicMock(
+        side_effect=lambda device_id: Measurement.from_record(
+            mock_coord.get_reading(device_id)
+        )
+    )
+
+
 @pytest.fixture
 def sample_device():
     """Create a sample device configuration."""
@@ -307,6 +331,7 @@ async def test_mobile_alerts_api_initialization():
 async def test_temperature_sensor_value_validation(sample_device_info):
     """Test temperature sensor value validation."""
     mock_coordinator = MagicMock()
+    _decode_readings(mock_coordinator)
     mock_coordinator.get_reading.return_value = {
         "deviceid": "A1B2C3D4E5F6",
         "measurement": {"t1": 23.5, "ts": 1699000000},
@@ -335,6 +360,7 @@ async def test_temperature_sensor_value_validation(sample_device_info):
 async def test_humidity_sensor_value_validation(sample_device_info):
     """Test humidity sensor value validation."""
     mock_coordinator = MagicMock()
+    _decode_readings(mock_coordinator)
     mock_coordinator.get_reading.return_value = {
         "deviceid": "A1B2C3D4E5F6",
         "measurement": {"h": 65.5, "ts": 1699000000},
@@ -357,3 +383,251 @@ async def test_humidity_sensor_value_validation(sample_device_info):
 
     sensor._attr_native_value = -10  # Too low
     assert sensor.native_value is None
+
+
+ALERT_READING = {
+    "deviceid": "A1B2C3D4E5F6",
+    "lastseen": 1761498849,
+    "lowbattery": False,
+    "measurement": {
+        "idx": 143866,
+        "ts": 1761498841,
+        "c": 1761498849,
+        "t1": 19.1,
+        "t1hi": False,
+        "t1lo": True,
+        "h": 61.0,
+        "hhi": False,
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_compact_state_attributes(
+    mock_coordinator, sample_device, sample_device_info
+):
+    """Test that entities only expose their own fields by default."""
+    mock_coordinator.get_reading.return_value = ALERT_READING
+
+    sensor = MobileAlertsTemperatureSensor(
+        mock_coordinator, sample_device, sample_device_info
+    )
+
+    assert sensor._attr_extra_state_attributes == {
+        "deviceid": "A1B2C3D4E5F6",
+        "idx": 143866,
+        "ts": 1761498841,
+        "t1hi": False,
+        "t1lo": True,
+    }
+
+
+@pytest.mark.asyncio
+async def test_state_attribute_policies(
+    mock_coordinator, sample_device, sample_device_info
+):
+    """Test the none and full state attribute policies."""
+    mock_coordinator.get_reading.return_value = ALERT_READING
+
+    sensor = MobileAlertsTemperatureSensor(
+        mock_coordinator,
+        {**sample_device, CONF_ATTRIBUTES: ATTRIBUTES_NONE},
+        sample_device_info,
+    )
+    assert sensor._attr_extra_state_attributes == {}
+
+    sensor = MobileAlertsTemperatureSensor(
+        mock_coordinator,
+        {**sample_device, CONF_ATTRIBUTES: ATTRIBUTES_FULL},
+        sample_device_info,
+    )
+    assert sensor._attr_extra_state_attributes == ALERT_READING
+
+
+@pytest.mark.asyncio
+async def test_stale_data_is_marked(
+    hass: HomeAssistant, mock_api_response, sample_device_info
+):
+    """Test that entities show the stale attribute while the API is blocked."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = mock_api_response["devices"][0]
+    api._device_ids = [device["deviceid"]]
+    api._data = [device]
+    api.fetch_data = AsyncMock(return_value={"devices": [device]})
+    coordinator = MobileAlertsCoordinator(hass, api)
+    await coordinator.async_refresh()
+    sensor = MobileAlertsTemperatureSensor(
+        coordinator,
+        {CONF_DEVICE_ID: device["deviceid"], CONF_NAME: "Test", CONF_TYPE: "t1"},
+        sample_device_info,
+    )
+    sensor.hass = hass
+    sensor.entity_id = "sensor.test_temperature"
+    unsubscribe = coordinator.async_add_listener(sensor._handle_coordinator_update)
+    assert "stale" not in sensor.extra_state_attributes
+
+    api.fetch_data.side_effect = ApiRateLimitedError("HTTP 429", 420)
+    await coordinator.async_refresh()
+    assert sensor.extra_state_attributes["stale"] is True
+    assert hass.states.get("sensor.test_temperature").attributes["stale"] is True
+
+    coordinator._backoff_until = None
+    api.fetch_data.side_effect = None
+    await coordinator.async_refresh()
+    assert "stale" not in sensor.extra_state_attributes
+    unsubscribe()
+
+
+@pytest.mark.asyncio
+async def test_not_connected_value_has_no_state(
+    mock_coordinator, sample_device, sample_device_info
+):
+    """Test that a not connected sensor reports no value but stays available."""
+    mock_coordinator.get_reading.return_value = {
+        "deviceid": "A1B2C3D4E5F6",
+        "measurement": {"idx": 1, "ts": 1699000000, "t1": 43530},
+    }
+
+    sensor = MobileAlertsTemperatureSensor(
+        mock_coordinator, sample_device, sample_device_info
+    )
+
+    assert sensor.native_value is None
+    assert sensor._attr_available
+
+
+@pytest.mark.asyncio
+async def test_statistic_sensors(mock_coordinator, sample_device, sample_device_info):
+    """Test the optional rolling statistic sensors of a measurement."""
+    mock_coordinator.get_reading.return_value = ALERT_READING
+    mock_coordinator.get_statistics = MagicMock(
+        return_value={
+            "mean": 19.456,
+            "min": 18.0,
+            "max": 21.0,
+            "trend": 0.5,
+            "samples": 12,
+        }
+    )
+
+    sensors = statistic_sensors(mock_coordinator, sample_device, sample_device_info)
+
+    assert [sensor.unique_id for sensor in sensors] == [
+        "A1B2C3D4E5F6t1_mean",
+        "A1B2C3D4E5F6t1_min",
+        "A1B2C3D4E5F6t1_max",
+        "A1B2C3D4E5F6t1_trend",
+    ]
+    assert not sensors[0].entity_registry_enabled_default
+    assert sensors[0].native_value == 19.46
+    assert sensors[0].native_unit_of_measurement == "°C"
+    assert sensors[0]._attr_extra_state_attributes == {"samples": 12}
+    assert sensors[3].native_value == 0.5
+    assert sensors[3].native_unit_of_measurement == "°C/h"
+    mock_coordinator.get_statistics.assert_called_with("A1B2C3D4E5F6", "t1")
+
+    # Keys without a history have no statistic sensors
+    assert not statistic_sensors(
+        mock_coordinator, {**sample_device, CONF_TYPE: "rf"}, sample_device_info
+    )
+
+
+async def test_rain_sensors(mock_coordinator, sample_device, sample_device_info):
+    """Test the rain rate and totals derived from the rain flip counter."""
+    mock_coordinator.get_rain = MagicMock(
+        return_value={"rate": 1.2, "hour": 0.516, "today": 3.354}
+    )
+    device = {**sample_device, CONF_TYPE: "rf"}
+
+    sensors = rain_sensors(mock_coordinator, device, sample_device_info)
+
+    assert [sensor.unique_id for sensor in sensors] == [
+        "A1B2C3D4E5F6rain_rate",
+        "A1B2C3D4E5F6rain_hour",
+        "A1B2C3D4E5F6rain_today",
+    ]
+    assert [sensor.native_value for sensor in sensors] == [1.2, 0.516, 3.354]
+    assert sensors[0].native_unit_of_measurement == "mm/h"
+    assert sensors[2].native_unit_of_measurement == "mm"
+    assert sensors[2].entity_description.state_class == "total_increasing"
+
+    # No counter reported yet
+    mock_coordinator.get_rain.return_value = None
+    sensors[0].extract_reading()
+    assert not sensors[0]._attr_available
+    # Only the rain flow measurement has derived rain sensors
+    assert not rain_sensors(mock_coordinator, sample_device, sample_device_info)
+
+
+async def test_rain_today_rolls_over_at_midnight(
+    hass: HomeAssistant, freezer, mock_api_response, sample_device_info
+):
+    """Test that rain today drops to 0 at midnight without a new measurement."""
+    api = MobileAlertsApi(phone_id="123456789")
+    device = mock_api_response["devices"][0]
+    device_id = device["deviceid"]
+    api._device_ids = [device_id]
+    evening = datetime(2024, 6, 1, 23, 50, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    freezer.move_to(evening)
+    now = int(evening.timestamp())
+    responses = [
+        {**device, "measurement": {"idx": idx, "ts": ts, "rf": rf}}
+        for idx, ts, rf in ((1, now - 420, 100), (2, now, 110))
+    ]
+    response = responses[0]
+
+    async def fetch_data(is_initial: bool = False):
+        api._data = [response]
+        return {"devices": api._data}
+
+    api.fetch_data = fetch_data
+    coordinator = MobileAlertsCoordinator(hass, api)
+    await coordinator.async_refresh()
+    sensor = rain_sensors(
+        coordinator,
+        {CONF_DEVICE_ID: device_id, CONF_NAME: "Rain", CONF_TYPE: "rf"},
+        sample_device_info,
+    )[2]
+    sensor.hass = hass
+    sensor.entity_id = "sensor.rain_today"
+    unsubscribe = coordinator.async_add_listener(sensor._handle_coordinator_update)
+
+    response = responses[1]
+    await coordinator.async_refresh()
+    assert hass.states.get("sensor.rain_today").state == "2.58"
+
+    # The sensor stops reporting: the same measurement after midnight
+    freezer.move_to(evening + timedelta(minutes=20))
+    await coordinator.async_refresh()
+    assert not coordinator.device_changed(device_id)
+    assert sensor.native_value == 0.0
+    assert hass.states.get("sensor.rain_today").state == "0.0"
+    unsubscribe()
+
+
+async def test_wind_sensors(mock_coordinator, sample_device, sample_device_info):
+    """Test the wind statistic sensors of the wind speed entity."""
+    mock_coordinator.get_wind = MagicMock(
+        return_value={
+            "direction_mean": 87.3,
+            "direction_steadiness": 92,
+            "speed_mean_short": 3.1,
+            "speed_mean_long": 2.4,
+            "gust_peak": 9.2,
+            "gust_peak_time": 1700000000,
+        }
+    )
+    device = {**sample_device, CONF_TYPE: "ws"}
+
+    sensors = wind_sensors(mock_coordinator, device, sample_device_info)
+
+    assert [sensor.native_value for sensor in sensors] == [87.3, 92, 3.1, 2.4, 9.2]
+    assert sensors[0].unique_id == "A1B2C3D4E5F6wind_direction_mean"
+    assert sensors[0].native_unit_of_measurement == "°"
+    assert sensors[1].native_unit_of_measurement == PERCENTAGE
+    assert sensors[4].native_unit_of_measurement == "m/s"
+    assert sensors[4]._attr_extra_state_attributes == {
+        "time": "2023-11-14T22:13:20+00:00"
+    }
+    # Only the wind speed measurement has wind statistic sensors
+    assert not wind_sensors(mock_coordinator, sample_device, sample_device_info)
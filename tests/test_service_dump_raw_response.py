@@ -221,3 +221,30 @@ async def test_dump_raw_response_has_timestamp(
     # Try to parse as ISO format
     parsed = datetime.fromisoformat(response["timestamp"])
     assert parsed is not None
+
+
+@pytest.mark.asyncio
+async def test_dump_raw_response_refreshes_shared_coordinator_once(
+    hass: HomeAssistant, mock_coordinator
+):
+    """Test that entries sharing a coordinator trigger a single refresh."""
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN]["coordinators_by_entry"] = {
+        f"entry_{index}": mock_coordinator for index in range(40)
+    }
+
+    from custom_components.mobile_alerts import _register_services
+
+    await _register_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "dump_raw_response",
+        {},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["entries_count"] == 40
+    assert response["data"]["entry_39"] == mock_coordinator.data
+    mock_coordinator.async_request_refresh.assert_called_once()
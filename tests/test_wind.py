@@ -0,0 +1,117 @@
+"""Tests for the Mobile Alerts wind engine."""
+
+import pytest
+
+from custom_components.mobile_alerts.measurement import Measurement
+from custom_components.mobile_alerts.wind import PeakWindow, WindEngine, WindWindow
+
+
+def _measurement(ts, **values):
+    """Return a decoded measurement."""
+    return Measurement.from_record(
+        {"deviceid": "0B1234567890", "measurement": {"idx": ts, "ts": ts, **values}}
+    )
+
+
+def test_vector_mean_direction_across_north():
+    """Test that directions around north average to north, not south."""
+    window = WindWindow(600)
+    window.add(0, 2.0, 337.5)
+    window.add(60, 2.0, 22.5)
+
+    direction, steadiness = window.mean_direction()
+    assert min(direction, 360 - direction) == pytest.approx(0.0, abs=1e-6)
+    assert steadiness == pytest.approx(0.924, abs=0.001)
+    assert window.mean_speed() == 2.0
+
+    # Opposite directions with the same speed cancel out
+    window = WindWindow(600)
+    window.add(0, 3.0, 90.0)
+    window.add(60, 3.0, 270.0)
+    assert window.mean_direction() == (None, pytest.approx(0.0, abs=1e-9))
+
+
+def test_window_evicts_old_samples():
+    """Test the sliding window and the sample cap."""
+    window = WindWindow(600, capacity=3)
+    for i, speed in enumerate((10.0, 1.0, 2.0, 3.0)):
+        window.add(i * 60, speed, None)
+    # Capped at 3 samples
+    assert len(window) == 3
+    assert window.mean_speed() == 2.0
+    assert window.mean_direction() == (None, None)
+
+    window.add(800, 6.0, None)
+    # The other samples are older than 600 s
+    assert len(window) == 1
+    assert window.mean_speed() == 6.0
+
+
+def test_peak_gust_window():
+    """Test the peak gust and its time over the window."""
+    peaks = PeakWindow(3600)
+    assert peaks.peak() is None
+    peaks.add(0, 5.0)
+    peaks.add(600, 9.0)
+    peaks.add(1200, 4.0)
+    assert peaks.peak() == (600, 9.0)
+
+    peaks.add(4300, 3.0)
+    # The 9.0 gust left the window, 4.0 is the highest remaining one
+    assert peaks.peak() == (1200, 4.0)
+
+
+def test_engine_uses_new_wind_measurements_only():
+    """Test the engine per device."""
+    engine = WindEngine()
+    engine.observe("0B1234567890", _measurement(1000, t1=20.0))
+    assert engine.values("0B1234567890") is None
+
+    engine.observe("0B1234567890", _measurement(1000, ws=2.0, wg=4.0, wd=4))
+    engine.observe("0B1234567890", _measurement(1000, ws=9.0, wg=9.0, wd=4))
+    engine.observe("0B1234567890", _measurement(1420, ws=4.0, wg=43530, wd=4))
+
+    values = engine.values("0B1234567890")
+    assert values["direction_mean"] == 90.0
+    assert values["direction_steadiness"] == 100
+    assert values["speed_mean_short"] == 3.0
+    assert values["speed_mean_long"] == 3.0
+    assert values["gust_peak"] == 4.0
+    assert values["gust_peak_time"] == 1000
+
+
+def test_values_expire_without_new_measurements():
+    """Test that the windows end at the current time if it is given."""
+    engine = WindEngine()
+    engine.observe("0B1234567890", _measurement(1000, ws=2.0, wg=9.0, wd=4))
+    engine.observe("0B1234567890", _measurement(1360, ws=4.0, wg=5.0, wd=4))
+
+    # 20 minutes later: the short window keeps the last two samples
+    values = engine.values("0B1234567890", now=2560)
+    assert values["speed_mean_short"] == 3.0
+    assert values["speed_mean_long"] == 3.0
+    assert values["gust_peak"] == 9.0
+
+    # The 9.0 gust leaves the hourly window first, the 5.0 gust later
+    assert engine.values("0B1234567890", now=4700)["gust_peak"] == 5.0
+    values = engine.values("0B1234567890", now=5000)
+    assert values["gust_peak"] is None
+    assert values["speed_mean_short"] is None
+    assert values["speed_mean_long"] is None
+
+
+def test_short_window_at_upload_cadence():
+    """Test that the 10 minute mean never flaps at a 7 minute upload cadence."""
+    engine = WindEngine()
+    speeds = [float(i % 5) for i in range(20)]
+    for i, speed in enumerate(speeds):
+        timestamp = 1000 + i * 420
+        engine.observe("0B1234567890", _measurement(timestamp, ws=speed, wd=i % 16))
+        # Polled right after the upload and just before the next one
+        for now in (timestamp + 30, timestamp + 400):
+            values = engine.values("0B1234567890", now=now)
+            if i == 0:
+                assert values["speed_mean_short"] == speed
+                continue
+            assert values["speed_mean_short"] == (speeds[i - 1] + speed) / 2
+            assert values["direction_steadiness"] is not None